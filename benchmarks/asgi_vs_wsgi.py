@@ -0,0 +1,91 @@
+"""
+Сравнение пропускной способности (RPS) публичных страниц под ASGI и WSGI.
+
+Оба варианта запускаются через ``manage.py runuvicorn`` на одной и той же базе,
+нагрузка подаётся асинхронным клиентом с заданной конкурентностью:
+
+    python benchmarks/asgi_vs_wsgi.py --duration 10 --concurrency 32
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+PATHS = ['/', '/catalog/', '/news/', '/faq/']
+
+
+async def _wait_ready(base_url, timeout=20):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get(base_url + '/')
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError(f'Сервер {base_url} не поднялся за {timeout} с')
+
+
+async def _load(base_url, path, duration, concurrency):
+    done = errors = 0
+    deadline = time.monotonic() + duration
+
+    async def worker(client):
+        nonlocal done, errors
+        while time.monotonic() < deadline:
+            resp = await client.get(base_url + path)
+            if resp.status_code == 200:
+                done += 1
+            else:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+    return done / duration, errors
+
+
+def run_server(mode, port, workers):
+    args = [sys.executable, 'manage.py', 'runuvicorn', '--port', str(port), '--workers', str(workers)]
+    if mode == 'wsgi':
+        args.append('--wsgi')
+    env = dict(os.environ, TOURS_ASYNC_VIEWS='1' if mode == 'asgi' else '0')
+    return subprocess.Popen(args, cwd=BASE_DIR, env=env)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--port', type=int, default=8765)
+    opts = parser.parse_args()
+
+    results = {}
+    for mode in ('wsgi', 'asgi'):
+        server = run_server(mode, opts.port, opts.workers)
+        base_url = f'http://127.0.0.1:{opts.port}'
+        try:
+            asyncio.run(_wait_ready(base_url))
+            for path in PATHS:
+                results[mode, path] = asyncio.run(_load(base_url, path, opts.duration, opts.concurrency))
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f'{"путь":<12}{"WSGI rps":>12}{"ASGI rps":>12}{"ASGI/WSGI":>12}')
+    for path in PATHS:
+        wsgi_rps, _ = results['wsgi', path]
+        asgi_rps, _ = results['asgi', path]
+        ratio = asgi_rps / wsgi_rps if wsgi_rps else float('nan')
+        print(f'{path:<12}{wsgi_rps:>12.1f}{asgi_rps:>12.1f}{ratio:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Размер ответов публичных страниц «на проводе» для каждой кодировки.
+
+Страницы запрашиваются в процессе через тестовый клиент Django на текущей
+базе; первая колонка — HTML без вырезания пробелов в шаблонах:
+
+    python benchmarks/response_size.py
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+PATHS = ['/', '/catalog/', '/news/', '/faq/', '/about/', '/api/tours/?limit=500']
+
+
+def _body(response):
+    if response.streaming:
+        return b''.join(response.streaming_content)
+    return response.content
+
+
+def measure(client, path, encoding):
+    from django.core.cache import cache
+
+    cache.clear()
+    response = client.get(path, HTTP_ACCEPT_ENCODING=encoding)
+    return len(_body(response)), response.get('Content-Encoding', 'identity')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='*', default=PATHS)
+    opts = parser.parse_args()
+
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travel_agency.settings')
+    import django
+
+    django.setup()
+    from django.template import engines
+    from django.test import Client
+    from django.test.utils import override_settings, setup_test_environment
+
+    from tours.compression import available_encodings
+
+    setup_test_environment()
+    client = Client()
+    encodings = ['identity'] + available_encodings()
+
+    def reset_templates():
+        for loader in engines['django'].engine.template_loaders:
+            loader.reset()
+
+    with override_settings(TOURS_MINIFY_TEMPLATES=False):
+        reset_templates()
+        unminified = {path: measure(client, path, 'identity')[0] for path in opts.paths}
+    reset_templates()
+
+    print(f'{"путь":<24}{"без минификации":>17}' + ''.join(f'{name:>10}' for name in encodings))
+    for path in opts.paths:
+        sizes = []
+        for encoding in encodings:
+            size, used = measure(client, path, encoding)
+            sizes.append(f'{size:>10}' if used == encoding else f'{size:>9}*')
+        print(f'{path:<24}{unminified[path]:>17}' + ''.join(sizes))
+    print('* ответ отдан без запрошенной кодировки (меньше порога сжатия)')
+
+
+if __name__ == '__main__':
+    main()
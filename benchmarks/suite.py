@@ -0,0 +1,260 @@
+"""
+Микробенчмарки горячих мест моделей и представлений с сохраненной базовой линией.
+
+Каждый прогон поднимает отдельную тестовую базу, заполняет ее синтетическими
+данными нужного масштаба (1k, 100k или 1m путевок) и замеряет время одной
+операции (медиана повторов) и пик выделенной памяти (tracemalloc). Результат
+сравнивается с benchmarks/baseline.json; если бенчмарк медленнее или тяжелее
+базовой линии больше чем на --threshold, скрипт завершается с кодом 1:
+
+    python benchmarks/suite.py --scale 1k
+    python benchmarks/suite.py --scale 100k -k catalog
+    python benchmarks/suite.py --scale 1k --save      # перезаписать базовую линию
+
+Базовая линия зависит от машины: после смены железа ее нужно записать заново.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+BASELINE = Path(__file__).resolve().parent / 'baseline.json'
+SCALES = {'1k': 1_000, '100k': 100_000, '1m': 1_000_000}
+# разница меньше этой считается шумом
+NOISE_FLOOR = {'time_ms': 0.01, 'peak_kb': 16}
+SERVICES = ['трансфер', 'завтрак', 'экскурсии', 'страховка', 'спа', 'все включено']
+
+
+def _batched(objects, model, batch_size=5000):
+    batch = []
+    for obj in objects:
+        batch.append(obj)
+        if len(batch) == batch_size:
+            model.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        model.objects.bulk_create(batch)
+
+
+def populate(rows):
+    """Синтетические данные: rows путевок, клиентов и промокодов — по rows // 10."""
+    from django.contrib.auth.hashers import make_password
+    from django.contrib.auth.models import User
+
+    from tours.catalog_index import rebuild_catalog
+    from tours.models import ClientProfile, Country, Hotel, PromoCode, TourPackage
+
+    today = date.today()
+    clients = max(10, rows // 10)
+    countries = Country.objects.bulk_create([Country(name=f'Страна {i}') for i in range(20)])
+    hotels = Hotel.objects.bulk_create([
+        Hotel(name=f'Отель {i}', country=countries[i % 20], stars=i % 5 + 1,
+              price_per_night=Decimal(50 + i % 200))
+        for i in range(max(10, rows // 100))
+    ])
+    password = make_password(None)
+    _batched((User(username=f'client{i}', first_name=f'Имя{i}', last_name=f'Фамилия{i}', password=password)
+              for i in range(clients)), User)
+    users = list(User.objects.order_by('id').values_list('id', flat=True))
+    _batched((ClientProfile(user_id=user_id, address=f'ул. Тестовая, {i}',
+                            phone_number=f'+375 (29) {i % 1000:03d}-{i % 100:02d}-{i % 97:02d}',
+                            birth_date=date(1960 + i % 40, i % 12 + 1, i % 28 + 1))
+              for i, user_id in enumerate(users)), ClientProfile)
+    profiles = list(ClientProfile.objects.order_by('id').values_list('id', flat=True))
+    _batched((TourPackage(name=f'Тур {i}', hotel=hotels[i % len(hotels)], duration_weeks=(1, 2, 4)[i % 3],
+                          price=Decimal(300 + (i * 37) % 5000), is_hot_deal=i % 11 == 0,
+                          additional_services=', '.join(SERVICES[i % 6:i % 6 + 2]),
+                          start_date=today + timedelta(days=i % 365),
+                          end_date=today + timedelta(days=i % 365, weeks=(1, 2, 4)[i % 3]),
+                          client_id=profiles[i % len(profiles)])
+              for i in range(rows)), TourPackage)
+    rebuild_catalog(batch_size=5000)
+    _batched((PromoCode(code=f'PROMO{i}', discount=5 + i % 20, is_active=i % 3 != 0,
+                        valid_from=today - timedelta(days=i % 60), valid_until=today + timedelta(days=i % 90 - 30))
+              for i in range(max(10, rows // 10))), PromoCode)
+    return {'hotels': hotels, 'profiles': profiles, 'today': today}
+
+
+# Бенчмарк получает данные populate и возвращает (операцию без аргументов, число вызовов на повтор)
+
+def bench_tourpackage_save(data):
+    from tours.models import TourPackage
+
+    counter = iter(range(10 ** 9))
+
+    def op():
+        i = next(counter)
+        TourPackage(name=f'Новый тур {i}', hotel=data['hotels'][i % len(data['hotels'])], duration_weeks=2,
+                    price=Decimal('999.00'), start_date=data['today'], client_id=data['profiles'][0]).save()
+    return op, 50
+
+
+def bench_clientprofile_save(data):
+    from tours.models import ClientProfile
+
+    profiles = list(ClientProfile.objects.filter(pk__in=data['profiles'][:50]))
+    counter = iter(range(10 ** 9))
+
+    def op():
+        profile = profiles[next(counter) % len(profiles)]
+        profile.address = profile.address[::-1]
+        profile.save()
+    return op, 50
+
+
+def bench_promocode_is_currently_active(data):
+    from tours.models import PromoCode
+
+    # так каталог отбирает действующие промокоды: загрузка всех и проверка в Python
+    return lambda: [p for p in PromoCode.objects.all() if p.is_currently_active], 1
+
+
+def bench_validators(data):
+    from tours.models import validate_adult, validate_phone
+
+    phones = [f'+375 (29) {i % 1000:03d}-{i % 100:02d}-{i % 97:02d}' for i in range(1000)]
+    births = [date(1960 + i % 40, i % 12 + 1, i % 28 + 1) for i in range(1000)]
+
+    def op():
+        for phone, birth in zip(phones, births):
+            validate_phone(phone)
+            validate_adult(birth)
+    return op, 1
+
+
+def bench_dashboard_stats(data):
+    from django.contrib.auth.models import User
+    from django.test import RequestFactory
+
+    from tours.views.dashboards import user_dashboard
+
+    request = RequestFactory().get('/dashboard/')
+    # пользователь без профиля: страница состоит из общей статистики продаж и клиентов
+    request.user = User.objects.create_user('benchmark-staff', is_staff=True)
+    return lambda: user_dashboard(request), 1
+
+
+def bench_catalog_filter(data):
+    from django.http import QueryDict
+
+    from tours.filters import catalog_filters, filter_tours, sort_tours
+    from tours.models import CatalogEntry
+
+    queries = ['price_min=500&price_max=2000&sort_by=price', 'hotel_class=4&duration=2&is_hot=1',
+               'service=спа&sort_by=-price', f'date_from={data["today"] + timedelta(days=30)}&flex_days=3']
+    params = [QueryDict(query) for query in queries]
+
+    def op():
+        for query in params:
+            filters = catalog_filters(query)
+            tours = filter_tours(CatalogEntry.objects.all(), filters)
+            tours.count()
+            list(sort_tours(tours, filters['sort_by'])[:20])
+    return op, 1
+
+
+BENCHMARKS = {name[len('bench_'):]: func for name, func in globals().items() if name.startswith('bench_')}
+
+
+def measure(op, number, repeat):
+    """Медиана времени одного вызова (мс) и пик памяти за один повтор (КиБ)."""
+    op()  # прогрев: кэши запросов, шаблонов, соединения
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            op()
+        timings.append((time.perf_counter() - started) / number * 1000)
+    tracemalloc.start()
+    try:
+        for _ in range(number):
+            op()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'time_ms': round(statistics.median(timings), 4), 'peak_kb': round(peak / 1024, 1)}
+
+
+def compare(results, baseline, threshold):
+    """Регрессии относительно базовой линии: [(бенчмарк, метрика, было, стало), ...]."""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        for metric, value in result.items():
+            old = previous.get(metric)
+            if old is None:
+                continue
+            if value > old * (1 + threshold) and value - old > NOISE_FLOOR.get(metric, 0):
+                regressions.append((name, metric, old, value))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', choices=SCALES, default='1k')
+    parser.add_argument('-k', dest='only', default='', help='Только бенчмарки, в имени которых есть подстрока')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=0.25, help='Допустимое ухудшение, доля (0.25 = 25%%)')
+    parser.add_argument('--save', action='store_true', help='Записать результаты в базовую линию')
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    opts = parser.parse_args()
+
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travel_agency.settings')
+    import django
+
+    django.setup()
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import override_settings, setup_test_environment
+
+    setup_test_environment()
+    # отдельная база; файлы статических страниц и кэш разработчика не трогаются.
+    # Общий кэш в памяти: файловый кэш замерял бы диск, а не код
+    caches = {**settings.CACHES, 'shared': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                                            'LOCATION': 'benchmarks'}}
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        with override_settings(CACHES=caches, TOURS_PRERENDER_PAGES={}, TOURS_PROFILER_ENABLED=False):
+            started = time.perf_counter()
+            data = populate(SCALES[opts.scale])
+            print(f'Данные {opts.scale}: {time.perf_counter() - started:.1f} с')
+            results = {}
+            for name, bench in BENCHMARKS.items():
+                if opts.only in name:
+                    op, number = bench(data)
+                    results[name] = measure(op, number, opts.repeat)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    stored = json.loads(opts.baseline.read_text()) if opts.baseline.exists() else {}
+    baseline = stored.get(opts.scale, {})
+    for name, result in results.items():
+        old = baseline.get(name, {})
+        print(f"{name:<34} {result['time_ms']:>10.3f} мс (было {old.get('time_ms', '—')})"
+              f"  {result['peak_kb']:>10.1f} КиБ (было {old.get('peak_kb', '—')})")
+
+    if opts.save:
+        stored[opts.scale] = {**baseline, **results}
+        opts.baseline.write_text(json.dumps(stored, ensure_ascii=False, indent=2, sort_keys=True) + '\n')
+        print(f'Базовая линия {opts.scale} записана в {opts.baseline}')
+        return
+
+    regressions = compare(results, baseline, opts.threshold)
+    for name, metric, old, new in regressions:
+        print(f'Регрессия {name}.{metric}: {old} -> {new} (+{(new / old - 1) * 100:.0f}%)')
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Накладные расходы ограничителя частоты на один запрос (мкс).
+
+Проверка проходит через декоратор throttle с пустым представлением; кэш —
+TOURS_THROTTLE_CACHE из настроек или указанный алиас:
+
+    python benchmarks/throttling.py [--cache shared] [-n 20000]
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cache', default=None, help='Алиас кэша из CACHES')
+    parser.add_argument('-n', type=int, default=20000)
+    opts = parser.parse_args()
+
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travel_agency.settings')
+    import django
+
+    django.setup()
+    from django.conf import settings
+    from django.contrib.auth.models import AnonymousUser
+    from django.http import HttpResponse
+    from django.test import RequestFactory
+    from django.urls import ResolverMatch
+
+    from tours.throttling import throttle
+
+    if opts.cache:
+        settings.TOURS_THROTTLE_CACHE = opts.cache
+
+    def view(request):
+        return HttpResponse()
+
+    throttled = throttle(f'{opts.n * 10}/s')(view)
+    requests = []
+    for i in range(100):
+        request = RequestFactory().get('/', REMOTE_ADDR=f'10.0.0.{i}')
+        request.user = AnonymousUser()
+        request.resolver_match = ResolverMatch(view, (), {}, url_name='benchmark')
+        requests.append(request)
+
+    for timed in (view, throttled):
+        started = time.perf_counter()
+        for i in range(opts.n):
+            timed(requests[i % 100])
+        per_request = (time.perf_counter() - started) / opts.n * 1e6
+        if timed is view:
+            baseline = per_request
+    print(f"Кэш {settings.TOURS_THROTTLE_CACHE}: {per_request - baseline:.1f} мкс на запрос")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+import pytest
+from django.conf import settings
+from django.core.cache import caches
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # данные тестов откатываются без on_commit, поэтому версии в кэше не поднимаются
+    for alias in settings.CACHES:
+        caches[alias].clear()
+    yield
+    for alias in settings.CACHES:
+        caches[alias].clear()
+
+
+@pytest.fixture(autouse=True)
+def prerender_dir(settings, tmp_path):
+    # заранее построенные страницы разработчика не должны подменять ответы в тестах
+    settings.TOURS_PRERENDER_DIR = tmp_path / 'prerendered'
+    return settings.TOURS_PRERENDER_DIR
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+from tours.models import Country, Hotel, TourPackage, ClientProfile
+
+
+@pytest.fixture
+def tours():
+    user = User.objects.create_user(username="testuser", password="password")
+    client_profile = ClientProfile.objects.create(
+        user=user,
+        address="ул. Пушкина, д.1",
+        phone_number="+375 (29) 123-45-67",
+        birth_date="2000-01-01",
+    )
+    greece = Country.objects.create(name="Греция")
+    turkey = Country.objects.create(name="Турция")
+    santorini = Hotel.objects.create(name="Santorini Resort", country=greece, stars=5, price_per_night=10000)
+    antalya = Hotel.objects.create(name="Antalya Beach", country=turkey, stars=4, price_per_night=5000)
+    return [
+        TourPackage.objects.create(name=f"Тур {i}", hotel=santorini if i % 2 else antalya, duration_weeks=1,
+                                   price=1000 * (i + 1), client=client_profile)
+        for i in range(5)
+    ]
+
+
+def get_json(client, **params):
+    response = client.get(reverse('api-tours'), params)
+    return response, json.loads(b''.join(response.streaming_content)) if response.streaming else response.json()
+
+
+@pytest.mark.django_db
+def test_api_filters_and_projects_fields(client, tours):
+    response, data = get_json(client, country=tours[1].hotel.country_id, fields='name,price,country')
+    assert response.status_code == 200
+    assert data['results'] == [
+        {'name': 'Тур 1', 'price': '2000.00', 'country': 'Греция'},
+        {'name': 'Тур 3', 'price': '4000.00', 'country': 'Греция'},
+    ]
+    assert data['next_cursor'] is None
+
+
+@pytest.mark.django_db
+def test_api_cursor_pagination(client, tours):
+    seen = []
+    params = {'sort_by': '-price', 'limit': 2, 'fields': 'id'}
+    while True:
+        _, data = get_json(client, **params)
+        seen += [row['id'] for row in data['results']]
+        if not data['next_cursor']:
+            break
+        params['cursor'] = data['next_cursor']
+    assert seen == [tour.id for tour in reversed(tours)]
+
+
+@pytest.mark.django_db
+def test_api_rejects_bad_input(client):
+    assert get_json(client, fields='password')[0].status_code == 400
+    assert get_json(client, price_min='дорого')[0].status_code == 400
+    assert get_json(client, date_from='2024-02-30')[0].status_code == 400
+    assert get_json(client, cursor='!!!')[0].status_code == 400
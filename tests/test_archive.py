@@ -0,0 +1,64 @@
+import io
+from datetime import date, timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import IntegrityError
+
+from tours.models import (ArchivedOrder, ArchivedTourPackage, CatalogEntry, ClientProfile, Country, Hotel, Order,
+                          OrderHistory, TourPackage, TourPackageHistory)
+
+
+@pytest.fixture
+def history():
+    user = User.objects.create_user(username="buyer", password="password")
+    profile = ClientProfile.objects.create(user=user, address="ул. Пушкина, д.1",
+                                           phone_number="+375 (29) 123-45-67", birth_date="2000-01-01")
+    greece = Country.objects.create(name="Греция")
+    hotel = Hotel.objects.create(name="Santorini Resort", country=greece, stars=5, price_per_night=10000)
+    long_ago = date.today() - timedelta(days=800)
+    past = TourPackage.objects.create(name="Прошлый тур", hotel=hotel, duration_weeks=1, price=1000,
+                                      client=profile, start_date=long_ago)
+    upcoming = TourPackage.objects.create(name="Будущий тур", hotel=hotel, duration_weeks=1, price=2000,
+                                          client=profile, start_date=date.today() + timedelta(days=30))
+    old_order = Order.objects.create(client=user, departure_date=long_ago, total_price=1000, status='paid')
+    old_order.tour_packages.set([past])
+    new_order = Order.objects.create(client=user, departure_date=date.today(), total_price=2000)
+    new_order.tour_packages.set([upcoming])
+    return old_order, new_order, past, upcoming
+
+
+@pytest.mark.django_db
+def test_cold_rows_move_to_archive(history):
+    old_order, new_order, past, upcoming = history
+    call_command('archive_history', '--batch-size', '1', stdout=io.StringIO())
+
+    assert list(Order.objects.values_list('id', flat=True)) == [new_order.id]
+    assert list(TourPackage.objects.values_list('id', flat=True)) == [upcoming.id]
+    assert not CatalogEntry.objects.filter(package_id=past.id).exists()
+    archived = ArchivedOrder.objects.get(id=old_order.id)
+    assert archived.tour_package_ids == [past.id]
+    assert ArchivedTourPackage.objects.get(id=past.id).country_name == "Греция"
+
+
+@pytest.mark.django_db
+def test_conflicting_archive_row_stops_without_losing_data(history):
+    old_order = history[0]
+    ArchivedOrder.objects.create(id=old_order.id, client_id=old_order.client_id, tour_package_ids=[],
+                                 order_date=old_order.order_date, departure_date=old_order.departure_date,
+                                 total_price=1, status='paid')
+    with pytest.raises(IntegrityError):
+        call_command('archive_history', stdout=io.StringIO())
+    assert Order.objects.filter(id=old_order.id).exists()
+    assert ArchivedOrder.objects.get(id=old_order.id).total_price == 1
+
+
+@pytest.mark.django_db
+def test_history_views_union_hot_and_archived_rows(history):
+    old_order, new_order, past, upcoming = history
+    call_command('archive_history', stdout=io.StringIO())
+
+    assert OrderHistory.objects.count() == 2
+    assert OrderHistory.objects.get(id=old_order.id).is_archived
+    assert sorted(TourPackageHistory.objects.values_list('price', flat=True)) == [1000, 2000]
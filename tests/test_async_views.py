@@ -0,0 +1,44 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import AnonymousUser, User
+
+from tours.views import async_pages
+from tours.models import Country, Hotel, TourPackage, ClientProfile, FAQ, Article
+
+
+def call_async_view(rf, view, path, params=None):
+    request = rf.get(path, params or {})
+
+    async def auser():
+        return AnonymousUser()
+    request.auser = auser
+    return async_to_sync(view)(request)
+
+@pytest.mark.django_db
+def test_async_catalog(rf):
+    user = User.objects.create_user(username="testuser", password="password")
+    client_profile = ClientProfile.objects.create(
+        user=user,
+        address="ул. Пушкина, д.1",
+        phone_number="+375 (29) 123-45-67",
+        birth_date="2000-01-01",
+    )
+    country = Country.objects.create(name="Греция")
+    hotel = Hotel.objects.create(name="Santorini Resort", country=country, stars=5, price_per_night=10000)
+    TourPackage.objects.create(name="Греческие Каникулы", hotel=hotel, duration_weeks=2, price=200000, client=client_profile)
+    TourPackage.objects.create(name="Дешёвый тур", hotel=hotel, duration_weeks=1, price=100, client=client_profile)
+
+    response = call_async_view(rf, async_pages.tours_catalog, '/catalog/', {'price_min': '1000'})
+    content = response.content.decode()
+    assert response.status_code == 200
+    assert "Греческие Каникулы" in content
+    assert "Дешёвый тур" not in content
+
+@pytest.mark.django_db
+def test_async_content_pages(rf):
+    FAQ.objects.create(question="Что такое виза?", answer="Разрешение на въезд")
+    Article.objects.create(title="Открыт сезон", short_content="Коротко", full_content="Полностью")
+
+    assert "Что такое виза?" in call_async_view(rf, async_pages.faq_list, '/faq/').content.decode()
+    assert "Открыт сезон" in call_async_view(rf, async_pages.news_list, '/news/').content.decode()
+    assert "Открыт сезон" in call_async_view(rf, async_pages.home, '/').content.decode()
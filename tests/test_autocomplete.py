@@ -0,0 +1,76 @@
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+from tours.autocomplete import search
+from tours.forms import OrderForm
+from tours.models import ClientProfile, Country, Hotel, Order, TourPackage
+
+
+@pytest.fixture
+def data():
+    user = User.objects.create_user(username="ivanov", last_name="Иванов", first_name="Иван", password="password")
+    profile = ClientProfile.objects.create(user=user, address="ул. Пушкина, д.1",
+                                           phone_number="+375 (29) 123-45-67", birth_date="2000-01-01")
+    greece = Country.objects.create(name="Греция")
+    hotels = [Hotel.objects.create(name=name, country=greece, stars=4, price_per_night=100)
+              for name in ("Santorini Resort", "Sani Beach", "Aegean Blue")]
+    packages = [TourPackage.objects.create(name=name, hotel=hotels[0], duration_weeks=1, price=1000, client=profile)
+                for name in ("Тур в Грецию", "Греческие Каникулы")]
+    return user, hotels, packages
+
+
+@pytest.mark.django_db
+def test_search_matches_prefix_in_any_case(data, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        assert [item['text'] for item in search('hotels', 'sa')] == \
+            ['Sani Beach (Греция, 4*)', 'Santorini Resort (Греция, 4*)']
+    assert [item['text'] for item in search('users', 'иван')] == ['Иванов Иван (ivanov)']
+    assert search('packages', 'тур в')[0]['id'] == data[2][0].pk
+    assert search('hotels', 'resort') == []
+
+
+@pytest.mark.django_db
+def test_endpoint_requires_staff_and_known_source(client, data):
+    url = reverse('autocomplete', args=['hotels'])
+    assert client.get(url, {'q': 'Ae'}).status_code == 302
+    client.force_login(data[0])
+    # подсказки выдают имена и логины клиентов, обычному пользователю они недоступны
+    assert client.get(reverse('autocomplete', args=['users']), {'q': 'ив'}).status_code == 302
+    client.force_login(User.objects.create_user(username="manager", is_staff=True))
+    assert client.get(url, {'q': 'Ae'}).json() == {'results': [{'id': data[1][2].pk,
+                                                                 'text': 'Aegean Blue (Греция, 4*)'}]}
+    assert client.get(reverse('autocomplete', args=['countries']), {'q': 'Г'}).status_code == 404
+
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('name', ['client-create', 'tourpackage-create', 'order-create'])
+def test_forms_with_autocomplete_require_staff(client, data, name):
+    url = reverse(name)
+    assert client.get(url).status_code == 302
+    client.force_login(data[0])
+    assert client.get(url).status_code == 403
+    client.force_login(User.objects.create_user(username="manager", is_staff=True))
+    response = client.get(url)
+    assert response.status_code == 200 and '/autocomplete/' in response.content.decode()
+
+@pytest.mark.django_db
+def test_widgets_render_only_selected_options(data, django_assert_num_queries):
+    user, hotels, packages = data
+    form = OrderForm(initial={'client': user.pk, 'tour_packages': [packages[1].pk]})
+    with django_assert_num_queries(2):
+        html = form.as_p()
+    # клиент, пустой вариант сотрудника и выбранная путевка; остальные варианты — статусы заказа
+    assert html.count('<option') == 3 + len(Order.STATUS_CHOICES)
+    assert 'Греческие Каникулы' in html and 'Тур в Грецию' not in html
+    assert reverse('autocomplete', args=['packages']) in html
+
+
+@pytest.mark.django_db
+def test_order_form_saves_selected_packages(data):
+    user, hotels, packages = data
+    form = OrderForm({'client': user.pk, 'tour_packages': [p.pk for p in packages], 'departure_date': '2030-01-01',
+                      'total_price': '2000', 'status': 'pending'})
+    assert form.is_valid(), form.errors
+    assert set(form.save().tour_packages.all()) == set(packages)
@@ -0,0 +1,91 @@
+import io
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+
+from tours.bulk import reprice_packages
+from tours.models import BulkChange, CatalogEntry, ClientProfile, Country, Hotel, PromoCode, TourPackage
+
+
+@pytest.fixture
+def packages():
+    user = User.objects.create_user(username="testuser", password="password")
+    profile = ClientProfile.objects.create(user=user, address="ул. Пушкина, д.1",
+                                           phone_number="+375 (29) 123-45-67", birth_date="2000-01-01")
+    greece = Country.objects.create(name="Греция")
+    turkey = Country.objects.create(name="Турция")
+    santorini = Hotel.objects.create(name="Santorini Resort", country=greece, stars=5, price_per_night=10000)
+    antalya = Hotel.objects.create(name="Antalya Beach", country=turkey, stars=4, price_per_night=5000)
+    return [
+        TourPackage.objects.create(name=f"Тур {i}", hotel=santorini if i % 2 else antalya, duration_weeks=1,
+                                   price=1000, client=profile)
+        for i in range(4)
+    ]
+
+
+@pytest.mark.django_db
+def test_reprice_updates_packages_catalog_and_audit(packages, django_assert_max_num_queries):
+    greek = TourPackage.objects.filter(hotel__country__name="Греция", price__lt=1050)
+    with django_assert_max_num_queries(6):
+        assert reprice_packages(greek, '10') == 2
+
+    prices = dict(TourPackage.objects.values_list('name', 'price'))
+    assert prices == {"Тур 0": Decimal('1000'), "Тур 1": Decimal('1100'), "Тур 2": Decimal('1000'),
+                      "Тур 3": Decimal('1100')}
+    assert CatalogEntry.objects.get(package=packages[1]).price == Decimal('1100')
+    change = BulkChange.objects.get()
+    assert (change.action, change.affected, change.params) == ('reprice', 2, {'percent': '10'})
+
+
+@pytest.mark.django_db
+def test_bulk_edit_command_uses_catalog_filters(packages):
+    out = io.StringIO()
+    call_command('bulk_edit', 'hot', '--filter', f'country={packages[0].hotel.country_id}', '--dry-run', stdout=out)
+    assert 'Будет изменено записей: 2' in out.getvalue()
+
+    call_command('bulk_edit', 'hot', '--filter', f'country={packages[0].hotel.country_id}', stdout=io.StringIO())
+    assert set(CatalogEntry.objects.filter(is_hot_deal=True).values_list('package__name', flat=True)) == {
+        "Тур 0", "Тур 2"}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('args, expected', [
+    (['reprice', '10', '--filter', 'price_max=1050'], {'price': Decimal('1100'), 'is_hot_deal': True}),
+    (['hot', '--off', '--filter', 'is_hot=1'], {'price': Decimal('1000'), 'is_hot_deal': False}),
+])
+def test_bulk_edit_filter_on_changed_field(packages, settings, args, expected):
+    # фильтр по меняемому полю: после UPDATE каталога подзапрос уже не нашел бы путевки
+    settings.TOURS_BULK_BATCH_SIZE = 3
+    TourPackage.objects.update(is_hot_deal=True)
+    CatalogEntry.objects.update(is_hot_deal=True)
+    call_command('bulk_edit', *args, stdout=io.StringIO())
+
+    for model in (TourPackage, CatalogEntry):
+        assert list(model.objects.order_by().values('price', 'is_hot_deal').distinct()) == [expected]
+
+
+@pytest.mark.django_db
+def test_expired_promocodes_are_deactivated():
+    yesterday = date.today() - timedelta(days=1)
+    PromoCode.objects.create(code='OLD', discount=5, valid_from=yesterday, valid_until=yesterday)
+    PromoCode.objects.create(code='NEW', discount=5, valid_until=date.today() + timedelta(days=7))
+    call_command('bulk_edit', 'deactivate-promocodes', stdout=io.StringIO())
+    assert list(PromoCode.objects.filter(is_active=True).values_list('code', flat=True)) == ['NEW']
+
+
+@pytest.mark.django_db
+def test_admin_price_action_previews_then_applies(client, packages):
+    client.force_login(User.objects.create_superuser('admin', password='x'))
+    url = reverse('admin:tours_tourpackage_changelist')
+    data = {'action': 'change_price', '_selected_action': [packages[0].pk], 'index': '0'}
+
+    response = client.post(url, data)
+    assert 'Будет изменено путевок: <b>1</b>' in response.content.decode()
+    response = client.post(url, {**data, 'percent': '-10', 'preview': '1'})
+    assert '<td>Тур 0</td><td>1000.00</td><td>900.00</td>' in response.content.decode()
+    client.post(url, {**data, 'percent': '-10', 'apply': '1'})
+    assert TourPackage.objects.get(pk=packages[0].pk).price == Decimal('900')
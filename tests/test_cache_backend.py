@@ -0,0 +1,69 @@
+import threading
+import time
+
+from django.core.cache import cache, caches
+
+from tours.cache_backend import _Entry
+
+
+def test_l1_serves_copies_and_counts_hits():
+    cache.reset_stats()
+    cache.set('tours.test.basket', {'items': [1]})
+    cache.get('tours.test.basket')['items'].append(2)
+
+    assert cache.get('tours.test.basket') == {'items': [1]}
+    assert cache.stats()['tours.test']['l1_hits'] == 2
+
+
+def test_changes_from_other_processes_are_seen_after_l1_expiry():
+    cache.set('tours.test.rate', 1)
+    caches['shared'].set('tours.test.rate', 2)
+    assert cache.get('tours.test.rate') == 1
+
+    cache._l1.clear()
+    assert cache.get('tours.test.rate') == 2
+    assert cache.stats()['tours.test']['l2_hits'] >= 1
+
+
+def test_bypass_prefixes_skip_l1(settings):
+    from tours.response_cache import _tag_key
+
+    key = _tag_key('tours.FAQ')
+    cache.set(key, 1)
+    cache.get_many([key])
+    # другой процесс поднял версию: она видна сразу, без ожидания L1_TIMEOUT
+    caches['shared'].set(key, 2)
+    assert cache.get(key) == 2
+    assert cache.get_many([key]) == {key: 2}
+    assert settings.SESSION_CACHE_ALIAS == 'shared'
+
+
+def test_get_or_set_computes_once_under_concurrency():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+        return 42
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_set('tours.test.slow', compute, 60)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [42] * 5
+    assert len(calls) == 1
+
+
+def test_get_or_set_refreshes_early_near_expiry():
+    cache.set('tours.test.hot', _Entry('old', time.time() + 0.01, delta=10.0), 60)
+    assert cache.get('tours.test.hot') == 'old'
+    assert cache.get_or_set('tours.test.hot', lambda: 'new', 60) == 'new'
+
+    cache.set('tours.test.cold', _Entry('old', time.time() + 3600, delta=0.001), 3600)
+    assert cache.get_or_set('tours.test.cold', lambda: 'new', 3600) == 'old'
@@ -0,0 +1,49 @@
+import pytest
+from django.contrib.auth.models import User
+
+from tours.catalog_index import rebuild_catalog
+from tours.models import CatalogEntry, ClientProfile, Country, Hotel, TourPackage
+
+
+@pytest.fixture
+def package():
+    user = User.objects.create_user(username="testuser", password="password")
+    client_profile = ClientProfile.objects.create(
+        user=user,
+        address="ул. Пушкина, д.1",
+        phone_number="+375 (29) 123-45-67",
+        birth_date="2000-01-01",
+    )
+    country = Country.objects.create(name="Греция")
+    hotel = Hotel.objects.create(name="Santorini Resort", country=country, stars=5, price_per_night=10000)
+    return TourPackage.objects.create(name="Греческие Каникулы", hotel=hotel, duration_weeks=2,
+                                      price=200000, client=client_profile)
+
+
+@pytest.mark.django_db
+def test_entry_follows_package_hotel_and_country(package):
+    entry = CatalogEntry.objects.get(pk=package.pk)
+    assert (entry.name, entry.hotel_name, entry.stars, entry.country_name) == \
+        ("Греческие Каникулы", "Santorini Resort", 5, "Греция")
+
+    package.price = 150000
+    package.save()
+    package.hotel.stars = 4
+    package.hotel.save()
+    package.hotel.country.name = "Эллада"
+    package.hotel.country.save()
+
+    entry.refresh_from_db()
+    assert (entry.price, entry.stars, entry.country_name) == (150000, 4, "Эллада")
+
+    package.delete()
+    assert not CatalogEntry.objects.exists()
+
+
+@pytest.mark.django_db
+def test_rebuild_catalog_picks_up_bulk_changes(package):
+    TourPackage.objects.filter(pk=package.pk).update(is_hot_deal=True)
+    assert not CatalogEntry.objects.get(pk=package.pk).is_hot_deal
+
+    assert rebuild_catalog(batch_size=1) == 1
+    assert CatalogEntry.objects.get(pk=package.pk).is_hot_deal
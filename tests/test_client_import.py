@@ -0,0 +1,53 @@
+import io
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+
+from tours.client_import import import_clients
+from tours.models import ClientProfile, adult_birth_date_limit
+
+CSV = """username,email,first_name,last_name,address,phone_number,birth_date,password
+ivanov,ivanov@example.com,Иван,Иванов,"Минск, ул. Ленина, 1",+375 (29) 123-45-67,1990-05-01,secret123
+petrov,,Петр,Петров,Гродно,+375 (33) 765-43-21,02.03.1985,
+badphone,,,,Брест,80291234567,1990-01-01,
+child,,,,Брест,+375 (29) 111-22-33,{child},
+ivanov,,,,Минск,+375 (29) 123-45-67,1990-05-01,
+existing,,,,Минск,+375 (29) 123-45-67,1990-05-01,
+""".replace('{child}', date.today().replace(year=date.today().year - 10).isoformat())
+
+
+@pytest.mark.django_db
+def test_import_creates_valid_rows_and_reports_errors():
+    User.objects.create_user('existing')
+    errors = []
+    result = import_clients(io.StringIO(CSV), chunk_size=2, on_error=lambda line, error: errors.append((line, error)))
+
+    assert result == {'rows': 6, 'created': 2, 'skipped': 4}
+    assert [line for line, _ in errors] == [4, 5, 6, 7]
+    assert errors[0][1].startswith('phone_number')
+    profile = ClientProfile.objects.select_related('user').get(user__username='petrov')
+    assert (profile.birth_date, profile.user.last_name) == (date(1985, 3, 2), 'Петров')
+    assert not profile.user.has_usable_password()
+    ivanov = User.objects.get(username='ivanov')
+    assert ivanov.password.startswith('pbkdf2_sha256_import$') and ivanov.check_password('secret123')
+    # при входе пароль перехешируется основным хешером
+    assert User.objects.get(username='ivanov').password.startswith('pbkdf2_sha256$')
+
+
+@pytest.mark.django_db
+def test_command_dry_run_writes_error_report(tmp_path):
+    source = tmp_path / 'clients.csv'
+    source.write_text(CSV, encoding='utf-8')
+    report = tmp_path / 'errors.csv'
+    out = io.StringIO()
+    call_command('import_clients', str(source), '--dry-run', '--errors', str(report), stdout=out)
+
+    assert 'создано клиентов: 0, пропущено: 3' in out.getvalue()
+    assert report.read_text(encoding='utf-8').count('\n') == 4
+    assert not User.objects.exists()
+
+
+def test_adult_limit_on_leap_day():
+    assert adult_birth_date_limit(date(2024, 2, 29)) == date(2006, 2, 28)
@@ -0,0 +1,67 @@
+import gzip
+import json
+
+import pytest
+from django.urls import reverse
+
+from tours.compression import negotiate, pad_gzip
+from tours.models import Country, Hotel
+from tours.template_loaders import minify_template
+
+
+def test_minify_template_keeps_preformatted_text():
+    source = "<ul>\n    {% for x in items %}\n        <li>{{ x }}</li>\n    {% endfor %}\n</ul>\n<pre>  a\n   b</pre>\n"
+    assert minify_template(source) == "<ul>\n{% for x in items %}<li>{{ x }}</li>\n{% endfor %}</ul>\n<pre>  a\n   b</pre>\n"
+
+
+def test_minify_template_keeps_line_break_after_output_tags():
+    source = '{% load i18n %}\n{% if user %}\n{% translate "Войти" %}\nсейчас\n{% url "home" %}\nдалее\n{% endif %}\n'
+    assert minify_template(source) == '{% load i18n %}{% if user %}{% translate "Войти" %}\nсейчас\n{% url "home" %}\nдалее\n{% endif %}\n'
+
+
+def test_negotiate_respects_quality():
+    assert negotiate('gzip;q=0.5, br', ['br', 'gzip']) == 'br'
+    assert negotiate('gzip, br;q=0', ['br', 'gzip']) == 'gzip'
+    assert negotiate('identity', ['br', 'gzip']) is None
+
+
+@pytest.mark.django_db
+def test_catalog_is_gzipped(client):
+    greece = Country.objects.create(name="Греция")
+    for i in range(20):
+        Hotel.objects.create(name=f"Отель {i}", country=greece, stars=4, price_per_night=5000)
+    plain = client.get(reverse('tours_catalog'))
+    response = client.get(reverse('tours_catalog'), HTTP_ACCEPT_ENCODING='gzip, deflate')
+    assert response['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response['Vary']
+    assert gzip.decompress(response.content) == plain.content
+    assert len(response.content) < len(plain.content)
+
+
+@pytest.mark.django_db
+def test_small_responses_are_not_compressed(client):
+    response = client.get(reverse('faq-list'), HTTP_ACCEPT_ENCODING='gzip')
+    assert not response.has_header('Content-Encoding')
+
+
+@pytest.mark.django_db
+def test_streaming_api_is_compressed(client):
+    response = client.get(reverse('api-tours'), HTTP_ACCEPT_ENCODING='gzip')
+    assert response['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(b''.join(response.streaming_content)))['count'] == 0
+
+
+def test_gzip_padding_randomizes_length():
+    data = 'Страница с токеном '.encode() * 100
+    padded = [pad_gzip(gzip.compress(data)) for _ in range(20)]
+    assert all(gzip.decompress(body) == data for body in padded)
+    assert len({len(body) for body in padded}) > 1
+
+
+@pytest.mark.django_db
+def test_pages_with_csrf_token_are_only_gzipped_with_padding(client, settings):
+    settings.TOURS_COMPRESS_MIN_SIZE = 0
+    response = client.get(reverse('login'), HTTP_ACCEPT_ENCODING='br, zstd, gzip')
+    assert response['Content-Encoding'] == 'gzip'
+    assert response.content[3] & gzip.FNAME
+    assert b'csrfmiddlewaretoken' in gzip.decompress(response.content)
@@ -0,0 +1,72 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+from tours.filters import filter_dates
+from tours.models import Country, Hotel, TourPackage, ClientProfile
+
+
+@pytest.fixture
+def tours():
+    user = User.objects.create_user(username="testuser", password="password")
+    client_profile = ClientProfile.objects.create(
+        user=user,
+        address="ул. Пушкина, д.1",
+        phone_number="+375 (29) 123-45-67",
+        birth_date="2000-01-01",
+    )
+    country = Country.objects.create(name="Греция")
+    hotel = Hotel.objects.create(name="Santorini Resort", country=country, stars=5, price_per_night=10000)
+    starts = {'june-1': date(2025, 6, 1), 'june-10': date(2025, 6, 10), 'june-10b': date(2025, 6, 10),
+              'july-1': date(2025, 7, 1)}
+    return {
+        name: TourPackage.objects.create(name=name, hotel=hotel, duration_weeks=1, price=1000,
+                                         start_date=start, client=client_profile)
+        for name, start in starts.items()
+    }
+
+
+def names(queryset):
+    return sorted(queryset.values_list('name', flat=True))
+
+
+@pytest.mark.django_db
+def test_departure_and_flexible_search(tours):
+    qs = TourPackage.objects.all()
+    assert names(filter_dates(qs, date(2025, 6, 5), date(2025, 6, 12))) == ['june-10', 'june-10b']
+    assert names(filter_dates(qs, date(2025, 6, 4), date(2025, 6, 12), flex_days=3)) == ['june-1', 'june-10', 'june-10b']
+
+
+@pytest.mark.django_db
+def test_overlap_search(tours):
+    # тур 1-8 июня пересекается с отпуском 7-9 июня, хотя начинается раньше
+    qs = filter_dates(TourPackage.objects.all(), date(2025, 6, 7), date(2025, 6, 9), mode='overlap')
+    assert names(qs) == ['june-1']
+
+
+@pytest.mark.django_db
+def test_availability_grid_uses_one_grouped_query(client, tours, django_assert_max_num_queries):
+    url = reverse('tours-availability')
+    client.get(url, {'year': 2025, 'month': 6})
+    with django_assert_max_num_queries(1):
+        response = client.get(url, {'year': 2025, 'month': 6})
+    assert response.status_code == 200
+    cells = {cell['date']: cell['count'] for week in response.context['weeks'] for cell in week}
+    assert cells[date(2025, 6, 10)] == 2
+    assert cells[date(2025, 6, 1)] == 1
+    assert response.context['total'] == 3
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url, params, status', [
+    ('tours-availability', {'year': 9999, 'month': 12}, 400),
+    ('tours-availability', {'year': 1, 'month': 1}, 400),
+    ('tours-availability', {'country': 'abc', 'year': 2025, 'month': 6}, 200),
+    ('tours-catalog', {'date_from': '2024-02-30'}, 200),
+    ('tours-catalog', {'date_from': '2024-02-01', 'flex_days': 'x'}, 200),
+    ('tours-catalog', {'price_min': 'много', 'hotel_class': 'пять', 'duration': '1.5'}, 200),
+])
+def test_malformed_parameters_are_not_server_errors(client, tours, url, params, status):
+    assert client.get(reverse(url), params).status_code == status
@@ -0,0 +1,79 @@
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+
+from tours.exports import export_stream
+from tours.models import ClientProfile, Country, Hotel, Order, TourPackage
+
+
+@pytest.fixture
+def orders():
+    user = User.objects.create_user(username="buyer", password="password")
+    profile = ClientProfile.objects.create(user=user, address="ул. Пушкина, д.1",
+                                           phone_number="+375 (29) 123-45-67", birth_date="2000-01-01")
+    greece = Country.objects.create(name="Греция")
+    hotel = Hotel.objects.create(name="Santorini Resort", country=greece, stars=5, price_per_night=10000)
+    packages = [TourPackage.objects.create(name=f"Тур {i}", hotel=hotel, duration_weeks=1, price=1000,
+                                           client=profile) for i in range(3)]
+    result = []
+    for i in range(5):
+        order = Order.objects.create(client=user, departure_date=date(2025, 6, i + 1), total_price=1000 * (i + 1))
+        order.tour_packages.set(packages[:i % 3 + 1])
+        result.append(order)
+    return result
+
+
+def ndjson(chunks):
+    return [json.loads(line) for line in b''.join(chunks).splitlines()]
+
+
+@pytest.mark.django_db
+def test_orders_are_exported_with_packages_per_chunk(orders, django_assert_num_queries):
+    # один запрос по заказам и по одному на подгрузку путевок для каждой пачки
+    with django_assert_num_queries(4):
+        rows = ndjson(export_stream('ndjson', chunk_size=2))
+    assert [row['id'] for row in rows] == [order.id for order in orders]
+    assert rows[2]['tour_package_names'] == ["Тур 0", "Тур 1", "Тур 2"]
+    assert rows[0]['client'] == "buyer"
+
+
+@pytest.mark.django_db
+def test_export_resumes_after_id(orders):
+    rows = ndjson(export_stream('ndjson', after=orders[2].id))
+    assert [row['id'] for row in rows] == [orders[3].id, orders[4].id]
+
+
+@pytest.mark.django_db
+def test_csv_export_and_command(orders, tmp_path):
+    target = tmp_path / 'orders.csv'
+    call_command('export_sales', '--format', 'csv', '--output', str(target), stderr=io.StringIO())
+    rows = list(csv.DictReader(target.open(encoding='utf-8')))
+    assert len(rows) == 5
+    assert rows[1]['tour_package_ids'].count(';') == 1
+
+
+@pytest.mark.django_db
+def test_parquet_export(orders):
+    pq = pytest.importorskip('pyarrow.parquet')
+    table = pq.read_table(io.BytesIO(b''.join(export_stream('parquet', kind='packages'))))
+    assert table.num_rows == 3
+    assert table.column('country').to_pylist() == ["Греция"] * 3
+
+
+@pytest.mark.django_db
+def test_export_view_is_staff_only(client, orders):
+    url = reverse('sales-export')
+    client.force_login(orders[0].client)
+    assert client.get(url).status_code == 302
+
+    client.force_login(User.objects.create_user('accountant', password='x', is_staff=True))
+    response = client.get(url, {'format': 'ndjson', 'date_to': '2000-01-01'})
+    assert response['Content-Disposition'].endswith('.ndjson"')
+    assert len(ndjson(response.streaming_content)) == 0
+    assert client.get(url, {'date_from': 'вчера'}).status_code == 400
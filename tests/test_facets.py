@@ -0,0 +1,88 @@
+import pytest
+from django.contrib.auth.models import User
+from django.http import QueryDict
+
+from tours.facets import catalog_facets
+from tours.filters import catalog_filters
+from tours.models import Country, Hotel, TourPackage, ClientProfile
+
+
+@pytest.fixture
+def catalog():
+    user = User.objects.create_user(username="testuser", password="password")
+    client_profile = ClientProfile.objects.create(
+        user=user,
+        address="ул. Пушкина, д.1",
+        phone_number="+375 (29) 123-45-67",
+        birth_date="2000-01-01",
+    )
+    greece = Country.objects.create(name="Греция")
+    turkey = Country.objects.create(name="Турция")
+    santorini = Hotel.objects.create(name="Santorini Resort", country=greece, stars=5, price_per_night=10000)
+    antalya = Hotel.objects.create(name="Antalya Beach", country=turkey, stars=4, price_per_night=5000)
+    for hotel, weeks, price, hot in [
+        (santorini, 1, 40000, True),
+        (santorini, 2, 150000, False),
+        (antalya, 1, 60000, True),
+        (antalya, 4, 600000, False),
+    ]:
+        TourPackage.objects.create(name="Тур", hotel=hotel, duration_weeks=weeks, price=price,
+                                   is_hot_deal=hot, client=client_profile)
+    return greece, turkey
+
+
+@pytest.mark.django_db
+def test_facets_count_alternatives_in_one_query(catalog, django_assert_num_queries):
+    greece, turkey = catalog
+    params = QueryDict(f'country={greece.id}')
+    countries = list(Country.objects.all())
+    with django_assert_num_queries(1):
+        facets = catalog_facets(catalog_filters(params), countries, params)
+
+    assert facets['total'] == 2
+    # по стране считаются альтернативы без учёта выбранной страны
+    assert [(c['name'], c['count'], c['selected']) for c in facets['countries']] == [
+        ('Греция', 2, True), ('Турция', 2, False),
+    ]
+    assert {s['value']: s['count'] for s in facets['stars']} == {1: 0, 2: 0, 3: 0, 4: 0, 5: 2}
+    assert {d['value']: d['count'] for d in facets['durations']} == {1: 1, 2: 1, 4: 0}
+    assert facets['hot'] == 1
+    assert [b['count'] for b in facets['price']] == [1, 0, 1, 0, 0]
+    assert 'price_max=50000' in facets['price'][0]['query']
+
+
+@pytest.mark.django_db
+def test_catalog_renders_facet_counts(client, catalog):
+    response = client.get('/catalog/', {'is_hot': '1'})
+    content = response.content.decode()
+    assert 'Греция (1)' in content
+    assert 'Горящие путёвки (2)' in content
+
+
+@pytest.mark.django_db
+def test_boundary_price_counted_in_the_bucket_its_link_shows(client, catalog):
+    boundary = TourPackage.objects.get(price=600000)
+    boundary.price = 50000
+    boundary.save()
+    params = QueryDict('', mutable=True)
+    facets = catalog_facets(catalog_filters(params), list(Country.objects.all()), params)
+    for bucket in facets['price']:
+        response = client.get('/catalog/', QueryDict(bucket['query']))
+        assert response.context['tours'].count() == bucket['count']
+    assert [b['count'] for b in facets['price']] == [2, 1, 1, 0, 0]
+    assert 'price_min=50000.01' in facets['price'][1]['query']
+
+
+@pytest.mark.django_db
+def test_price_facet_counts_alternatives_with_price_selected(catalog, django_assert_num_queries):
+    params = QueryDict('price_max=50000')
+    countries = list(Country.objects.all())
+    with django_assert_num_queries(1):
+        facets = catalog_facets(catalog_filters(params), countries, params)
+
+    assert facets['total'] == 1
+    # остальные интервалы цен показывают, сколько путевок найдется при их выборе
+    assert [b['count'] for b in facets['price']] == [1, 1, 1, 0, 1]
+    # а остальные измерения считаются в выбранном диапазоне цен
+    assert [(c['name'], c['count']) for c in facets['countries']] == [('Греция', 1), ('Турция', 0)]
+    assert facets['hot'] == 1
@@ -0,0 +1,81 @@
+import io
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from tours import tasks
+from tours.jobs import claim, enqueue, job, run_job, work
+from tours.models import Job
+
+calls = []
+
+
+@job('tests.record')
+def record(value):
+    calls.append(value)
+
+
+@job('tests.broken', max_attempts=2)
+def broken():
+    raise RuntimeError('сломалось')
+
+
+@pytest.mark.django_db
+def test_enqueue_waits_for_commit_and_deduplicates(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        enqueue(record, {'value': 1}, dedup_key='record')
+        enqueue(record, {'value': 2}, dedup_key='record')
+        assert not Job.objects.exists()
+    assert list(Job.objects.values_list('payload', flat=True)) == [{'value': 1}]
+
+
+@pytest.mark.django_db
+def test_worker_runs_claimed_jobs(django_capture_on_commit_callbacks):
+    calls.clear()
+    with django_capture_on_commit_callbacks(execute=True):
+        enqueue(record, {'value': 'a'})
+        enqueue(record, {'value': 'b'})
+
+    assert work(once=True) == 2
+    assert calls == ['a', 'b']
+    assert set(Job.objects.values_list('status', flat=True)) == {Job.DONE}
+    assert claim('tests') is None
+
+
+@pytest.mark.django_db
+def test_failed_job_is_retried_with_backoff_then_failed(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        enqueue(broken)
+
+    assert not run_job(claim('tests'))
+    retried = Job.objects.get()
+    assert (retried.status, retried.attempts) == (Job.QUEUED, 1)
+    assert retried.run_after > timezone.now()
+    assert 'сломалось' in retried.last_error
+
+    assert not run_job(claim('tests', now=retried.run_after))
+    assert Job.objects.get().status == Job.FAILED
+
+
+@pytest.mark.django_db
+def test_currency_page_is_filled_by_worker(client, monkeypatch, django_capture_on_commit_callbacks):
+    monkeypatch.setattr(tasks, 'fetch_currency_rates', lambda: ({'USD': 0.011, 'EUR': 0.01}, None))
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.get(reverse('currency_external'))
+    assert 'загружаются' in response.content.decode()
+    assert Job.objects.get().name == 'refresh_currency_rates'
+
+    call_command('run_workers', '--once', '--threads', '1', stdout=io.StringIO())
+    assert '0.011' in client.get(reverse('currency_external')).content.decode()
+
+
+@pytest.mark.django_db
+def test_stale_result_is_queued_once_per_interval(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        for _ in range(5):
+            assert tasks.cached_result(tasks.WEATHER_KEY, tasks.refresh_weather) is None
+    # каждый просмотр иначе пытался бы записать задачу в таблицу
+    assert len(callbacks) == 1
+    assert Job.objects.filter(name='refresh_weather').count() == 1
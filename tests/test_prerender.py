@@ -0,0 +1,78 @@
+import gzip
+import io
+
+import pytest
+from django.core.management import call_command
+from django.urls import include, path, reverse
+
+from tours.jobs import work
+from tours.models import FAQ, Job
+from tours.prerender import render_page
+from tours.views import async_pages
+
+
+@pytest.mark.django_db
+def test_prerendered_page_bypasses_view(client, prerender_dir, django_assert_num_queries):
+    FAQ.objects.create(question="Как забронировать тур?", answer="Через сайт. " * 200)
+    call_command('prerender', 'faq-list', stdout=io.StringIO())
+    assert (prerender_dir / 'faq-list.html.gz').exists()
+    # публичная страница, а не список FAQ для редактирования на /faqs/
+    assert reverse('faq-list') == '/faq/'
+
+    with django_assert_num_queries(0):
+        response = client.get(reverse('faq-list'), HTTP_ACCEPT_ENCODING='gzip')
+        body = gzip.decompress(b''.join(response.streaming_content)).decode()
+    assert response['Content-Encoding'] == 'gzip'
+    assert response['Content-Type'] == 'text/html; charset=utf-8'
+    assert 'Content-Disposition' not in response
+    assert 'Как забронировать тур?' in body
+
+    # с query string страница строится как обычно
+    assert not client.get(reverse('faq-list'), {'page': '2'}).streaming
+
+
+@pytest.mark.django_db
+def test_model_change_discards_page_and_queues_rebuild(client, prerender_dir, django_capture_on_commit_callbacks):
+    call_command('prerender', stdout=io.StringIO())
+    assert (prerender_dir / 'about.html').exists() and (prerender_dir / 'faq-list.html').exists()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        FAQ.objects.create(question="Новый вопрос", answer="Ответ")
+    assert not (prerender_dir / 'faq-list.html').exists()
+    assert (prerender_dir / 'about.html').exists()
+    assert list(Job.objects.values_list('name', 'payload')) == [('prerender_pages', {'names': ['faq-list']})]
+
+    response = client.get(reverse('faq-list'))
+    assert not response.streaming and 'Новый вопрос' in response.content.decode()
+
+    work(once=True)
+    assert 'Новый вопрос' in (prerender_dir / 'faq-list.html').read_text(encoding='utf-8')
+
+
+
+@pytest.mark.django_db
+def test_prerendered_page_has_live_page_headers(client):
+    live = client.get(reverse('privacy-policy'))
+    call_command('prerender', 'privacy-policy', stdout=io.StringIO())
+    prerendered = client.get(reverse('privacy-policy'))
+    assert prerendered.streaming
+    # отличается только дата изменения файла
+    headers = {name: value for name, value in prerendered.headers.items() if name != 'Last-Modified'}
+    assert headers == dict(live.headers)
+    assert prerendered['X-Frame-Options'] == 'DENY'
+
+class AsyncURLConf:
+    # как при TOURS_ASYNC_VIEWS=1: те же адреса обслуживают асинхронные представления
+    urlpatterns = [
+        path('news/', async_pages.news_list, name='news-list'),
+        path('faq/', async_pages.faq_list, name='faq-list'),
+        path('', include('travel_agency.urls')),
+    ]
+
+
+@pytest.mark.django_db
+def test_async_views_are_prerendered(settings):
+    settings.ROOT_URLCONF = AsyncURLConf
+    FAQ.objects.create(question="Как забронировать тур?", answer="Через сайт.")
+    assert 'Как забронировать тур?' in render_page('faq-list').decode()
+    assert render_page('news-list')
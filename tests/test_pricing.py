@@ -0,0 +1,68 @@
+import io
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+
+from tours.models import BulkChange, CatalogEntry, ClientProfile, Country, Hotel, Order, TourPackage
+from tours.pricing import load_features, reprice
+
+
+@pytest.fixture
+def packages():
+    user = User.objects.create_user(username="buyer", password="password")
+    profile = ClientProfile.objects.create(user=user, address="ул. Пушкина, д.1",
+                                           phone_number="+375 (29) 123-45-67", birth_date="2000-01-01")
+    hotel = Hotel.objects.create(name="Hotel", country=Country.objects.create(name="Греция"), stars=3,
+                                 price_per_night=100)
+    soon = date.today() + timedelta(days=5)
+
+    def create(name, start_date):
+        return TourPackage.objects.create(name=name, hotel=hotel, duration_weeks=1, price=1000,
+                                          client=profile, start_date=start_date)
+
+    popular = create("Популярный", soon)
+    order = Order.objects.create(client=user, departure_date=soon, total_price=1000)
+    order.tour_packages.set([popular])
+    return {
+        'popular': popular,
+        'quiet': create("Без заказов", soon),
+        'undated': create("Без даты", None),
+        'started': create("Уже начался", date.today() - timedelta(days=1)),
+    }
+
+
+@pytest.mark.django_db
+def test_features_are_loaded_in_one_query(packages, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        features = load_features()
+    by_id = dict(zip(features['id'].tolist(), features['orders'].tolist()))
+    assert by_id[packages['popular'].id] == 1
+    assert features['cost'].tolist() == [700.0] * 4
+
+
+@pytest.mark.django_db
+def test_reprice_sets_prices_and_hot_deals(packages):
+    result = reprice(batch_size=2)
+
+    assert result == {'total': 4, 'changed': 3, 'hot': 1}
+    prices = dict(TourPackage.objects.values_list('name', 'price'))
+    # 700 × 1.2 наценки × спрос (1.2 у популярной, 0.9 у остальных), горящая −15%
+    assert prices == {'Популярный': Decimal('1008.00'), 'Без заказов': Decimal('642.60'),
+                      'Без даты': Decimal('756.00'), 'Уже начался': Decimal('1000.00')}
+    assert list(TourPackage.objects.filter(is_hot_deal=True).values_list('name', flat=True)) == ['Без заказов']
+    entry = CatalogEntry.objects.get(package=packages['quiet'])
+    assert entry.price == Decimal('642.60') and entry.is_hot_deal
+    assert BulkChange.objects.get().affected == 3
+
+    assert reprice()['changed'] == 0
+
+
+@pytest.mark.django_db
+def test_dry_run_command_changes_nothing(packages):
+    out = io.StringIO()
+    call_command('reprice_tours', '--dry-run', stdout=out)
+    assert 'изменится цен и флагов: 3' in out.getvalue()
+    assert not TourPackage.objects.exclude(price=1000).exists()
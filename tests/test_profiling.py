@@ -0,0 +1,92 @@
+import json
+import pstats
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.exceptions import SynchronousOnlyOperation
+from django.http import HttpResponse
+from django.urls import reverse
+from django.utils.functional import SimpleLazyObject
+
+from tours.models import Country
+from tours.profiling import ProfilerMiddleware
+
+
+@pytest.fixture
+def profile_dir(settings, tmp_path):
+    settings.TOURS_PROFILER_DIR = tmp_path / 'profiles'
+    return settings.TOURS_PROFILER_DIR
+
+
+@pytest.fixture
+def staff_client(client):
+    client.force_login(User.objects.create_user('admin', password='x', is_staff=True))
+    return client
+
+
+@pytest.mark.django_db
+def test_staff_request_is_profiled_with_sql_and_templates(staff_client, profile_dir):
+    Country.objects.create(name='Египет')
+    response = staff_client.get(reverse('country-list'), {'_profile': '1'})
+    assert response.status_code == 200
+    profile_id = response['X-Tours-Profile-Id']
+    pstats.Stats(str(profile_dir / f'{profile_id}.prof'))
+
+    report = json.loads(staff_client.get(reverse('profile-download', args=[profile_id, 'report'])).getvalue())
+    assert report['path'] == '/countries/?_profile=1' and report['user'] == 'admin'
+    country_query = next(query for query in report['queries'] if 'tours_country' in query['sql'])
+    assert any(frame.startswith('tours/') for frame in country_query['stack'])
+    assert any(name.startswith('tours/country') for name in report['templates'])
+
+    listed = staff_client.get(reverse('profile-list')).json()['profiles']
+    assert [item['id'] for item in listed] == [profile_id]
+    download = staff_client.get(reverse('profile-download', args=[profile_id, 'profile']))
+    assert download['Content-Disposition'] == f'attachment; filename="{profile_id}.prof"'
+
+
+@pytest.mark.django_db
+def test_sampling_mode_writes_speedscope(staff_client, profile_dir, settings):
+    settings.TOURS_PROFILER_INTERVAL = 0.0005
+    response = staff_client.get(reverse('country-list'), HTTP_X_TOURS_PROFILE='sample')
+    data = json.loads((profile_dir / f"{response['X-Tours-Profile-Id']}.speedscope.json").read_text())
+    profile = data['profiles'][0]
+    assert profile['type'] == 'sampled' and len(profile['samples']) == len(profile['weights'])
+    assert all(index < len(data['shared']['frames']) for sample in profile['samples'] for index in sample)
+
+
+@pytest.mark.django_db
+def test_flag_ignored_for_non_staff_and_old_profiles_pruned(client, staff_client, profile_dir, settings):
+    settings.TOURS_PROFILER_KEEP = 2
+    ids = [staff_client.get(reverse('country-list'), {'_profile': '1'})['X-Tours-Profile-Id'] for _ in range(3)]
+    assert sorted({path.name.split('.')[0] for path in profile_dir.iterdir()}) == sorted(ids)[1:]
+
+    staff_client.logout()
+    User.objects.create_user('guest', password='x')
+    client.login(username='guest', password='x')
+    response = client.get(reverse('home'), {'_profile': '1'})
+    assert 'X-Tours-Profile-Id' not in response
+    assert client.get(reverse('profile-list')).status_code == 302
+
+
+def _lazy_user_in_event_loop():
+    raise SynchronousOnlyOperation('You cannot call this from an async context')
+
+
+@pytest.mark.django_db
+def test_async_request_resolves_user_with_auser(rf, profile_dir):
+    async def get_response(request):
+        return HttpResponse('ok')
+
+    staff = User.objects.create_user('admin', password='x', is_staff=True)
+    request = rf.get('/countries/', {'_profile': '1'})
+    # как при ASGI: синхронный request.user в цикле событий недоступен
+    request.user = SimpleLazyObject(_lazy_user_in_event_loop)
+
+    async def auser():
+        return staff
+    request.auser = auser
+
+    response = async_to_sync(ProfilerMiddleware(get_response))(request)
+    report = json.loads((profile_dir / f"{response['X-Tours-Profile-Id']}.json").read_text(encoding='utf-8'))
+    assert report['user'] == 'admin'
@@ -0,0 +1,51 @@
+import io
+
+import numpy as np
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+
+from tours.models import ClientProfile, Country, Hotel, SimilarTour, TourPackage
+from tours.recommendations import encode, nearest
+
+
+def test_nearest_matches_full_sort():
+    features = np.random.default_rng(0).normal(size=(50, 4)).astype(np.float32)
+    found = np.concatenate([index for _, index, _ in nearest(features, 3, block_cells=120)])
+
+    distances = ((features[:, None] - features[None]) ** 2).sum(axis=2)
+    np.fill_diagonal(distances, np.inf)
+    assert (found == np.argsort(distances, axis=1)[:, :3]).all()
+
+
+def test_services_keywords_bring_packages_closer():
+    features = encode([(1000, 4, 1, 1, 'Трансфер, экскурсии'), (1000, 4, 1, 1, 'Дайвинг'),
+                       (1000, 4, 1, 1, 'трансфер и экскурсии')])
+    _, index, _ = next(nearest(features, 1))
+    assert index[:, 0].tolist() == [2, 0, 0]
+
+
+@pytest.fixture
+def packages():
+    user = User.objects.create_user(username="buyer", password="password")
+    profile = ClientProfile.objects.create(user=user, address="ул. Пушкина, д.1",
+                                           phone_number="+375 (29) 123-45-67", birth_date="2000-01-01")
+    greece = Country.objects.create(name="Греция")
+    egypt = Country.objects.create(name="Египет")
+    hotels = [Hotel.objects.create(name=f"Hotel {stars}", country=country, stars=stars, price_per_night=100)
+              for country, stars in ((greece, 5), (greece, 4), (egypt, 3))]
+    return [TourPackage.objects.create(name=f"Тур {i}", hotel=hotel, duration_weeks=1, price=price,
+                                       client=profile)
+            for i, (hotel, price) in enumerate(zip(hotels, (2000, 1900, 500)))]
+
+
+@pytest.mark.django_db
+def test_detail_page_shows_precomputed_neighbours(client, packages, django_assert_num_queries):
+    call_command('build_similar_tours', '--count', '2', stdout=io.StringIO())
+    assert SimilarTour.objects.count() == 6
+
+    with django_assert_num_queries(2):
+        response = client.get(reverse('tourpackage-detail', args=[packages[0].pk]))
+    assert [tour.pk for tour in response.context['similar_tours']] == [packages[1].pk, packages[2].pk]
+    assert 'Похожие путевки' in response.content.decode()
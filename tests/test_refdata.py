@@ -0,0 +1,31 @@
+import pytest
+
+from tours.models import Country, Hotel, SeasonClimate
+from tours.refdata import get_reference_data
+
+
+@pytest.mark.django_db
+def test_reference_data_is_served_from_memory(django_assert_num_queries):
+    greece = Country.objects.create(name="Греция")
+    SeasonClimate.objects.create(country=greece, season='summer', climate_description="Жарко")
+    Hotel.objects.create(name="Santorini Resort", country=greece, stars=5, price_per_night=10000)
+
+    refdata = get_reference_data()
+    with django_assert_num_queries(0):
+        refdata = get_reference_data()
+    hotel = refdata.hotels_by_country[greece.id][0]
+    assert (hotel.name, hotel.country.name, hotel.stars) == ("Santorini Resort", "Греция", 5)
+    assert [c.get_season_display() for c in refdata.countries_by_id[greece.id].climates] == ['Лето']
+    with pytest.raises(AttributeError):
+        hotel.stars = 4
+
+
+@pytest.mark.django_db
+def test_reference_data_is_reloaded_after_change():
+    greece = Country.objects.create(name="Греция")
+    hotel = Hotel.objects.create(name="Santorini Resort", country=greece, stars=5, price_per_night=10000)
+    assert get_reference_data().hotels_by_id[hotel.id].stars == 5
+
+    hotel.stars = 4
+    hotel.save()
+    assert get_reference_data().hotels_by_id[hotel.id].stars == 4
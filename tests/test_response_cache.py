@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.urls import reverse
+
+from tours.models import FAQ
+from tours.response_cache import AnonymousResponseCacheMiddleware
+
+
+@pytest.mark.django_db
+def test_anonymous_page_is_served_from_cache(client, django_assert_num_queries):
+    url = reverse('faq-list')
+    first = client.get(url)
+    assert first['X-Cache'] == 'MISS'
+    assert 'Cookie' in first['Vary']
+
+    with django_assert_num_queries(0):
+        second = client.get(url)
+    assert second['X-Cache'] == 'HIT'
+    assert second.content == first.content
+
+
+@pytest.mark.django_db
+def test_query_order_and_empty_filters_share_entry(client):
+    url = reverse('tours_catalog')
+    client.get(url, {'sort_by': 'price', 'price_min': '', 'is_hot': 'on'})
+    response = client.get(url + '?is_hot=on&sort_by=price')
+    assert response['X-Cache'] == 'HIT'
+
+
+@pytest.mark.django_db
+def test_page_is_rebuilt_after_model_change(client, django_capture_on_commit_callbacks):
+    url = reverse('faq-list')
+    client.get(url)
+    with django_capture_on_commit_callbacks(execute=True):
+        FAQ.objects.create(question="Можно ли с собакой?", answer="Да")
+    response = client.get(url)
+    assert response['X-Cache'] == 'MISS'
+    assert "Можно ли с собакой?" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_session_cookie_bypasses_cache(client, django_user_model):
+    url = reverse('faq-list')
+    client.get(url)
+    client.force_login(django_user_model.objects.create_user('ivan', password='x'))
+    response = client.get(url)
+    assert 'X-Cache' not in response
+
+
+@pytest.mark.django_db
+def test_accept_encoding_variants_share_entry(client):
+    url = reverse('tours_catalog')
+    first = client.get(url, HTTP_ACCEPT_ENCODING='gzip, deflate, br')
+    second = client.get(url, HTTP_ACCEPT_ENCODING='deflate, gzip;q=0.9')
+    assert (first['X-Cache'], second['X-Cache']) == ('MISS', 'HIT')
+    assert second['Content-Encoding'] == first['Content-Encoding']
+    assert client.get(url)['X-Cache'] == 'MISS'
+
+
+def test_async_lock_wait_leaves_sync_thread_free(rf, settings):
+    settings.TOURS_RESPONSE_CACHE_WAIT = 1
+    request = rf.get('/faq/')
+
+    async def get_response(request):
+        return HttpResponse('построено заново')
+
+    middleware = AnonymousResponseCacheMiddleware(get_response)
+    key, _, locked = middleware._begin(request)
+    assert locked  # страницу строит «другой запрос»
+
+    async def scenario():
+        waiting = asyncio.ensure_future(middleware(request))
+        await asyncio.sleep(0.1)
+        # пока запрос ждет, общий поток sync_to_async свободен и другой запрос сохраняет страницу
+        await sync_to_async(cache.set)(key, (200, [], 'готово'.encode()), 60)
+        return await waiting
+
+    response = async_to_sync(scenario)()
+    assert response['X-Cache'] == 'HIT'
+    assert response.content.decode() == 'готово'
@@ -0,0 +1,36 @@
+import pytest
+from datetime import timedelta
+from django.contrib.sessions.models import Session
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tours.sessions import SessionStore, prune_expired_sessions
+
+@pytest.mark.django_db
+def test_unchanged_session_is_not_written_to_db():
+    session = SessionStore()
+    session['cart'] = [1, 2]
+    session.save()
+
+    reloaded = SessionStore(session.session_key)
+    assert reloaded['cart'] == [1, 2]
+    reloaded['cart'] = [1, 2]
+    with CaptureQueriesContext(connection) as queries:
+        reloaded.save()
+    assert len(queries) == 0
+
+    reloaded['cart'] = [3]
+    with CaptureQueriesContext(connection) as queries:
+        reloaded.save()
+    assert len(queries) > 0
+    assert SessionStore(session.session_key)['cart'] == [3]
+
+@pytest.mark.django_db
+def test_prune_expired_sessions():
+    now = timezone.now()
+    Session.objects.create(session_key='old', session_data='', expire_date=now - timedelta(days=1))
+    Session.objects.create(session_key='fresh', session_data='', expire_date=now + timedelta(days=1))
+
+    assert prune_expired_sessions(batch_size=1) == 1
+    assert list(Session.objects.values_list('session_key', flat=True)) == ['fresh']
@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+
+from tours.management.commands.startup_profile import parse_importtime
+
+
+def test_urlconf_does_not_import_heavy_dependencies():
+    # ленивые модули остаются в sys.modules как _LazyModule до первого обращения
+    code = (
+        "import sys, django; django.setup(); import tours.urls; "
+        "print(','.join(m for m in ('matplotlib', 'requests', 'pytz') "
+        "if type(sys.modules.get(m)).__name__ == 'module'))"
+    )
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE='travel_agency.settings')
+    proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                          cwd=settings.BASE_DIR, env=env)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == ''
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   encodings.aliases\n"
+        "import time:      3000 |       5000 | django.urls\n"
+    )
+    assert parse_importtime(stderr) == [('encodings.aliases', 120, 120), ('django.urls', 3000, 5000)]
@@ -0,0 +1,42 @@
+import copy
+
+import pytest
+from django.template import engines
+from django.urls import reverse
+
+from tours.checks import check_template_syntax
+from tours.templating import compile_templates, render_stats, reset_render_stats
+
+
+def test_all_project_templates_compile():
+    count, errors = compile_templates()
+    assert count > 50
+    assert errors == []
+
+
+def test_check_reports_broken_template(settings, tmp_path):
+    (tmp_path / 'broken.html').write_text('{% if %}')
+    templates = copy.deepcopy(settings.TEMPLATES)
+    templates[0]['DIRS'] = [tmp_path]
+    settings.TEMPLATES = templates
+
+    errors = check_template_syntax(None)
+    assert [error.id for error in errors] == ['tours.E001']
+    assert 'broken.html' in errors[0].msg
+
+
+@pytest.mark.django_db
+def test_render_time_is_counted_per_template(client, django_user_model):
+    reset_render_stats()
+    client.get(reverse('faq-list'))
+    stats = render_stats()
+    assert stats['tours/faq_list.html']['count'] == 1
+    # подключенные через include и extends шаблоны считаются отдельно
+    assert stats['tours/nav.html']['count'] == 1
+    assert stats['tours/faq_list.html']['total_ms'] >= stats['tours/nav.html']['total_ms']
+    engines.all()[0].from_string('{% extends "tours/nav.html" %}').render({})
+    assert render_stats()['tours/nav.html']['count'] == 2
+
+    client.force_login(django_user_model.objects.create_user('admin', password='x', is_staff=True))
+    data = client.get(reverse('runtime-metrics')).json()
+    assert 'tours/faq_list.html' in data['templates']
@@ -0,0 +1,75 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.exceptions import SynchronousOnlyOperation
+from django.http import HttpResponse
+from django.urls import reverse
+from django.utils.functional import SimpleLazyObject
+
+from tours.throttling import Bucket, client_ip, parse_rate, throttle
+
+
+def test_bucket_allows_burst_then_refills():
+    cache = caches['shared']
+    bucket = Bucket('3/m')
+    assert [bucket.consume(cache, 'bucket', 1000.0) for _ in range(3)] == [0, 0, 0]
+    assert bucket.consume(cache, 'bucket', 1000.0) == pytest.approx(20)
+    assert bucket.consume(cache, 'bucket', 1020.0) == 0
+    assert bucket.consume(cache, 'bucket', 1020.0) > 0
+
+
+def test_rates_and_forwarded_ip(rf, settings):
+    assert parse_rate('10/m') == (10, 60)
+    assert parse_rate('100/5m') == (100, 300)
+    with pytest.raises(ValueError):
+        parse_rate('10/week')
+
+    request = rf.get('/', HTTP_X_FORWARDED_FOR='1.1.1.1, 10.0.0.1', REMOTE_ADDR='10.0.0.2')
+    assert client_ip(request) == '10.0.0.2'
+    settings.TOURS_THROTTLE_PROXY_COUNT = 1
+    assert client_ip(request) == '10.0.0.1'
+
+
+@pytest.mark.django_db
+def test_view_returns_429_per_ip_and_per_user(client, settings):
+    settings.TOURS_THROTTLE_RATES = {'sales-chart': '2/m'}
+    url = reverse('sales-chart')
+    assert [client.get(url).status_code for _ in range(2)] == [200, 200]
+    response = client.get(url)
+    assert response.status_code == 429
+    assert response['Retry-After'] == '30'
+
+    # другой адрес и вошедший пользователь считаются отдельно
+    assert client.get(url, REMOTE_ADDR='10.0.0.5').status_code == 200
+    client.force_login(User.objects.create_user('buyer', password='x'))
+    assert client.get(url).status_code == 200
+
+
+def _lazy_user_in_event_loop():
+    raise SynchronousOnlyOperation('You cannot call this from an async context')
+
+
+@pytest.mark.django_db
+def test_async_view_counts_authenticated_user(rf):
+    async def view(request):
+        return HttpResponse('ok')
+
+    throttled = async_to_sync(throttle('1/m')(view))
+    users = [User.objects.create_user(username, password='x') for username in ('first', 'second')]
+
+    def request_for(user):
+        request = rf.get('/')
+        request.resolver_match = None
+        # как при ASGI: синхронный request.user в цикле событий недоступен
+        request.user = SimpleLazyObject(_lazy_user_in_event_loop)
+
+        async def auser():
+            return user
+        request.auser = auser
+        return request
+
+    assert throttled(request_for(users[0])).status_code == 200
+    assert throttled(request_for(users[0])).status_code == 429
+    # тот же адрес, но другой пользователь — своя корзина
+    assert throttled(request_for(users[1])).status_code == 200
@@ -0,0 +1,65 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.urls import get_resolver, reverse
+
+from tours import refdata, warmup
+from tours.models import Country
+
+
+@pytest.fixture(autouse=True)
+def reset_warmup():
+    warmup.reset()
+    yield
+    warmup.reset()
+
+
+@pytest.mark.django_db
+def test_readiness_only_after_warm_up(client, settings, monkeypatch):
+    Country.objects.create(name='Египет')
+    monkeypatch.setattr(refdata, '_snapshot', None)
+    settings.TOURS_WARMUP_MODULES = ['pytz']
+    url = reverse('readiness')
+    response = client.get(url)
+    assert response.status_code == 503 and response.json() == {'ready': False}
+    assert 'no-cache' in response['Cache-Control']
+
+    timings = warmup.warm_up()
+    assert list(timings) == ['urls', 'orm', 'templates', 'modules', 'connections', 'refdata']
+    assert get_resolver()._populated
+    assert connection.connection is not None
+    assert [country.name for country in refdata._snapshot.countries] == ['Египет']
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.json() == {'ready': True, 'warmup_ms': timings}
+
+
+@pytest.mark.django_db
+def test_failed_step_keeps_process_unready(monkeypatch):
+    def broken():
+        raise RuntimeError('база недоступна')
+
+    monkeypatch.setattr(warmup, 'STEPS', warmup.STEPS[:-1] + (('refdata', broken),))
+    with pytest.raises(RuntimeError):
+        warmup.warm_up()
+    assert not warmup.is_ready()
+
+
+@pytest.mark.django_db
+def test_asgi_lifespan_warms_up_before_startup_completes(monkeypatch):
+    monkeypatch.setattr(refdata, '_snapshot', None)
+    messages = iter([{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}])
+    sent = []
+
+    async def receive():
+        return next(messages)
+
+    async def send(message):
+        sent.append((message['type'], warmup.is_ready()))
+
+    async def django_application(scope, receive, send):
+        raise AssertionError('lifespan не должен доходить до Django')
+
+    async_to_sync(warmup.lifespan(django_application))({'type': 'lifespan'}, receive, send)
+    assert sent == [('lifespan.startup.complete', True), ('lifespan.shutdown.complete', True)]
@@ -1,8 +1,15 @@
+from decimal import Decimal
+
 from django.contrib import admin
+from django.contrib.admin import helpers
+from django.db.models import F
+from django.db.models.functions import Round
+from django.shortcuts import render
 from django.contrib.auth.models import User
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.forms import UserCreationForm
 from django import forms
+from .bulk import deactivate_promocodes, expired_promocodes, reprice_packages, set_hot_deal
 from .models import (
     ClientProfile,
     EmployeeProfile,
@@ -11,6 +18,10 @@ from .models import (
     Hotel,
     TourPackage,
     Order,
+    ArchivedOrder,
+    ArchivedTourPackage,
+    Job,
+    BulkChange,
     Article,
     FAQ,
     Vacancy,
@@ -79,11 +90,47 @@ class HotelAdmin(admin.ModelAdmin):
     list_filter = ('country', 'stars')
     search_fields = ('name', 'country__name')
 
+class PriceChangeForm(forms.Form):
+    percent = forms.DecimalField(label="Изменение цены, %", max_digits=6, decimal_places=2, min_value=Decimal('-99.99'))
+
 class TourPackageAdmin(admin.ModelAdmin):
     list_display = ('name', 'hotel', 'duration_weeks', 'price', 'is_hot_deal')
     list_filter = ('hotel', 'duration_weeks', 'is_hot_deal')
     search_fields = ('name', 'hotel__name')
     inlines = []
+    actions = ['change_price', 'mark_hot_deal', 'unmark_hot_deal']
+
+    @admin.action(description="Изменить цену на процент")
+    def change_price(self, request, queryset):
+        form = PriceChangeForm(request.POST if 'percent' in request.POST else None)
+        preview = []
+        if form.is_valid():
+            if 'apply' in request.POST:
+                affected = reprice_packages(queryset, form.cleaned_data['percent'], request.user)
+                self.message_user(request, f"Цена изменена у путевок: {affected}")
+                return None
+            factor = 1 + form.cleaned_data['percent'] / 100
+            preview = queryset.annotate(new_price=Round(F('price') * factor, 2)).values('name', 'price', 'new_price')[:10]
+        return render(request, 'admin/tours/tourpackage/change_price.html', {
+            **self.admin_site.each_context(request),
+            'title': "Массовое изменение цены",
+            'opts': self.model._meta,
+            'form': form,
+            'count': queryset.count(),
+            'preview': preview,
+            'selected': request.POST.getlist(helpers.ACTION_CHECKBOX_NAME),
+            'select_across': request.POST.get('select_across', '0'),
+            'index': request.POST.get('index', '0'),
+            'action_checkbox_name': helpers.ACTION_CHECKBOX_NAME,
+        })
+
+    @admin.action(description="Отметить как горящие")
+    def mark_hot_deal(self, request, queryset):
+        self.message_user(request, f"Отмечено горящими: {set_hot_deal(queryset, True, request.user)}")
+
+    @admin.action(description="Снять отметку «горящая»")
+    def unmark_hot_deal(self, request, queryset):
+        self.message_user(request, f"Снята отметка у путевок: {set_hot_deal(queryset, False, request.user)}")
 
 class OrderAdmin(admin.ModelAdmin):
     list_display = ('id', 'client', 'employee', 'order_date', 'status', 'total_price')
@@ -91,6 +138,19 @@ class OrderAdmin(admin.ModelAdmin):
     search_fields = ('client__username', 'employee__username')
     filter_horizontal = ('tour_packages',)
 
+class ArchivedOrderAdmin(admin.ModelAdmin):
+    list_display = ('id', 'client_id', 'order_date', 'status', 'total_price', 'archived_at')
+    list_filter = ('status', 'order_date')
+
+class ArchivedTourPackageAdmin(admin.ModelAdmin):
+    list_display = ('name', 'hotel_name', 'country_name', 'price', 'end_date', 'archived_at')
+    search_fields = ('name', 'hotel_name')
+
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'name', 'status', 'attempts', 'run_after', 'locked_by', 'finished_at')
+    list_filter = ('status', 'name')
+    search_fields = ('name', 'dedup_key')
+
 class ClientProfileAdmin(admin.ModelAdmin):
     list_display = ('user', 'phone_number', 'birth_date', 'address')
     search_fields = ('user__username', 'user__first_name', 'user__last_name', 'phone_number')
@@ -121,6 +181,21 @@ class PromoCodeAdmin(admin.ModelAdmin):
     list_display = ('code', 'discount', 'description', 'valid_from', 'valid_until', 'is_active')
     list_filter = ('is_active', 'valid_from', 'valid_until')
     search_fields = ('code', 'description')
+    actions = ['deactivate', 'deactivate_expired']
+
+    @admin.action(description="Деактивировать выбранные")
+    def deactivate(self, request, queryset):
+        self.message_user(request, f"Деактивировано промокодов: {deactivate_promocodes(queryset, request.user)}")
+
+    @admin.action(description="Деактивировать все просроченные")
+    def deactivate_expired(self, request, queryset):
+        affected = deactivate_promocodes(expired_promocodes(), request.user)
+        self.message_user(request, f"Деактивировано просроченных промокодов: {affected}")
+
+class BulkChangeAdmin(admin.ModelAdmin):
+    list_display = ('created_at', 'action', 'model', 'affected', 'user')
+    list_filter = ('action', 'model')
+    readonly_fields = ('action', 'model', 'params', 'criteria', 'affected', 'user', 'created_at')
 
 class AboutPageContentAdmin(admin.ModelAdmin):
     list_display = ('main_text',)
@@ -148,6 +223,10 @@ admin.site.register(SeasonClimate, SeasonClimateAdmin)
 admin.site.register(Hotel, HotelAdmin)
 admin.site.register(TourPackage, TourPackageAdmin)
 admin.site.register(Order, OrderAdmin)
+admin.site.register(ArchivedOrder, ArchivedOrderAdmin)
+admin.site.register(ArchivedTourPackage, ArchivedTourPackageAdmin)
+admin.site.register(Job, JobAdmin)
+admin.site.register(BulkChange, BulkChangeAdmin)
 admin.site.register(Article, ArticleAdmin)
 admin.site.register(FAQ, FAQAdmin)
 admin.site.register(Vacancy, VacancyAdmin)
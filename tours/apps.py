@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 
 
 class ToursConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tours'
+
+    def ready(self):
+        from . import checks, signals, tasks  # noqa: F401
+
+        if getattr(settings, 'TOURS_TEMPLATE_WARMUP', False):
+            from .templating import warm_up_templates
+
+            _, errors = warm_up_templates()
+            if errors:
+                raise ImproperlyConfigured(
+                    'Ошибки в шаблонах: ' + '; '.join(f'{name}: {exc}' for name, exc in errors))
@@ -0,0 +1,98 @@
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import ArchivedOrder, ArchivedTourPackage, Order, TourPackage
+
+logger = logging.getLogger('tours')
+
+
+def cold_orders(now=None):
+    """Отмененные заказы старше TOURS_ARCHIVE_CANCELLED_DAYS и заказы с давно прошедшей датой отправления."""
+    now = now or timezone.now()
+    cancelled_before = now - timedelta(days=getattr(settings, 'TOURS_ARCHIVE_CANCELLED_DAYS', 30))
+    departed_before = now.date() - timedelta(days=getattr(settings, 'TOURS_ARCHIVE_ORDERS_DAYS', 365))
+    return Order.objects.filter(
+        Q(status='cancelled', order_date__lt=cancelled_before) | Q(departure_date__lt=departed_before)
+    )
+
+
+def cold_tour_packages(now=None):
+    """Путевки, тур по которым давно закончился и на которые не ссылаются рабочие заказы."""
+    now = now or timezone.now()
+    ended_before = now.date() - timedelta(days=getattr(settings, 'TOURS_ARCHIVE_TOURS_DAYS', 90))
+    return TourPackage.objects.filter(end_date__lt=ended_before).exclude(orders__isnull=False)
+
+
+def _archive_batches(queryset, to_archive, archive_model, batch_size, pause):
+    moved = 0
+    while True:
+        # каждая пачка — отдельная короткая транзакция, рабочие таблицы не блокируются надолго
+        with transaction.atomic():
+            batch = list(queryset.order_by('id')[:batch_size])
+            if not batch:
+                break
+            try:
+                # строка с таким id уже в архиве — пачка откатывается, а не удаляется без копии
+                archive_model.objects.bulk_create([to_archive(obj) for obj in batch])
+            except IntegrityError:
+                logger.error(f'Архивация {queryset.model.__name__} остановлена: id из пачки '
+                             f'{batch[0].id}–{batch[-1].id} уже есть в {archive_model.__name__}')
+                raise
+            queryset.model.objects.filter(id__in=[obj.id for obj in batch]).delete()
+        moved += len(batch)
+        if pause:
+            time.sleep(pause)
+    return moved
+
+
+def _archived_order(order):
+    return ArchivedOrder(
+        id=order.id,
+        client_id=order.client_id,
+        employee_id=order.employee_id,
+        tour_package_ids=[package.id for package in order.tour_packages.all()],
+        order_date=order.order_date,
+        departure_date=order.departure_date,
+        total_price=order.total_price,
+        status=order.status,
+    )
+
+
+def _archived_package(package):
+    return ArchivedTourPackage(
+        id=package.id,
+        name=package.name,
+        hotel_id=package.hotel_id,
+        hotel_name=package.hotel.name,
+        country_name=package.hotel.country.name,
+        duration_weeks=package.duration_weeks,
+        price=package.price,
+        description=package.description,
+        is_hot_deal=package.is_hot_deal,
+        additional_services=package.additional_services,
+        start_date=package.start_date,
+        end_date=package.end_date,
+        client_id=package.client_id,
+        created_at=package.created_at,
+        updated_at=package.updated_at,
+    )
+
+
+def archive_history(batch_size=None, pause=0, now=None):
+    """Переносит холодные заказы, затем освободившиеся путевки в архивные таблицы.
+
+    Отчеты по всей истории читают представления OrderHistory и TourPackageHistory.
+    """
+    batch_size = batch_size or getattr(settings, 'TOURS_ARCHIVE_BATCH', 500)
+    orders = _archive_batches(cold_orders(now).prefetch_related('tour_packages'), _archived_order,
+                              ArchivedOrder, batch_size, pause)
+    packages = _archive_batches(cold_tour_packages(now).select_related('hotel__country'), _archived_package,
+                                ArchivedTourPackage, batch_size, pause)
+    logger.info(f'Архивировано заказов: {orders}, путевок: {packages}')
+    return {'orders': orders, 'tour_packages': packages}
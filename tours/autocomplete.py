@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models import Q
+
+from .models import ClientProfile, Hotel, TourPackage
+
+# Символ больше любого другого: "abc" <= name < "abc" + PREFIX_END — все строки с префиксом "abc"
+PREFIX_END = '\U0010ffff'
+
+
+def _user_label(user):
+    name = f'{user.last_name} {user.first_name}'.strip()
+    return f'{name} ({user.username})' if name else user.username
+
+
+# Источник подсказок: запрос, поля с индексом для поиска по префиксу и подпись
+SOURCES = {
+    'users': (lambda: User.objects.all(), ('username', 'last_name'), _user_label),
+    'employees': (lambda: User.objects.filter(employeeprofile__isnull=False), ('username', 'last_name'), _user_label),
+    'clients': (lambda: ClientProfile.objects.select_related('user'), ('user__username', 'user__last_name'), str),
+    'hotels': (lambda: Hotel.objects.select_related('country'), ('name',), str),
+    'packages': (lambda: TourPackage.objects.select_related('hotel'), ('name',), str),
+}
+
+
+def _variants(term):
+    # LOWER() в SQLite не понимает кириллицу, поэтому вместо регистронезависимого
+    # сравнения проверяем несколько вариантов написания
+    return list(dict.fromkeys((term, term.lower(), term.capitalize())))
+
+
+def search(source, term, limit=None):
+    """Первые limit записей, у которых одно из полей начинается с term.
+
+    Префикс ищется диапазоном field >= term AND field < term + PREFIX_END,
+    поэтому запрос читает только нужный участок индекса.
+    """
+    build_queryset, fields, label = SOURCES[source]
+    limit = limit or getattr(settings, 'TOURS_AUTOCOMPLETE_LIMIT', 10)
+    condition = Q()
+    for field in fields:
+        for variant in _variants(term):
+            condition |= Q(**{f'{field}__gte': variant, f'{field}__lt': variant + PREFIX_END})
+    queryset = build_queryset().filter(condition).order_by(fields[0], 'pk')[:limit]
+    return [{'id': obj.pk, 'text': label(obj)} for obj in queryset]
+
+
+def labels(source, pks):
+    """Подписи для выбранных значений: только они и грузятся при отрисовке формы."""
+    build_queryset, _, label = SOURCES[source]
+    try:
+        return [(obj.pk, label(obj)) for obj in build_queryset().filter(pk__in=pks)]
+    except (TypeError, ValueError):
+        # в отправленной форме может оказаться что угодно, ошибку покажет поле формы
+        return []
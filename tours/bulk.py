@@ -0,0 +1,95 @@
+import logging
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Round
+from django.utils import timezone
+
+from .models import BulkChange, CatalogEntry, PromoCode, TourPackage
+from .response_cache import bump_tags
+
+logger = logging.getLogger('tours')
+
+CRITERIA_MAX_LENGTH = 2000
+
+
+class BulkError(ValueError):
+    pass
+
+
+def parse_percent(raw):
+    try:
+        percent = Decimal(str(raw).replace(',', '.'))
+    except InvalidOperation:
+        raise BulkError('Процент должен быть числом')
+    if percent <= -100:
+        raise BulkError('Цена не может уменьшиться на 100% и больше')
+    return percent
+
+
+def _criteria(queryset):
+    try:
+        sql = str(queryset.query)
+    except Exception:
+        sql = ''
+    return sql[:CRITERIA_MAX_LENGTH]
+
+
+def _audit(action, queryset, affected, params, user):
+    BulkChange.objects.create(
+        action=action,
+        model=queryset.model._meta.label,
+        params=params,
+        criteria=_criteria(queryset),
+        affected=affected,
+        user=user if user is not None and user.is_authenticated else None,
+    )
+    logger.info(f'Массовое изменение {action} ({queryset.model._meta.label}): {affected} записей, {params}')
+
+
+def _update_packages(queryset, action, params, user, **values):
+    """UPDATE по путевкам и тот же по их записям каталога.
+
+    Список pk выбирается один раз: условия queryset могут зависеть от
+    меняемых полей, и второй UPDATE по подзапросу нашел бы другие записи.
+    save() и сигналы не вызываются, поэтому каталог и кэш страниц
+    обновляются здесь же.
+    """
+    batch_size = getattr(settings, 'TOURS_BULK_BATCH_SIZE', 500)
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(queryset.order_by().values_list('pk', flat=True))
+        affected = 0
+        for start in range(0, len(ids), batch_size):
+            chunk = ids[start:start + batch_size]
+            CatalogEntry.objects.filter(package_id__in=chunk).update(**values)
+            affected += TourPackage.objects.filter(pk__in=chunk).update(updated_at=now, **values)
+        _audit(action, queryset, affected, params, user)
+        transaction.on_commit(lambda: bump_tags('tours.CatalogEntry', 'tours.TourPackage'))
+    return affected
+
+
+def reprice_packages(queryset, percent, user=None):
+    percent = parse_percent(percent)
+    factor = 1 + percent / 100
+    return _update_packages(queryset, 'reprice', {'percent': str(percent)}, user,
+                            price=Round(F('price') * factor, 2))
+
+
+def set_hot_deal(queryset, value, user=None):
+    return _update_packages(queryset, 'hot_deal', {'is_hot_deal': value}, user, is_hot_deal=value)
+
+
+def expired_promocodes(today=None):
+    today = today or timezone.localdate()
+    return PromoCode.objects.filter(is_active=True, valid_until__lt=today)
+
+
+def deactivate_promocodes(queryset, user=None):
+    with transaction.atomic():
+        affected = queryset.filter(is_active=True).update(is_active=False)
+        _audit('deactivate', queryset, affected, {}, user)
+        transaction.on_commit(lambda: bump_tags('tours.PromoCode'))
+    return affected
@@ -0,0 +1,306 @@
+import logging
+import math
+import pickle
+import random
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+logger = logging.getLogger('tours')
+
+STAT_FIELDS = ('l1_hits', 'l2_hits', 'misses', 'sets', 'early_refreshes', 'waits')
+
+
+class _Entry:
+    """Значение, записанное через get_or_set: помнит срок и время пересчёта."""
+    __slots__ = ('value', 'expires_at', 'delta')
+
+    def __init__(self, value, expires_at, delta):
+        self.value = value
+        self.expires_at = expires_at
+        self.delta = delta
+
+    def __getstate__(self):
+        return self.value, self.expires_at, self.delta
+
+    def __setstate__(self, state):
+        self.value, self.expires_at, self.delta = state
+
+
+def _unwrap(value):
+    return value.value if isinstance(value, _Entry) else value
+
+
+class TwoTierCache(BaseCache):
+    """Локальный LRU-кэш процесса (L1) перед общим кэшем (L2).
+
+    L2 — любой другой алиас из CACHES (файловый кэш, Redis). Записи в L1
+    живут не дольше L1_TIMEOUT секунд, поэтому изменения, сделанные другими
+    процессами, становятся видны с этой задержкой; собственные записи и
+    удаления процесс видит сразу. Ключи с префиксами из L1_BYPASS_PREFIXES
+    (версии, флаги — всё, что должно меняться сразу во всех процессах)
+    читаются и пишутся только в L2.
+
+    get_or_set пересчитывает значение заранее с вероятностью, растущей к
+    концу срока жизни (XFetch), и не даёт нескольким запросам одновременно
+    пересчитывать один ключ: остальные ждут результат или получают старое
+    значение.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._l2_alias = options.get('L2', 'shared')
+        self._l1_max_entries = options.get('L1_MAX_ENTRIES', 1000)
+        self._l1_timeout = options.get('L1_TIMEOUT', 5)
+        self._l1_bypass = tuple(options.get('L1_BYPASS_PREFIXES', ()))
+        self._beta = options.get('EARLY_EXPIRY_BETA', 1.0)
+        self._lock_timeout = options.get('LOCK_TIMEOUT', 10)
+        self._lock_wait = options.get('LOCK_WAIT', 5)
+        self._prefix_depth = options.get('STATS_PREFIX_DEPTH', 2)
+        self._l1 = OrderedDict()
+        self._l1_lock = threading.Lock()
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+        self._stats = defaultdict(lambda: dict.fromkeys(STAT_FIELDS, 0))
+        self._stats_lock = threading.Lock()
+
+    @property
+    def l2(self):
+        return caches[self._l2_alias]
+
+    # --- метрики ---
+
+    def _prefix(self, key):
+        return '.'.join(str(key).replace(':', '.').split('.')[:self._prefix_depth])
+
+    def _count(self, key, field):
+        with self._stats_lock:
+            self._stats[self._prefix(key)][field] += 1
+
+    def stats(self):
+        with self._stats_lock:
+            return {prefix: dict(counters) for prefix, counters in self._stats.items()}
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats.clear()
+
+    # --- L1 ---
+
+    def _l1_key(self, key, version):
+        # None — ключ не кэшируется в L1
+        if self._l1_bypass and str(key).startswith(self._l1_bypass):
+            return None
+        return self.make_and_validate_key(key, version)
+
+    def _l1_get(self, l1_key):
+        if l1_key is None:
+            return None
+        with self._l1_lock:
+            item = self._l1.get(l1_key)
+            if item is None:
+                return None
+            expires, data = item
+            if expires <= time.monotonic():
+                del self._l1[l1_key]
+                return None
+            self._l1.move_to_end(l1_key)
+        # в L1 лежит pickle, чтобы изменения полученного объекта не портили кэш
+        return pickle.loads(data)
+
+    def _l1_set(self, l1_key, value, timeout):
+        if l1_key is None:
+            return
+        ttl = self._l1_timeout
+        if timeout is not None:
+            ttl = min(ttl, timeout)
+        if ttl <= 0:
+            self._l1_delete(l1_key)
+            return
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._l1_lock:
+            self._l1[l1_key] = (time.monotonic() + ttl, data)
+            self._l1.move_to_end(l1_key)
+            while len(self._l1) > self._l1_max_entries:
+                self._l1.popitem(last=False)
+
+    def _l1_delete(self, l1_key):
+        if l1_key is None:
+            return
+        with self._l1_lock:
+            self._l1.pop(l1_key, None)
+
+    def _timeout(self, timeout):
+        return self.l2.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+    # --- API кэша ---
+
+    def _fetch(self, key, version):
+        l1_key = self._l1_key(key, version)
+        value = self._l1_get(l1_key)
+        if value is not None:
+            self._count(key, 'l1_hits')
+            return value
+        value = self.l2.get(key, version=version)
+        if value is None:
+            self._count(key, 'misses')
+            return None
+        self._count(key, 'l2_hits')
+        self._l1_set(l1_key, value, self._remaining(value))
+        return value
+
+    @staticmethod
+    def _remaining(value):
+        if isinstance(value, _Entry) and value.expires_at is not None:
+            return value.expires_at - time.time()
+        return None
+
+    def get(self, key, default=None, version=None):
+        value = self._fetch(key, version)
+        return default if value is None else _unwrap(value)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.l2.set(key, value, timeout, version=version)
+        self._l1_set(self._l1_key(key, version), value, self._timeout(timeout))
+        self._count(key, 'sets')
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        # add решает L2: на нём держатся блокировки между процессами
+        added = self.l2.add(key, value, timeout, version=version)
+        if added:
+            self._l1_set(self._l1_key(key, version), value, self._timeout(timeout))
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self._l1_delete(self._l1_key(key, version))
+        return self.l2.touch(key, timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._l1_delete(self._l1_key(key, version))
+        return self.l2.delete(key, version=version)
+
+    def has_key(self, key, version=None):
+        return self._fetch(key, version) is not None
+
+    def incr(self, key, delta=1, version=None):
+        self._l1_delete(self._l1_key(key, version))
+        return self.l2.incr(key, delta, version=version)
+
+    def get_many(self, keys, version=None):
+        found = {}
+        missing = []
+        for key in keys:
+            value = self._l1_get(self._l1_key(key, version))
+            if value is None:
+                missing.append(key)
+            else:
+                self._count(key, 'l1_hits')
+                found[key] = _unwrap(value)
+        if missing:
+            fetched = self.l2.get_many(missing, version=version)
+            for key in missing:
+                value = fetched.get(key)
+                if value is None:
+                    self._count(key, 'misses')
+                    continue
+                self._count(key, 'l2_hits')
+                self._l1_set(self._l1_key(key, version), value, self._remaining(value))
+                found[key] = _unwrap(value)
+        return found
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.l2.set_many(data, timeout, version=version)
+        l1_timeout = self._timeout(timeout)
+        for key, value in data.items():
+            if key not in failed:
+                self._l1_set(self._l1_key(key, version), value, l1_timeout)
+                self._count(key, 'sets')
+        return failed
+
+    def delete_many(self, keys, version=None):
+        for key in keys:
+            self._l1_delete(self._l1_key(key, version))
+        self.l2.delete_many(keys, version=version)
+
+    def clear(self):
+        with self._l1_lock:
+            self._l1.clear()
+        self.l2.clear()
+
+    def close(self, **kwargs):
+        self.l2.close(**kwargs)
+
+    # --- get_or_set с ранним пересчётом и одиночным полётом ---
+
+    def _expired_early(self, entry):
+        if entry.expires_at is None:
+            return False
+        # XFetch: чем дольше пересчёт и ближе срок, тем вероятнее обновить заранее
+        return time.time() - entry.delta * self._beta * math.log(1 - random.random()) >= entry.expires_at
+
+    def get_or_set(self, key, default, timeout=DEFAULT_TIMEOUT, version=None):
+        current = self._fetch(key, version)
+        if current is not None and not (isinstance(current, _Entry) and self._expired_early(current)):
+            return _unwrap(current)
+        if not callable(default):
+            if default is not None:
+                self.add(key, default, timeout, version=version)
+                return self.get(key, default, version=version)
+            return None
+        if current is not None:
+            self._count(key, 'early_refreshes')
+        return self._recompute(key, default, timeout, version, current)
+
+    def _recompute(self, key, default, timeout, version, stale):
+        l1_key = self.make_and_validate_key(key, version)
+        with self._flights_lock:
+            flight = self._flights.get(l1_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[l1_key] = threading.Event()
+        if not leader:
+            if stale is not None:
+                return _unwrap(stale)
+            self._count(key, 'waits')
+            flight.wait(self._lock_wait)
+            value = self._fetch(key, version)
+            return _unwrap(value) if value is not None else self._compute(key, default, timeout, version)
+
+        try:
+            lock_key = f'{key}:lock'
+            if self.l2.add(lock_key, 1, self._lock_timeout, version=version):
+                try:
+                    return self._compute(key, default, timeout, version)
+                finally:
+                    self.l2.delete(lock_key, version=version)
+            # ключ пересчитывает другой процесс
+            if stale is not None:
+                return _unwrap(stale)
+            self._count(key, 'waits')
+            deadline = time.monotonic() + self._lock_wait
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                value = self.l2.get(key, version=version)
+                if value is not None:
+                    self._l1_set(self._l1_key(key, version), value, self._remaining(value))
+                    return _unwrap(value)
+            logger.warning(f'Не дождались пересчёта ключа кэша {key}, считаем сами')
+            return self._compute(key, default, timeout, version)
+        finally:
+            with self._flights_lock:
+                self._flights.pop(l1_key, None)
+            flight.set()
+
+    def _compute(self, key, default, timeout, version):
+        started = time.monotonic()
+        value = default()
+        if value is None:
+            return None
+        backend_timeout = self._timeout(timeout)
+        expires_at = None if backend_timeout is None else time.time() + backend_timeout
+        self.set(key, _Entry(value, expires_at, time.monotonic() - started), timeout, version=version)
+        return value
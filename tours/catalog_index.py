@@ -0,0 +1,71 @@
+import logging
+
+from django.db import transaction
+
+from .models import CatalogEntry, Hotel, TourPackage
+
+logger = logging.getLogger('tours')
+
+PACKAGE_FIELDS = ('name', 'price', 'duration_weeks', 'is_hot_deal', 'additional_services',
+                  'start_date', 'end_date', 'created_at')
+
+
+def _thumbnail_url(hotel):
+    return hotel.photo.url if hotel.photo else ''
+
+
+def _hotel_values(hotel):
+    return {
+        'hotel_id': hotel.id,
+        'hotel_name': hotel.name,
+        'stars': hotel.stars,
+        'thumbnail_url': _thumbnail_url(hotel),
+        'country_id': hotel.country_id,
+        'country_name': hotel.country.name,
+    }
+
+
+def _entry(package, hotel):
+    values = {field: getattr(package, field) for field in PACKAGE_FIELDS}
+    values.update(_hotel_values(hotel))
+    return CatalogEntry(package_id=package.pk, **values)
+
+
+def sync_package(package):
+    hotel = Hotel.objects.select_related('country').get(pk=package.hotel_id)
+    entry = _entry(package, hotel)
+    CatalogEntry.objects.update_or_create(
+        package_id=package.pk,
+        defaults={field.attname: getattr(entry, field.attname)
+                  for field in CatalogEntry._meta.concrete_fields if not field.primary_key},
+    )
+
+
+def sync_hotel(hotel):
+    values = _hotel_values(hotel)
+    del values['hotel_id']
+    CatalogEntry.objects.filter(hotel_id=hotel.pk).update(**values)
+
+
+def sync_country(country):
+    CatalogEntry.objects.filter(country_id=country.pk).update(country_name=country.name)
+
+
+def rebuild_catalog(batch_size=2000):
+    hotels = {hotel.pk: hotel for hotel in Hotel.objects.select_related('country')}
+    packages = TourPackage.objects.order_by().only('hotel_id', *PACKAGE_FIELDS)
+    created = 0
+    with transaction.atomic():
+        CatalogEntry.objects.all().delete()
+        batch = []
+        for package in packages.iterator(chunk_size=batch_size):
+            batch.append(_entry(package, hotels[package.hotel_id]))
+            if len(batch) == batch_size:
+                CatalogEntry.objects.bulk_create(batch)
+                created += len(batch)
+                batch = []
+        if batch:
+            CatalogEntry.objects.bulk_create(batch)
+            created += len(batch)
+    logger.info(f'Каталог перестроен: {created} записей')
+    return created
@@ -0,0 +1,12 @@
+from django.core.checks import Error, Tags, register
+
+from .templating import compile_templates
+
+
+@register(Tags.templates)
+def check_template_syntax(app_configs, **kwargs):
+    _, errors = compile_templates()
+    return [
+        Error(f'Шаблон {name} не компилируется: {exc}', id='tours.E001')
+        for name, exc in errors
+    ]
@@ -0,0 +1,150 @@
+import csv
+import logging
+import re
+from datetime import datetime
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from .models import PHONE_RE, ClientProfile, adult_birth_date_limit
+
+logger = logging.getLogger('tours')
+
+REQUIRED_COLUMNS = ('username', 'address', 'phone_number', 'birth_date')
+OPTIONAL_COLUMNS = ('email', 'first_name', 'last_name', 'patronymic', 'password')
+
+USERNAME_RE = re.compile(r'^[\w.@+-]{1,150}$')
+EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+DATE_FORMATS = ('%Y-%m-%d', '%d.%m.%Y')
+
+
+class ClientImportError(ValueError):
+    pass
+
+
+def read_chunks(stream, chunk_size):
+    """Читает CSV пачками по chunk_size строк: [(номер строки, словарь), ...]."""
+    reader = csv.DictReader(stream)
+    missing = [column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or ())]
+    if missing:
+        raise ClientImportError(f"В файле нет столбцов: {', '.join(missing)}")
+    rows = ((reader.line_num, row) for row in reader)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _parse_date(raw):
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(raw, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _clean(row, birth_date_limit):
+    """Проверяет одну строку; возвращает (значения, список ошибок)."""
+    values = {column: (row.get(column) or '').strip() for column in REQUIRED_COLUMNS + OPTIONAL_COLUMNS}
+    errors = []
+    if not USERNAME_RE.match(values['username']):
+        errors.append('username: допустимы буквы, цифры и @.+-_, не длиннее 150 символов')
+    if values['email'] and not EMAIL_RE.match(values['email']):
+        errors.append('email: неверный адрес')
+    if not values['address']:
+        errors.append('address: обязательное поле')
+    if not PHONE_RE.match(values['phone_number']):
+        errors.append('phone_number: формат должен быть +375 (XX) XXX-XX-XX')
+    birth_date = _parse_date(values['birth_date'])
+    if birth_date is None:
+        errors.append('birth_date: ожидается ГГГГ-ММ-ДД или ДД.ММ.ГГГГ')
+    elif birth_date > birth_date_limit:
+        errors.append('birth_date: клиент должен быть старше 18 лет')
+    values['birth_date'] = birth_date
+    return values, errors
+
+
+def validate_chunk(chunk, seen, birth_date_limit):
+    """Проверяет пачку строк; имена пользователей сверяются с базой одним запросом.
+
+    seen — имена, уже встреченные в файле (пополняется).
+    Возвращает (корректные строки, [(номер строки, ошибка), ...]).
+    """
+    cleaned = []
+    errors = []
+    for line, row in chunk:
+        values, row_errors = _clean(row, birth_date_limit)
+        if values['username'] in seen:
+            row_errors.append(f"username: {values['username']} уже встречался в файле")
+        seen.add(values['username'])
+        if row_errors:
+            errors.extend((line, error) for error in row_errors)
+        else:
+            cleaned.append((line, values))
+    existing = set(User.objects.filter(username__in=[values['username'] for _, values in cleaned])
+                   .values_list('username', flat=True))
+    valid = []
+    for line, values in cleaned:
+        if values['username'] in existing:
+            errors.append((line, f"username: пользователь {values['username']} уже существует"))
+        else:
+            valid.append(values)
+    errors.sort(key=lambda error: error[0])
+    return valid, errors
+
+
+def _password(raw, hasher):
+    # без пароля в файле — неиспользуемый пароль, клиент задаст свой через восстановление
+    return make_password(raw or None, hasher=hasher)
+
+
+def create_clients(rows, hasher='default'):
+    """Создает пары User + ClientProfile для проверенных строк одной транзакцией."""
+    with transaction.atomic():
+        users = User.objects.bulk_create([
+            User(username=values['username'], email=values['email'], first_name=values['first_name'],
+                 last_name=values['last_name'], password=_password(values['password'], hasher))
+            for values in rows
+        ])
+        if any(user.pk is None for user in users):
+            # БД не вернула id из массовой вставки
+            ids = dict(User.objects.filter(username__in=[user.username for user in users])
+                       .values_list('username', 'id'))
+            for user in users:
+                user.pk = ids[user.username]
+        ClientProfile.objects.bulk_create([
+            ClientProfile(user=user, patronymic=values['patronymic'], address=values['address'],
+                          phone_number=values['phone_number'], birth_date=values['birth_date'])
+            for user, values in zip(users, rows)
+        ])
+    return len(users)
+
+
+def import_clients(stream, chunk_size=None, dry_run=False, hasher=None, on_error=None):
+    """Импортирует клиентов из CSV пачками; строки с ошибками пропускаются.
+
+    Каждая пачка проверяется и записывается в своей транзакции, поэтому
+    ошибка в строке не прерывает импорт. on_error(номер строки, текст)
+    вызывается для каждой ошибки.
+    """
+    chunk_size = chunk_size or getattr(settings, 'TOURS_IMPORT_CHUNK_SIZE', 1000)
+    hasher = hasher or getattr(settings, 'TOURS_IMPORT_PASSWORD_HASHER', 'default')
+    limit = adult_birth_date_limit()
+    seen = set()
+    result = {'rows': 0, 'created': 0, 'skipped': 0}
+    for chunk in read_chunks(stream, chunk_size):
+        valid, errors = validate_chunk(chunk, seen, limit)
+        result['rows'] += len(chunk)
+        result['skipped'] += len(chunk) - len(valid)
+        if on_error:
+            for line, error in errors:
+                on_error(line, error)
+        if valid and not dry_run:
+            result['created'] += create_clients(valid, hasher)
+    logger.info(f"Импорт клиентов: строк {result['rows']}, создано {result['created']}, пропущено {result['skipped']}")
+    return result
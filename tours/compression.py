@@ -0,0 +1,246 @@
+import gzip
+import mimetypes
+import os
+import secrets
+import string
+import zlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE_TYPES = ('text/html', 'text/css', 'text/plain', 'text/csv', 'application/json',
+                      'application/x-ndjson', 'application/javascript', 'text/javascript', 'image/svg+xml')
+
+# Расширение предварительно сжатого файла для каждой кодировки
+STATIC_SUFFIXES = {'br': '.br', 'zstd': '.zst', 'gzip': '.gz'}
+
+# Как в GZipMiddleware: до стольких случайных байт добавляется к сжатому ответу (BREACH)
+MAX_RANDOM_BYTES = 100
+
+
+def available_encodings():
+    encodings = []
+    if brotli is not None:
+        encodings.append('br')
+    if zstandard is not None:
+        encodings.append('zstd')
+    encodings.append('gzip')
+    return encodings
+
+
+def negotiate(accept_encoding, encodings=None):
+    """Выбирает кодировку по Accept-Encoding с учётом q; при равенстве — по порядку encodings."""
+    encodings = encodings or available_encodings()
+    weights = {}
+    for item in accept_encoding.split(','):
+        name, _, params = item.strip().partition(';')
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+    best = None
+    for encoding in encodings:
+        q = weights.get(encoding, weights.get('*', 0.0))
+        if q > 0 and (best is None or q > best[1]):
+            best = (encoding, q)
+    return best[0] if best else None
+
+
+def compress(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=getattr(settings, 'TOURS_BROTLI_QUALITY', 5))
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=getattr(settings, 'TOURS_ZSTD_LEVEL', 6)).compress(data)
+    return gzip.compress(data, compresslevel=getattr(settings, 'TOURS_GZIP_LEVEL', 6), mtime=0)
+
+
+def pad_gzip(compressed, max_random_bytes=MAX_RANDOM_BYTES):
+    """Добавляет в заголовок gzip имя файла случайной длины, как compress_string в Django.
+
+    Длина ответа перестает точно отражать степень сжатия, и подбор секрета
+    со страницы по размеру (BREACH) требует намного больше запросов.
+    """
+    header = bytearray(compressed[:10])
+    header[3] |= gzip.FNAME
+    length = secrets.randbelow(max_random_bytes) + 1
+    filename = ''.join(secrets.choice(string.ascii_letters) for _ in range(length)).encode() + b'\x00'
+    return bytes(header) + filename + compressed[10:]
+
+
+class _StreamCompressor:
+    """Сжимает поток по кускам, сбрасывая буфер после каждого, чтобы клиент не ждал конца ответа."""
+
+    def __init__(self, encoding):
+        if encoding == 'br':
+            self._obj = brotli.Compressor(quality=getattr(settings, 'TOURS_BROTLI_QUALITY', 5))
+            self._chunk = lambda data: self._obj.process(data) + self._obj.flush()
+            self._finish = self._obj.finish
+        elif encoding == 'zstd':
+            self._obj = zstandard.ZstdCompressor(level=getattr(settings, 'TOURS_ZSTD_LEVEL', 6)).compressobj()
+            self._chunk = lambda data: self._obj.compress(data) + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+            self._finish = self._obj.flush
+        else:
+            self._obj = zlib.compressobj(getattr(settings, 'TOURS_GZIP_LEVEL', 6), zlib.DEFLATED, 31)
+            self._chunk = lambda data: self._obj.compress(data) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = self._obj.flush
+
+    def chunk(self, data):
+        return self._chunk(data) if data else b''
+
+    def finish(self):
+        return self._finish()
+
+
+def _compress_stream(content, encoding):
+    compressor = _StreamCompressor(encoding)
+    for data in content:
+        out = compressor.chunk(data)
+        if out:
+            yield out
+    yield compressor.finish()
+
+
+async def _acompress_stream(content, encoding):
+    compressor = _StreamCompressor(encoding)
+    async for data in content:
+        out = compressor.chunk(data)
+        if out:
+            yield out
+    yield compressor.finish()
+
+
+class CompressionMiddleware:
+    """Сжимает HTML и JSON (в том числе потоковые ответы) в br, zstd или gzip.
+
+    Кодировка выбирается по Accept-Encoding; brotli и zstd используются,
+    только если установлены соответствующие пакеты. Ответы меньше
+    TOURS_COMPRESS_MIN_SIZE байт отдаются как есть.
+
+    Против BREACH: к gzip добавляется случайная длина, а страницы с CSRF-токеном
+    сжимаются только в gzip (br и zstd так не дополнить) и не сжимаются, если
+    ответ потоковый.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = getattr(settings, 'TOURS_COMPRESS_MIN_SIZE', 1024)
+        self.encodings = available_encodings()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding') or response.status_code in (204, 304):
+            return response
+        content_type = response.get('Content-Type', '').split(';')[0].strip()
+        if content_type not in COMPRESSIBLE_TYPES:
+            return response
+        # ответ может быть сжат, поэтому кэши должны различать клиентов по Accept-Encoding
+        patch_vary_headers(response, ('Accept-Encoding',))
+        # токен выдан в этом ответе: get_token() ставит CSRF_COOKIE_NEEDS_UPDATE
+        has_token = request.META.get('CSRF_COOKIE_NEEDS_UPDATE', False)
+        if has_token and response.streaming:
+            return response
+        encoding = negotiate(request.headers.get('Accept-Encoding', ''), ['gzip'] if has_token else self.encodings)
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = _acompress_stream(response.streaming_content, encoding)
+            else:
+                response.streaming_content = _compress_stream(response.streaming_content, encoding)
+            del response.headers['Content-Length']
+        else:
+            if len(response.content) < self.min_size:
+                return response
+            compressed = compress(response.content, encoding)
+            if encoding == 'gzip':
+                compressed = pad_gzip(compressed)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+
+def precompress_file(path, encodings=None, min_size=None):
+    """Пишет рядом с файлом сжатые варианты (.br, .zst, .gz), если они меньше оригинала."""
+    min_size = getattr(settings, 'TOURS_COMPRESS_MIN_SIZE', 1024) if min_size is None else min_size
+    with open(path, 'rb') as source:
+        data = source.read()
+    written = []
+    if len(data) < min_size:
+        return written
+    for encoding in encodings or available_encodings():
+        compressed = compress(data, encoding)
+        if len(compressed) < len(data):
+            target = path + STATIC_SUFFIXES[encoding]
+            with open(target, 'wb') as out:
+                out.write(compressed)
+            written.append(target)
+    return written
+
+
+def serve_precompressed(request, path, document_root):
+    """Отдаёт статический файл, предпочитая заранее сжатый вариант (.br, .zst, .gz)."""
+    fullpath = safe_join(document_root, path)
+    if not os.path.isfile(fullpath):
+        raise Http404(f'Файл {path} не найден')
+    content_type, _ = mimetypes.guess_type(fullpath)
+    return precompressed_response(request, fullpath, content_type or 'application/octet-stream',
+                                  filename=os.path.basename(fullpath))
+
+
+def precompressed_response(request, fullpath, content_type, filename=None):
+    """Ответ с файлом fullpath или его сжатым вариантом, если клиент его принимает."""
+    variants = [encoding for encoding, suffix in STATIC_SUFFIXES.items() if os.path.isfile(fullpath + suffix)]
+    encoding = negotiate(request.headers.get('Accept-Encoding', ''), variants) if variants else None
+    served = fullpath + STATIC_SUFFIXES[encoding] if encoding else fullpath
+
+    stat = os.stat(served)
+    if not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'), stat.st_mtime):
+        return HttpResponseNotModified()
+    response = FileResponse(open(served, 'rb'), content_type=content_type, filename=filename or '')
+    if filename is None:
+        # имя файла FileResponse берёт из открытого файла, а для страниц оно не нужно
+        del response['Content-Disposition']
+    response.headers['Last-Modified'] = http_date(stat.st_mtime)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if variants:
+        patch_vary_headers(response, ('Accept-Encoding',))
+    return response
@@ -0,0 +1,23 @@
+import json
+from datetime import date
+from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj):
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f'Тип {type(obj).__name__} не сериализуется в JSON')
+
+
+def dumps(obj):
+    """Сериализует obj в JSON (bytes); Decimal отдаётся строкой, даты — в ISO 8601."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default)
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(',', ':')).encode()
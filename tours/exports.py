@@ -0,0 +1,242 @@
+import csv
+import logging
+from datetime import datetime, time
+
+from django.conf import settings
+from django.db.models import Prefetch
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .encoding import dumps
+from .models import Order, TourPackage
+
+logger = logging.getLogger('tours')
+
+FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+}
+
+
+class ExportError(ValueError):
+    pass
+
+
+def _order_rows(queryset):
+    for order in queryset:
+        packages = list(order.tour_packages.all())
+        yield {
+            'id': order.id,
+            'order_date': order.order_date,
+            'departure_date': order.departure_date,
+            'status': order.status,
+            'total_price': order.total_price,
+            'client_id': order.client_id,
+            'client': order.client.username,
+            'employee': order.employee.username if order.employee else None,
+            'tour_package_ids': [package.id for package in packages],
+            'tour_package_names': [package.name for package in packages],
+        }
+
+
+def _package_rows(queryset):
+    for package in queryset:
+        yield {
+            'id': package.id,
+            'name': package.name,
+            'hotel_id': package.hotel_id,
+            'hotel': package.hotel.name,
+            'country': package.hotel.country.name,
+            'price': package.price,
+            'duration_weeks': package.duration_weeks,
+            'is_hot_deal': package.is_hot_deal,
+            'start_date': package.start_date,
+            'end_date': package.end_date,
+            'client_id': package.client_id,
+            'created_at': package.created_at,
+        }
+
+
+# Что выгружается: запрос, поле для фильтра по датам и преобразование строк
+EXPORTS = {
+    'orders': (
+        lambda: Order.objects.select_related('client', 'employee').prefetch_related(
+            Prefetch('tour_packages', queryset=TourPackage.objects.only('id', 'name').order_by('id'))),
+        'order_date',
+        _order_rows,
+    ),
+    'packages': (
+        lambda: TourPackage.objects.select_related('hotel__country'),
+        'start_date',
+        _package_rows,
+    ),
+}
+
+
+def _parse_day(raw, name):
+    if not raw:
+        return None
+    try:
+        day = parse_date(raw)
+    except ValueError:
+        day = None
+    if day is None:
+        raise ExportError(f'{name}: ожидается дата в формате ГГГГ-ММ-ДД')
+    return day
+
+
+def export_rows(kind='orders', date_from=None, date_to=None, after=None, chunk_size=None):
+    """Строки выгрузки по возрастанию id.
+
+    Записи читаются курсором пачками по chunk_size, M2M подгружается
+    отдельно для каждой пачки, поэтому память не зависит от размера таблицы.
+    after — id последней выгруженной записи, с него выгрузку можно продолжить.
+    """
+    if kind not in EXPORTS:
+        raise ExportError(f'Неизвестный тип выгрузки: {kind}')
+    build_queryset, date_field, to_rows = EXPORTS[kind]
+    chunk_size = chunk_size or getattr(settings, 'TOURS_EXPORT_CHUNK_SIZE', 2000)
+    date_from = _parse_day(date_from, 'date_from') if isinstance(date_from, str) else date_from
+    date_to = _parse_day(date_to, 'date_to') if isinstance(date_to, str) else date_to
+
+    queryset = build_queryset()
+    is_datetime = queryset.model._meta.get_field(date_field).get_internal_type() == 'DateTimeField'
+    if date_from:
+        value = timezone.make_aware(datetime.combine(date_from, time.min)) if is_datetime else date_from
+        queryset = queryset.filter(**{f'{date_field}__gte': value})
+    if date_to:
+        value = timezone.make_aware(datetime.combine(date_to, time.max)) if is_datetime else date_to
+        queryset = queryset.filter(**{f'{date_field}__lte': value})
+    if after:
+        try:
+            queryset = queryset.filter(id__gt=int(after))
+        except (TypeError, ValueError):
+            raise ExportError('after должен быть id записи')
+    return to_rows(queryset.order_by('id').iterator(chunk_size=chunk_size))
+
+
+def _csv_value(value):
+    if isinstance(value, list):
+        return ';'.join(str(item) for item in value)
+    if value is None:
+        return ''
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows):
+    writer = csv.writer(_Echo())
+    header_sent = False
+    for row in rows:
+        if not header_sent:
+            yield writer.writerow(list(row)).encode()
+            header_sent = True
+        yield writer.writerow([_csv_value(value) for value in row.values()]).encode()
+
+
+def iter_ndjson(rows):
+    for row in rows:
+        yield dumps(row) + b'\n'
+
+
+class _Drain:
+    """Файлоподобный приёмник для ParquetWriter: накопленные байты забираются после каждой группы строк."""
+
+    closed = False
+
+    def __init__(self):
+        self._parts = []
+        self._position = 0
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b''.join(self._parts)
+        self._parts = []
+        return data
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ExportError('Для выгрузки в Parquet нужен пакет pyarrow')
+    return pyarrow, pyarrow.parquet
+
+
+def _arrow_schema(pa, columns):
+    # тип задаётся заранее: по первой пачке его не угадать, если в ней одни NULL
+    types = {
+        'order_date': pa.timestamp('us', tz='UTC'),
+        'created_at': pa.timestamp('us', tz='UTC'),
+        'departure_date': pa.date32(),
+        'start_date': pa.date32(),
+        'end_date': pa.date32(),
+        'total_price': pa.decimal128(12, 2),
+        'price': pa.decimal128(10, 2),
+        'duration_weeks': pa.int16(),
+        'is_hot_deal': pa.bool_(),
+        'tour_package_ids': pa.list_(pa.int64()),
+        'tour_package_names': pa.list_(pa.string()),
+    }
+    return pa.schema([
+        (name, types.get(name, pa.int64() if name == 'id' or name.endswith('_id') else pa.string()))
+        for name in columns
+    ])
+
+
+def iter_parquet(rows, row_group_size=None):
+    pa, pq = _pyarrow()
+    row_group_size = row_group_size or getattr(settings, 'TOURS_EXPORT_CHUNK_SIZE', 2000)
+    sink = _Drain()
+    writer = None
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) < row_group_size:
+            continue
+        if writer is None:
+            writer = pq.ParquetWriter(sink, _arrow_schema(pa, row))
+        writer.write_table(pa.Table.from_pylist(batch, schema=writer.schema))
+        batch = []
+        yield sink.drain()
+    if batch:
+        if writer is None:
+            writer = pq.ParquetWriter(sink, _arrow_schema(pa, batch[0]))
+        writer.write_table(pa.Table.from_pylist(batch, schema=writer.schema))
+    if writer is not None:
+        writer.close()
+        yield sink.drain()
+
+
+WRITERS = {'csv': iter_csv, 'ndjson': iter_ndjson, 'parquet': iter_parquet}
+
+
+def export_stream(fmt, **kwargs):
+    if fmt not in WRITERS:
+        raise ExportError(f'Неизвестный формат: {fmt}')
+    if fmt == 'parquet':
+        _pyarrow()
+    rows = export_rows(**kwargs)
+    logger.info(f"Выгрузка {kwargs.get('kind', 'orders')} в {fmt}")
+    return WRITERS[fmt](rows)
@@ -0,0 +1,138 @@
+from collections import Counter
+from decimal import Decimal
+
+from django.db.models import BooleanField, Case, Count, IntegerField, Q, Value, When
+
+from .filters import filter_tours, parse_number
+from .models import CatalogEntry, Hotel, TourPackage
+
+PRICE_BUCKETS = (50000, 100000, 200000, 500000)
+# интервалы цен (low, high]: граница входит в нижний интервал, цены хранятся с копейками
+PRICE_STEP = Decimal('0.01')
+
+# Измерение фасета -> (ключ в словаре фильтров каталога, поле CatalogEntry)
+FACET_FILTERS = {
+    'country': ('country_id', 'country_id'),
+    'stars': ('hotel_class', 'stars'),
+    'duration': ('duration', 'duration_weeks'),
+    'hot': ('is_hot', 'is_hot_deal'),
+}
+
+
+def _price_bucket():
+    whens = [When(price__lte=bound, then=Value(i)) for i, bound in enumerate(PRICE_BUCKETS)]
+    return Case(*whens, default=Value(len(PRICE_BUCKETS)), output_field=IntegerField())
+
+
+def _price_range(filters):
+    """Условие на цену из price_min/price_max или None, если цена не выбрана."""
+    price_min = parse_number(filters.get('price_min'), Decimal)
+    price_max = parse_number(filters.get('price_max'), Decimal)
+    if price_min is None and price_max is None:
+        return None
+    condition = Q()
+    if price_min is not None:
+        condition &= Q(price__gte=price_min)
+    if price_max is not None:
+        condition &= Q(price__lte=price_max)
+    return condition
+
+
+def facet_queryset(filters):
+    """Один GROUP BY по всем измерениям; фильтры самих фасетов не применяются,
+    чтобы по каждому измерению можно было посчитать альтернативы.
+
+    Выбранный диапазон цен тоже не фильтрует, а попадает в группировку
+    признаком in_price.
+    """
+    cleared = {key: None for key, _ in FACET_FILTERS.values()}
+    base_filters = dict(filters, price_min=None, price_max=None, **cleared)
+    tours = filter_tours(CatalogEntry.objects.all(), base_filters)
+    price_range = _price_range(filters)
+    if price_range is None:
+        in_price = Value(True, output_field=BooleanField())
+    else:
+        in_price = Case(When(price_range, then=Value(True)), default=Value(False), output_field=BooleanField())
+    return (
+        tours.order_by()
+        .values(*(field for _, field in FACET_FILTERS.values()), bucket=_price_bucket(), in_price=in_price)
+        .annotate(total=Count('pk'))
+    )
+
+
+def _selected(filters):
+    selected = {}
+    for dimension, (key, _) in FACET_FILTERS.items():
+        value = filters.get(key)
+        if not value:
+            continue
+        if dimension == 'hot':
+            selected[dimension] = True
+        elif parse_number(value) is not None:
+            selected[dimension] = parse_number(value)
+    if _price_range(filters) is not None:
+        selected['price'] = True
+    return selected
+
+
+def _bucket_label(index):
+    low = PRICE_BUCKETS[index - 1] if index else None
+    high = PRICE_BUCKETS[index] if index < len(PRICE_BUCKETS) else None
+    if low is None:
+        return f'до {high:,}'.replace(',', ' '), None, high
+    if high is None:
+        return f'от {low:,}'.replace(',', ' '), low, None
+    return f'{low:,} – {high:,}'.replace(',', ' '), low, high
+
+
+def build_facets(rows, filters, countries, params=None):
+    selected = _selected(filters)
+    counts = {dimension: Counter() for dimension in (*FACET_FILTERS, 'bucket')}
+    total = 0
+    for row in rows:
+        values = {dimension: row[field] for dimension, (_, field) in FACET_FILTERS.items()}
+        values['price'] = row['in_price']
+        # строка учитывается в фасете, если проходит фильтры всех остальных измерений
+        misses = [dimension for dimension, value in selected.items() if values[dimension] != value]
+        if not misses:
+            total += row['total']
+        if not misses or misses == ['price']:
+            counts['bucket'][row['bucket']] += row['total']
+        for dimension in FACET_FILTERS:
+            if not misses or misses == [dimension]:
+                counts[dimension][values[dimension]] += row['total']
+
+    price = []
+    for index in range(len(PRICE_BUCKETS) + 1):
+        label, low, high = _bucket_label(index)
+        query = params.copy() if params is not None else None
+        if query is not None:
+            # price_min в фильтре включительный, поэтому ссылка начинается сразу за границей
+            query['price_min'] = low + PRICE_STEP if low else ''
+            query['price_max'] = high or ''
+        price.append({'label': label, 'count': counts['bucket'][index],
+                      'query': query.urlencode() if query is not None else ''})
+
+    return {
+        'total': total,
+        'countries': [
+            {'id': country.id, 'name': country.name, 'count': counts['country'][country.id],
+             'selected': selected.get('country') == country.id}
+            for country in countries
+        ],
+        'stars': [
+            {'value': value, 'count': counts['stars'][value], 'selected': selected.get('stars') == value}
+            for value, _ in Hotel.STAR_CHOICES
+        ],
+        'durations': [
+            {'value': value, 'label': label, 'count': counts['duration'][value],
+             'selected': selected.get('duration') == value}
+            for value, label in TourPackage.DURATION_CHOICES
+        ],
+        'hot': counts['hot'][True],
+        'price': price,
+    }
+
+
+def catalog_facets(filters, countries, params=None):
+    return build_facets(facet_queryset(filters), filters, countries, params)
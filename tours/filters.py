@@ -0,0 +1,117 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.utils.dateparse import parse_date
+
+SORT_FIELDS = ('price', '-price', 'name', 'created_at')
+DATE_MODES = ('departure', 'overlap')
+MAX_FLEX_DAYS = 7
+NUMERIC_FILTERS = {'price_min': Decimal, 'price_max': Decimal, 'country_id': int, 'hotel_class': int,
+                   'duration': int, 'flex_days': int}
+
+
+def catalog_filters(params):
+    return {
+        'price_min': params.get('price_min'),
+        'price_max': params.get('price_max'),
+        'country_id': params.get('country'),
+        'hotel_class': params.get('hotel_class'),
+        'duration': params.get('duration'),
+        'is_hot': params.get('is_hot'),
+        'service': params.get('service'),
+        'search_query': params.get('search'),
+        'sort_by': params.get('sort_by'),
+        'date_from': params.get('date_from'),
+        'date_to': params.get('date_to'),
+        'date_mode': params.get('date_mode'),
+        'flex_days': params.get('flex_days'),
+    }
+
+
+def parse_number(raw, cast=int):
+    """Число из параметра запроса или None, если параметра нет или он некорректен."""
+    if not raw:
+        return None
+    try:
+        value = cast(raw)
+    except (ValueError, ArithmeticError):
+        return None
+    if isinstance(value, Decimal) and not value.is_finite():
+        return None
+    return value
+
+
+def parse_day(raw):
+    try:
+        return parse_date(raw or '')
+    except ValueError:
+        # формат верный, но такой даты нет: 2024-02-30
+        return None
+
+
+def _shift(day, delta):
+    try:
+        return day + delta
+    except OverflowError:
+        return day
+
+
+def invalid_filters(filters):
+    """Ключи фильтров с некорректными значениями: filter_tours их пропускает."""
+    invalid = [key for key, cast in NUMERIC_FILTERS.items()
+               if filters.get(key) and parse_number(filters[key], cast) is None]
+    invalid += [key for key in ('date_from', 'date_to') if filters.get(key) and parse_day(filters[key]) is None]
+    return invalid
+
+
+def filter_tours(tours, filters):
+    """Применяет фильтры каталога; некорректные числа и даты не учитываются."""
+    price_min = parse_number(filters['price_min'], Decimal)
+    if price_min is not None:
+        tours = tours.filter(price__gte=price_min)
+    price_max = parse_number(filters['price_max'], Decimal)
+    if price_max is not None:
+        tours = tours.filter(price__lte=price_max)
+    country_id = parse_number(filters['country_id'])
+    if country_id is not None:
+        tours = tours.filter(country_id=country_id)
+    hotel_class = parse_number(filters['hotel_class'])
+    if hotel_class is not None:
+        tours = tours.filter(stars=hotel_class)
+    duration = parse_number(filters.get('duration'))
+    if duration is not None:
+        tours = tours.filter(duration_weeks=duration)
+    if filters['is_hot']:
+        tours = tours.filter(is_hot_deal=True)
+    if filters['service']:
+        tours = tours.filter(additional_services__icontains=filters['service'])
+    if filters['search_query']:
+        tours = tours.filter(name__icontains=filters['search_query'])
+    date_from, date_to = parse_day(filters.get('date_from')), parse_day(filters.get('date_to'))
+    if date_from or date_to:
+        tours = filter_dates(tours, date_from, date_to, filters.get('date_mode'),
+                             parse_number(filters.get('flex_days')) or 0)
+    return tours
+
+
+def filter_dates(tours, date_from=None, date_to=None, mode='departure', flex_days=0):
+    # departure — тур начинается в интервале, overlap — тур пересекается с интервалом;
+    # flex_days расширяет интервал в обе стороны
+    flex = timedelta(days=max(0, min(flex_days, MAX_FLEX_DAYS)))
+    if mode == 'overlap':
+        if date_from:
+            tours = tours.filter(end_date__gte=_shift(date_from, -flex))
+        if date_to:
+            tours = tours.filter(start_date__lte=_shift(date_to, flex))
+    else:
+        if date_from:
+            tours = tours.filter(start_date__gte=_shift(date_from, -flex))
+        if date_to:
+            tours = tours.filter(start_date__lte=_shift(date_to, flex))
+    return tours
+
+
+def sort_tours(tours, sort_by):
+    if sort_by in SORT_FIELDS:
+        tours = tours.order_by(sort_by)
+    return tours
@@ -1,5 +1,6 @@
 from django import forms
-from .models import ClientProfile, CompanyHistoryItem
+from .models import ClientProfile, CompanyHistoryItem, Order, TourPackage
+from .widgets import AutocompleteSelect, AutocompleteSelectMultiple
 from django.core.exceptions import ValidationError
 
 class ClientProfileForm(forms.ModelForm):
@@ -28,4 +29,33 @@ class CompanyHistoryItemForm(forms.ModelForm):
         fields = ['year', 'event_description']
         widgets = {
             'event_description': forms.Textarea(attrs={'rows': 3}),
-        }
\ No newline at end of file
+        }
+
+# Формы CRUD-страниц: связанные записи выбираются через подсказки, а не списком всех строк таблицы
+class ClientProfileEditForm(forms.ModelForm):
+    class Meta:
+        model = ClientProfile
+        fields = ['user', 'patronymic', 'address', 'phone_number', 'birth_date']
+        widgets = {
+            'user': AutocompleteSelect('users'),
+        }
+
+class TourPackageForm(forms.ModelForm):
+    class Meta:
+        model = TourPackage
+        fields = ['name', 'hotel', 'client', 'duration_weeks', 'price', 'description', 'is_hot_deal',
+                  'additional_services']
+        widgets = {
+            'hotel': AutocompleteSelect('hotels'),
+            'client': AutocompleteSelect('clients'),
+        }
+
+class OrderForm(forms.ModelForm):
+    class Meta:
+        model = Order
+        fields = ['client', 'employee', 'tour_packages', 'departure_date', 'total_price', 'status']
+        widgets = {
+            'client': AutocompleteSelect('users'),
+            'employee': AutocompleteSelect('employees'),
+            'tour_packages': AutocompleteSelectMultiple('packages'),
+        }
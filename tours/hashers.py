@@ -0,0 +1,11 @@
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class ImportPasswordHasher(PBKDF2PasswordHasher):
+    """Быстрый хешер для паролей импортированных клиентов.
+
+    Стоит в PASSWORD_HASHERS не первым, поэтому при первом входе клиента
+    Django перехеширует пароль основным хешером.
+    """
+    algorithm = 'pbkdf2_sha256_import'
+    iterations = 1000
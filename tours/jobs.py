@@ -0,0 +1,172 @@
+import logging
+import os
+import random
+import socket
+import threading
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, OperationalError, close_old_connections, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger('tours')
+
+REGISTRY = {}
+
+
+def job(name=None, max_attempts=None):
+    """Регистрирует функцию как фоновую задачу; аргументы передаются через payload (JSON)."""
+    def decorator(func):
+        task_name = name or f'{func.__module__}.{func.__name__}'
+        func.job_name = task_name
+        func.max_attempts = max_attempts
+        REGISTRY[task_name] = func
+        return func
+    return decorator
+
+
+def _task_name(task):
+    return task if isinstance(task, str) else task.job_name
+
+
+def _insert(name, payload, dedup_key, run_after, max_attempts):
+    try:
+        with transaction.atomic():
+            return Job.objects.create(
+                name=name,
+                payload=payload,
+                dedup_key=dedup_key,
+                run_after=run_after or timezone.now(),
+                max_attempts=max_attempts or getattr(settings, 'TOURS_JOBS_MAX_ATTEMPTS', 5),
+            )
+    except IntegrityError:
+        if dedup_key is None:
+            raise
+        logger.debug(f'Задача {name} с ключом {dedup_key} уже в очереди')
+        return None
+
+
+def enqueue(task, payload=None, dedup_key=None, run_after=None, max_attempts=None):
+    """Ставит задачу в очередь после фиксации текущей транзакции.
+
+    Если транзакции нет, задача записывается сразу. Задача с dedup_key не
+    дублируется, пока такая же ещё ждёт в очереди.
+    """
+    name = _task_name(task)
+    if name not in REGISTRY:
+        raise ValueError(f'Неизвестная задача: {name}')
+    max_attempts = max_attempts or getattr(REGISTRY[name], 'max_attempts', None)
+    transaction.on_commit(lambda: _insert(name, payload or {}, dedup_key, run_after, max_attempts))
+
+
+def _claim_values(worker_id, now):
+    return {'status': Job.RUNNING, 'locked_by': worker_id, 'locked_at': now, 'attempts': F('attempts') + 1}
+
+
+def claim(worker_id, now=None):
+    """Забирает одну готовую задачу так, чтобы её не взял другой обработчик."""
+    now = now or timezone.now()
+    ready = Job.objects.filter(status=Job.QUEUED, run_after__lte=now).order_by('run_after', 'id')
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            pk = ready.select_for_update(skip_locked=True).values_list('pk', flat=True).first()
+            if pk is None:
+                return None
+            Job.objects.filter(pk=pk).update(**_claim_values(worker_id, now))
+    else:
+        # SQLite: условный UPDATE по статусу, забирает тот, у кого он изменил строку
+        for pk in ready.values_list('pk', flat=True)[:10]:
+            if Job.objects.filter(pk=pk, status=Job.QUEUED).update(**_claim_values(worker_id, now)):
+                break
+        else:
+            return None
+    return Job.objects.get(pk=pk)
+
+
+def retry_delay(attempts):
+    base = getattr(settings, 'TOURS_JOBS_RETRY_BASE', 5)
+    cap = getattr(settings, 'TOURS_JOBS_RETRY_MAX', 3600)
+    return min(cap, base * 2 ** (attempts - 1)) + random.uniform(0, base)
+
+
+def run_job(job):
+    func = REGISTRY.get(job.name)
+    try:
+        if func is None:
+            raise LookupError(f'Задача {job.name} не зарегистрирована')
+        func(**job.payload)
+    except Exception:
+        error = traceback.format_exc()
+        now = timezone.now()
+        if job.attempts >= job.max_attempts:
+            logger.error(f'Задача {job} завершилась ошибкой после {job.attempts} попыток')
+            Job.objects.filter(pk=job.pk).update(status=Job.FAILED, last_error=error, finished_at=now)
+        else:
+            delay = retry_delay(job.attempts)
+            logger.warning(f'Задача {job} упала, повтор через {delay:.0f} с')
+            try:
+                with transaction.atomic():
+                    Job.objects.filter(pk=job.pk).update(status=Job.QUEUED, last_error=error,
+                                                         run_after=now + timedelta(seconds=delay))
+            except IntegrityError:
+                # пока задача выполнялась, такую же поставили в очередь заново — повтор не нужен
+                Job.objects.filter(pk=job.pk).update(status=Job.FAILED, last_error=error, finished_at=now)
+        return False
+    Job.objects.filter(pk=job.pk).update(status=Job.DONE, finished_at=timezone.now())
+    return True
+
+
+def requeue_stale(now=None):
+    """Возвращает в очередь задачи, обработчик которых пропал, не завершив их."""
+    now = now or timezone.now()
+    timeout = timedelta(seconds=getattr(settings, 'TOURS_JOBS_LOCK_TIMEOUT', 15 * 60))
+    stale = Job.objects.filter(status=Job.RUNNING, locked_at__lt=now - timeout)
+    requeued = 0
+    for pk in stale.values_list('pk', flat=True):
+        try:
+            with transaction.atomic():
+                requeued += Job.objects.filter(pk=pk, status=Job.RUNNING).update(status=Job.QUEUED, locked_by='')
+        except IntegrityError:
+            # такая же задача уже снова в очереди
+            Job.objects.filter(pk=pk).update(status=Job.FAILED, last_error='Прервана, заменена новой')
+    return requeued
+
+
+def prune_finished(now=None):
+    now = now or timezone.now()
+    keep = timedelta(days=getattr(settings, 'TOURS_JOBS_KEEP_DAYS', 7))
+    deleted, _ = Job.objects.filter(status__in=[Job.DONE, Job.FAILED], finished_at__lt=now - keep).delete()
+    return deleted
+
+
+def worker_id():
+    return f'{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}'
+
+
+def work(stop=None, poll_interval=1.0, once=False):
+    """Цикл обработчика: берёт задачи по одной, пока не выставлен stop (или очередь пуста при once)."""
+    stop = stop or threading.Event()
+    me = worker_id()
+    done = 0
+    while not stop.is_set():
+        close_old_connections()
+        try:
+            current = claim(me)
+        except OperationalError as e:
+            # SQLite может быть занят записью другого обработчика
+            logger.warning(f'Не удалось взять задачу: {e}')
+            stop.wait(poll_interval)
+            continue
+        if current is None:
+            if once:
+                break
+            stop.wait(poll_interval)
+            continue
+        run_job(current)
+        done += 1
+    close_old_connections()
+    return done
@@ -0,0 +1,17 @@
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """Возвращает модуль, который реально загрузится при первом обращении к атрибуту."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f'Модуль {name} не найден', name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tours.archive import archive_history, cold_orders, cold_tour_packages
+
+
+class Command(BaseCommand):
+    help = ('Переносит завершенные и отмененные заказы и прошедшие путевки в архивные таблицы. '
+            'Запускается по расписанию (cron) или сам повторяется с --every')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None)
+        parser.add_argument('--pause', type=float, default=0,
+                            help='Пауза между пакетами в секундах')
+        parser.add_argument('--dry-run', action='store_true', help='Только посчитать холодные записи')
+        parser.add_argument('--every', type=float, default=None,
+                            help='Повторять архивацию каждые N секунд')
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            self.stdout.write(f'Заказов к архивации: {cold_orders().count()}, '
+                              f'путевок (без учета архивируемых заказов): {cold_tour_packages().count()}')
+            return
+        while True:
+            moved = archive_history(options['batch_size'], options['pause'])
+            self.stdout.write(self.style.SUCCESS(
+                f"Архивировано заказов: {moved['orders']}, путевок: {moved['tour_packages']}"))
+            if not options['every']:
+                break
+            time.sleep(options['every'])
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from tours.recommendations import build_similar_tours
+
+
+class Command(BaseCommand):
+    help = ('Пересчитывает похожие путевки для страниц путевок. '
+            'Запускается по расписанию (cron), например раз в сутки')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=None, help='Сколько похожих путевок хранить для каждой')
+
+    def handle(self, *args, **options):
+        created = build_similar_tours(options['count'])
+        self.stdout.write(self.style.SUCCESS(f'Сохранено связей: {created}'))
@@ -0,0 +1,56 @@
+from urllib.parse import parse_qs
+
+from django.core.management.base import BaseCommand, CommandError
+from django.http import QueryDict
+
+from tours.bulk import BulkError, deactivate_promocodes, expired_promocodes, reprice_packages, set_hot_deal
+from tours.filters import catalog_filters, filter_tours
+from tours.models import CatalogEntry, TourPackage
+
+
+class Command(BaseCommand):
+    help = ('Массовые изменения одним UPDATE: цены и горящие путевки по фильтрам каталога, '
+            'деактивация просроченных промокодов')
+
+    def add_arguments(self, parser):
+        actions = parser.add_subparsers(dest='action', required=True)
+        reprice = actions.add_parser('reprice', help='Изменить цену на процент')
+        reprice.add_argument('percent', help='Например 10 или -5.5')
+        hot = actions.add_parser('hot', help='Отметить путевки как горящие (или снять отметку с --off)')
+        hot.add_argument('--off', action='store_true')
+        for sub in (reprice, hot):
+            sub.add_argument('--filter', default='',
+                             help='Фильтр в формате запроса каталога, например "country=3&hotel_class=5"')
+            sub.add_argument('--dry-run', action='store_true', help='Только показать число записей')
+        promocodes = actions.add_parser('deactivate-promocodes', help='Деактивировать просроченные промокоды')
+        promocodes.add_argument('--dry-run', action='store_true')
+
+    def _packages(self, raw_filter):
+        unknown = set(parse_qs(raw_filter)) - {'price_min', 'price_max', 'country', 'hotel_class', 'duration',
+                                               'is_hot', 'service', 'search', 'date_from', 'date_to',
+                                               'date_mode', 'flex_days'}
+        if unknown:
+            raise CommandError(f"Неизвестные параметры фильтра: {', '.join(sorted(unknown))}")
+        entries = filter_tours(CatalogEntry.objects.all(), catalog_filters(QueryDict(raw_filter)))
+        return TourPackage.objects.filter(pk__in=entries.values('package_id'))
+
+    def handle(self, *args, **options):
+        action = options['action']
+        if action == 'deactivate-promocodes':
+            queryset = expired_promocodes()
+        else:
+            queryset = self._packages(options['filter'])
+
+        if options['dry_run']:
+            self.stdout.write(f'Будет изменено записей: {queryset.count()}')
+            return
+        try:
+            if action == 'reprice':
+                affected = reprice_packages(queryset, options['percent'])
+            elif action == 'hot':
+                affected = set_hot_deal(queryset, not options['off'])
+            else:
+                affected = deactivate_promocodes(queryset)
+        except BulkError as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS(f'Изменено записей: {affected}'))
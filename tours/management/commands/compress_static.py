@@ -0,0 +1,33 @@
+import mimetypes
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from tours.compression import COMPRESSIBLE_TYPES, STATIC_SUFFIXES, available_encodings, precompress_file
+
+
+class Command(BaseCommand):
+    help = 'Создаёт рядом со статическими файлами сжатые варианты (.br, .zst, .gz) после collectstatic'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--root', default=None, help='Каталог со статикой (по умолчанию STATIC_ROOT)')
+        parser.add_argument('--min-size', type=int, default=None)
+
+    def handle(self, *args, **options):
+        root = options['root'] or settings.STATIC_ROOT
+        if not root or not os.path.isdir(root):
+            raise CommandError(f'Каталог статики {root} не найден, сначала выполните collectstatic')
+        encodings = available_encodings()
+        files = written = 0
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.endswith(tuple(STATIC_SUFFIXES.values())):
+                    continue
+                content_type, _ = mimetypes.guess_type(filename)
+                if content_type not in COMPRESSIBLE_TYPES:
+                    continue
+                files += 1
+                written += len(precompress_file(os.path.join(dirpath, filename), encodings, options['min_size']))
+        self.stdout.write(self.style.SUCCESS(
+            f'Обработано файлов: {files}, создано сжатых вариантов: {written} ({", ".join(encodings)})'))
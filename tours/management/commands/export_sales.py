@@ -0,0 +1,50 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tours.exports import EXPORTS, WRITERS, ExportError, export_rows
+
+
+class Command(BaseCommand):
+    help = 'Потоково выгружает заказы или путевки в CSV, NDJSON или Parquet с постоянным расходом памяти'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', choices=sorted(EXPORTS), default='orders')
+        parser.add_argument('--format', choices=sorted(WRITERS), default='csv')
+        parser.add_argument('--date-from', help='Начало периода, ГГГГ-ММ-ДД')
+        parser.add_argument('--date-to', help='Конец периода включительно, ГГГГ-ММ-ДД')
+        parser.add_argument('--after', type=int, default=None,
+                            help='Продолжить выгрузку после записи с этим id')
+        parser.add_argument('--chunk-size', type=int, default=None)
+        parser.add_argument('--output', '-o', help='Файл для выгрузки (по умолчанию stdout)')
+
+    def handle(self, *args, **options):
+        progress = {'count': 0, 'last_id': options['after']}
+
+        def tracked(rows):
+            for row in rows:
+                progress['count'] += 1
+                progress['last_id'] = row['id']
+                yield row
+
+        try:
+            rows = export_rows(options['kind'], options['date_from'], options['date_to'], options['after'],
+                               options['chunk_size'])
+            chunks = WRITERS[options['format']](tracked(rows))
+            out = open(options['output'], 'wb') if options['output'] else sys.stdout.buffer
+            try:
+                for chunk in chunks:
+                    out.write(chunk)
+            finally:
+                if options['output']:
+                    out.close()
+                else:
+                    out.flush()
+        except ExportError as e:
+            raise CommandError(str(e))
+        finally:
+            # куда дошли — печатаем и при ошибке, чтобы выгрузку можно было продолжить
+            self.stderr.write(
+                f"Выгружено записей: {progress['count']}, последний id: {progress['last_id']}"
+                + (f" (продолжить: --after {progress['last_id']})" if progress['count'] else ''))
+        self.stderr.write(self.style.SUCCESS('Выгрузка завершена'))
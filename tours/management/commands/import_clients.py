@@ -0,0 +1,41 @@
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tours.client_import import ClientImportError, import_clients
+
+
+class Command(BaseCommand):
+    help = ('Импортирует клиентов (пользователь + профиль) из CSV пачками. Строки с ошибками '
+            'пропускаются и перечисляются в отчете, остальные создаются')
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV с колонками username, address, phone_number, birth_date '
+                                         'и необязательными email, first_name, last_name, patronymic, password')
+        parser.add_argument('--chunk-size', type=int, default=None)
+        parser.add_argument('--encoding', default='utf-8-sig')
+        parser.add_argument('--errors', help='Записать ошибки в CSV (по умолчанию в stderr)')
+        parser.add_argument('--dry-run', action='store_true', help='Только проверить файл')
+
+    def handle(self, *args, **options):
+        report = open(options['errors'], 'w', newline='', encoding='utf-8') if options['errors'] else None
+        writer = csv.writer(report) if report else None
+        if writer:
+            writer.writerow(['line', 'error'])
+
+        def on_error(line, error):
+            if writer:
+                writer.writerow([line, error])
+            else:
+                self.stderr.write(f'Строка {line}: {error}')
+
+        try:
+            with open(options['path'], newline='', encoding=options['encoding']) as stream:
+                result = import_clients(stream, options['chunk_size'], options['dry_run'], on_error=on_error)
+        except (ClientImportError, OSError) as e:
+            raise CommandError(str(e))
+        finally:
+            if report:
+                report.close()
+        message = f"Строк: {result['rows']}, создано клиентов: {result['created']}, пропущено: {result['skipped']}"
+        self.stdout.write(message if options['dry_run'] else self.style.SUCCESS(message))
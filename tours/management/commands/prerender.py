@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tours.prerender import build_all, page_models
+
+
+class Command(BaseCommand):
+    help = ('Строит статические страницы (о компании, FAQ, вакансии, новости, политика) '
+            'вместе со сжатыми вариантами')
+
+    def add_arguments(self, parser):
+        parser.add_argument('pages', nargs='*', help='Имена URL страниц (по умолчанию все из TOURS_PRERENDER_PAGES)')
+
+    def handle(self, *args, **options):
+        unknown = set(options['pages']) - set(page_models())
+        if unknown:
+            raise CommandError(f"Неизвестные страницы: {', '.join(sorted(unknown))}")
+        for path in build_all(options['pages']):
+            self.stdout.write(path)
+        self.stdout.write(self.style.SUCCESS('Страницы построены'))
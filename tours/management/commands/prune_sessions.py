@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from tours.sessions import prune_expired_sessions
+
+
+class Command(BaseCommand):
+    help = 'Удаляет просроченные сессии пакетами, не блокируя таблицу надолго'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None)
+        parser.add_argument('--pause', type=float, default=0,
+                            help='Пауза между пакетами в секундах')
+
+    def handle(self, *args, **options):
+        removed = prune_expired_sessions(options['batch_size'], options['pause'])
+        self.stdout.write(self.style.SUCCESS(f'Удалено сессий: {removed}'))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from tours.catalog_index import rebuild_catalog
+
+
+class Command(BaseCommand):
+    help = 'Полностью перестраивает денормализованный каталог (CatalogEntry) из путевок, отелей и стран'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        created = rebuild_catalog(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Записей в каталоге: {created}'))
@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tours.pricing import reprice
+
+
+class Command(BaseCommand):
+    help = ('Пересчитывает рекомендуемые цены и горящие путевки. '
+            'Запускается по расписанию (cron) или сам повторяется с --every')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None)
+        parser.add_argument('--dry-run', action='store_true', help='Только посчитать изменения')
+        parser.add_argument('--every', type=float, default=None,
+                            help='Повторять пересчет каждые N секунд')
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.monotonic()
+            result = reprice(batch_size=options['batch_size'], dry_run=options['dry_run'])
+            message = (f"Путевок: {result['total']}, изменится цен и флагов: {result['changed']}, "
+                       f"горящих: {result['hot']} ({time.monotonic() - started:.1f} с)")
+            self.stdout.write(message if options['dry_run'] else self.style.SUCCESS(message))
+            if not options['every']:
+                break
+            time.sleep(options['every'])
@@ -0,0 +1,92 @@
+import logging
+import multiprocessing
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from tours.jobs import prune_finished, requeue_stale, work
+
+logger = logging.getLogger('tours')
+
+MAINTENANCE_INTERVAL = 60
+
+
+def _run_threads(threads, poll_interval, once, stop=None):
+    stop = stop or threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *args: stop.set())
+        signal.signal(signal.SIGINT, lambda *args: stop.set())
+    if threads == 1:
+        work(stop, poll_interval, once)
+        return stop
+    pool = [threading.Thread(target=work, args=(stop, poll_interval, once), daemon=True) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        # join с таймаутом, чтобы главный поток успевал обработать сигнал
+        while thread.is_alive():
+            thread.join(0.5)
+    return stop
+
+
+def _process_main(threads, poll_interval, once):
+    import django
+
+    django.setup()
+    _run_threads(threads, poll_interval, once)
+
+
+class Command(BaseCommand):
+    help = 'Запускает обработчики фоновых задач из очереди в БД (процессы x потоки)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=1)
+        parser.add_argument('--threads', type=int, default=2)
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help='Пауза в секундах, когда очередь пуста')
+        parser.add_argument('--once', action='store_true', help='Выполнить готовые задачи и выйти')
+
+    def handle(self, *args, **options):
+        processes, threads = options['processes'], options['threads']
+        poll_interval, once = options['poll_interval'], options['once']
+        requeue_stale()
+        self.stdout.write(self.style.SUCCESS(f'Обработчики задач: {processes} процесс(ов) x {threads} поток(ов)'))
+
+        stop = threading.Event()
+        maintenance = threading.Thread(target=self._maintenance, args=(stop,), daemon=True)
+        if not once:
+            maintenance.start()
+
+        if processes <= 1:
+            _run_threads(threads, poll_interval, once, stop)
+        else:
+            # соединения с БД не должны переходить в дочерние процессы
+            connections.close_all()
+            children = [
+                multiprocessing.Process(target=_process_main, args=(threads, poll_interval, once))
+                for _ in range(processes)
+            ]
+            for child in children:
+                child.start()
+            signal.signal(signal.SIGTERM, lambda *args: stop.set())
+            signal.signal(signal.SIGINT, lambda *args: stop.set())
+            while any(child.is_alive() for child in children) and not stop.is_set():
+                stop.wait(0.5)
+            for child in children:
+                if child.is_alive():
+                    child.terminate()
+                child.join()
+        stop.set()
+        self.stdout.write(self.style.SUCCESS('Обработчики остановлены'))
+
+    def _maintenance(self, stop):
+        while not stop.wait(MAINTENANCE_INTERVAL):
+            try:
+                requeued = requeue_stale()
+                pruned = prune_finished()
+                if requeued or pruned:
+                    logger.info(f'Очередь задач: возвращено {requeued}, удалено завершенных {pruned}')
+            except Exception:
+                logger.exception('Ошибка обслуживания очереди задач')
@@ -0,0 +1,37 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Запускает проект под uvicorn (ASGI) с асинхронными версиями публичных страниц'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8000)
+        parser.add_argument('--workers', type=int, default=1)
+        parser.add_argument('--reload', action='store_true')
+        parser.add_argument('--wsgi', action='store_true',
+                            help='Обслуживать синхронное WSGI-приложение (для сравнения)')
+
+    def handle(self, *args, **options):
+        try:
+            import uvicorn
+        except ImportError:
+            raise CommandError('Для запуска нужен пакет uvicorn: pip install uvicorn')
+
+        if options['wsgi']:
+            app, interface = 'travel_agency.wsgi:application', 'wsgi'
+        else:
+            os.environ['TOURS_ASYNC_VIEWS'] = '1'
+            app, interface = 'travel_agency.asgi:application', 'asgi3'
+
+        uvicorn.run(
+            app,
+            host=options['host'],
+            port=options['port'],
+            workers=options['workers'],
+            reload=options['reload'],
+            interface=interface,
+            log_level='warning',
+        )
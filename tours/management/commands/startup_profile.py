@@ -0,0 +1,82 @@
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+PROBE = """
+import json, os, resource, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+for name in sys.argv[1:]:
+    __import__(name)
+elapsed = time.perf_counter() - start
+rss_kb = None
+try:
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                rss_kb = int(line.split()[1])
+except OSError:
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({'elapsed': elapsed, 'rss_kb': rss_kb, 'module_count': len(sys.modules)}))
+"""
+
+
+def parse_importtime(stderr):
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+class Command(BaseCommand):
+    help = 'Показывает время импорта модулей (-X importtime) и RSS процесса после django.setup()'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=20)
+        parser.add_argument('--import', dest='modules', nargs='*', default=[settings.ROOT_URLCONF],
+                            help='Модули, импортируемые после django.setup() (по умолчанию ROOT_URLCONF)')
+        parser.add_argument('--json', action='store_true', help='Вывести результат в JSON')
+
+    def handle(self, *args, **options):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'travel_agency.settings'))
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', PROBE, *options['modules']],
+            capture_output=True, text=True, env=env, cwd=settings.BASE_DIR,
+        )
+        if proc.returncode != 0:
+            raise CommandError(proc.stderr.strip().splitlines()[-1])
+
+        summary = json.loads(proc.stdout.strip().splitlines()[-1])
+        rows = parse_importtime(proc.stderr)
+        by_package = defaultdict(int)
+        for name, self_us, _ in rows:
+            by_package[name.split('.')[0]] += self_us
+        top = options['top']
+        packages = sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+        modules = sorted(rows, key=lambda row: row[2], reverse=True)[:top]
+
+        if options['json']:
+            summary.update({
+                'packages': [{'name': name, 'self_ms': us / 1000} for name, us in packages],
+                'modules': [{'name': name, 'cumulative_ms': cum / 1000} for name, _, cum in modules],
+            })
+            self.stdout.write(json.dumps(summary, ensure_ascii=False, indent=2))
+            return
+
+        self.stdout.write(f"Запуск: {summary['elapsed'] * 1000:.0f} мс, "
+                          f"RSS: {summary['rss_kb'] / 1024:.1f} МБ, модулей: {summary['module_count']}")
+        self.stdout.write('\nПакеты по собственному времени импорта:')
+        for name, us in packages:
+            self.stdout.write(f'  {us / 1000:9.1f} мс  {name}')
+        self.stdout.write('\nМодули по суммарному времени импорта:')
+        for name, _, cum in modules:
+            self.stdout.write(f'  {cum / 1000:9.1f} мс  {name}')
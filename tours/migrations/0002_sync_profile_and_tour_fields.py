@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:02
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tours', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='clientprofile',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now, verbose_name='Дата создания'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='clientprofile',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Дата обновления'),
+        ),
+        migrations.AddField(
+            model_name='employeeprofile',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now, verbose_name='Дата создания'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='employeeprofile',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Дата обновления'),
+        ),
+        migrations.AddField(
+            model_name='tourpackage',
+            name='client',
+            field=models.ForeignKey(default=1, on_delete=django.db.models.deletion.CASCADE, related_name='tour_packages', to='tours.clientprofile', verbose_name='Клиент'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='tourpackage',
+            name='end_date',
+            field=models.DateField(blank=True, null=True, verbose_name='Дата окончания тура'),
+        ),
+        migrations.AddField(
+            model_name='tourpackage',
+            name='start_date',
+            field=models.DateField(blank=True, null=True, verbose_name='Дата начала тура'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tours', '0002_sync_profile_and_tour_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tourpackage',
+            index=models.Index(fields=['start_date', 'end_date'], name='tour_dates_idx'),
+        ),
+    ]
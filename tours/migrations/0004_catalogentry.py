@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_catalog(apps, schema_editor):
+    CatalogEntry = apps.get_model('tours', 'CatalogEntry')
+    Hotel = apps.get_model('tours', 'Hotel')
+    TourPackage = apps.get_model('tours', 'TourPackage')
+    hotels = {hotel.pk: hotel for hotel in Hotel.objects.select_related('country')}
+    entries = []
+    for package in TourPackage.objects.iterator(chunk_size=2000):
+        hotel = hotels[package.hotel_id]
+        entries.append(CatalogEntry(
+            package_id=package.pk,
+            name=package.name,
+            price=package.price,
+            duration_weeks=package.duration_weeks,
+            is_hot_deal=package.is_hot_deal,
+            additional_services=package.additional_services,
+            start_date=package.start_date,
+            end_date=package.end_date,
+            created_at=package.created_at,
+            hotel_id=hotel.pk,
+            hotel_name=hotel.name,
+            stars=hotel.stars,
+            thumbnail_url=hotel.photo.url if hotel.photo else '',
+            country_id=hotel.country_id,
+            country_name=hotel.country.name,
+        ))
+    CatalogEntry.objects.bulk_create(entries, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tours', '0003_tourpackage_dates_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogEntry',
+            fields=[
+                ('package', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='catalog_entry', serialize=False, to='tours.tourpackage', verbose_name='Путевка')),
+                ('name', models.CharField(max_length=255, verbose_name='Название путевки')),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Стоимость путевки')),
+                ('duration_weeks', models.PositiveSmallIntegerField(verbose_name='Длительность (недели)')),
+                ('is_hot_deal', models.BooleanField(default=False, verbose_name='Горящая путевка')),
+                ('additional_services', models.TextField(blank=True, verbose_name='Дополнительные услуги')),
+                ('start_date', models.DateField(blank=True, null=True, verbose_name='Дата начала тура')),
+                ('end_date', models.DateField(blank=True, null=True, verbose_name='Дата окончания тура')),
+                ('hotel_id', models.BigIntegerField(verbose_name='ID отеля')),
+                ('hotel_name', models.CharField(max_length=200, verbose_name='Название отеля')),
+                ('stars', models.PositiveSmallIntegerField(verbose_name='Количество звезд')),
+                ('thumbnail_url', models.CharField(blank=True, max_length=255, verbose_name='Фото отеля')),
+                ('country_id', models.BigIntegerField(verbose_name='ID страны')),
+                ('country_name', models.CharField(max_length=100, verbose_name='Название страны')),
+                ('created_at', models.DateTimeField(verbose_name='Дата создания')),
+            ],
+            options={
+                'verbose_name': 'Запись каталога',
+                'verbose_name_plural': 'Записи каталога',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['country_id', 'stars', 'price'], name='catalog_country_stars_idx'), models.Index(fields=['price'], name='catalog_price_idx'), models.Index(fields=['is_hot_deal', 'price'], name='catalog_hot_idx'), models.Index(fields=['start_date', 'end_date'], name='catalog_dates_idx'), models.Index(fields=['hotel_id'], name='catalog_hotel_idx'), models.Index(fields=['created_at'], name='catalog_created_idx')],
+            },
+        ),
+        migrations.RunPython(fill_catalog, migrations.RunPython.noop),
+    ]
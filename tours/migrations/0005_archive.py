@@ -0,0 +1,118 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:20
+
+from django.db import migrations, models
+
+TOURPACKAGE_HISTORY_SQL = '''
+CREATE VIEW tours_tourpackage_history AS
+SELECT id, name, hotel_id, price, duration_weeks, start_date, end_date, client_id, created_at, 0 AS is_archived
+FROM tours_tourpackage
+UNION ALL
+SELECT id, name, hotel_id, price, duration_weeks, start_date, end_date, client_id, created_at, 1 AS is_archived
+FROM tours_archivedtourpackage
+'''
+
+ORDER_HISTORY_SQL = '''
+CREATE VIEW tours_order_history AS
+SELECT id, client_id, employee_id, order_date, departure_date, total_price, status, 0 AS is_archived
+FROM tours_order
+UNION ALL
+SELECT id, client_id, employee_id, order_date, departure_date, total_price, status, 1 AS is_archived
+FROM tours_archivedorder
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tours', '0004_catalogentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderHistory',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('client_id', models.BigIntegerField()),
+                ('employee_id', models.BigIntegerField(null=True)),
+                ('order_date', models.DateTimeField()),
+                ('departure_date', models.DateField()),
+                ('total_price', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('status', models.CharField(choices=[('pending', 'В ожидании'), ('confirmed', 'Подтвержден'), ('paid', 'Оплачен'), ('cancelled', 'Отменен')], max_length=20)),
+                ('is_archived', models.BooleanField()),
+            ],
+            options={
+                'verbose_name': 'Заказ (с архивом)',
+                'verbose_name_plural': 'Заказы (с архивом)',
+                'db_table': 'tours_order_history',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TourPackageHistory',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('hotel_id', models.BigIntegerField()),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('duration_weeks', models.PositiveSmallIntegerField()),
+                ('start_date', models.DateField(null=True)),
+                ('end_date', models.DateField(null=True)),
+                ('client_id', models.BigIntegerField()),
+                ('created_at', models.DateTimeField()),
+                ('is_archived', models.BooleanField()),
+            ],
+            options={
+                'verbose_name': 'Путевка (с архивом)',
+                'verbose_name_plural': 'Путевки (с архивом)',
+                'db_table': 'tours_tourpackage_history',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedOrder',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('client_id', models.BigIntegerField(verbose_name='ID клиента')),
+                ('employee_id', models.BigIntegerField(blank=True, null=True, verbose_name='ID сотрудника')),
+                ('tour_package_ids', models.JSONField(default=list, verbose_name='ID путевок')),
+                ('order_date', models.DateTimeField(verbose_name='Дата заказа')),
+                ('departure_date', models.DateField(verbose_name='Дата отправления')),
+                ('total_price', models.DecimalField(decimal_places=2, max_digits=12, verbose_name='Общая стоимость')),
+                ('status', models.CharField(choices=[('pending', 'В ожидании'), ('confirmed', 'Подтвержден'), ('paid', 'Оплачен'), ('cancelled', 'Отменен')], max_length=20, verbose_name='Статус заказа')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата архивации')),
+            ],
+            options={
+                'verbose_name': 'Архивный заказ',
+                'verbose_name_plural': 'Архивные заказы',
+                'ordering': ['-order_date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedTourPackage',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255, verbose_name='Название путевки')),
+                ('hotel_id', models.BigIntegerField(verbose_name='ID отеля')),
+                ('hotel_name', models.CharField(max_length=200, verbose_name='Название отеля')),
+                ('country_name', models.CharField(max_length=100, verbose_name='Название страны')),
+                ('duration_weeks', models.PositiveSmallIntegerField(verbose_name='Длительность (недели)')),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Стоимость путевки')),
+                ('description', models.TextField(blank=True, verbose_name='Описание')),
+                ('is_hot_deal', models.BooleanField(default=False, verbose_name='Горящая путевка')),
+                ('additional_services', models.TextField(blank=True, verbose_name='Дополнительные услуги')),
+                ('start_date', models.DateField(blank=True, null=True, verbose_name='Дата начала тура')),
+                ('end_date', models.DateField(blank=True, null=True, verbose_name='Дата окончания тура')),
+                ('client_id', models.BigIntegerField(verbose_name='ID клиента')),
+                ('created_at', models.DateTimeField(verbose_name='Дата создания')),
+                ('updated_at', models.DateTimeField(verbose_name='Дата обновления')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата архивации')),
+            ],
+            options={
+                'verbose_name': 'Архивная путевка',
+                'verbose_name_plural': 'Архивные путевки',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.RunSQL(TOURPACKAGE_HISTORY_SQL, 'DROP VIEW tours_tourpackage_history'),
+        migrations.RunSQL(ORDER_HISTORY_SQL, 'DROP VIEW tours_order_history'),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tours', '0006_job'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BulkChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action', models.CharField(max_length=50, verbose_name='Действие')),
+                ('model', models.CharField(max_length=100, verbose_name='Модель')),
+                ('params', models.JSONField(blank=True, default=dict, verbose_name='Параметры')),
+                ('criteria', models.TextField(blank=True, verbose_name='Условия отбора')),
+                ('affected', models.PositiveIntegerField(default=0, verbose_name='Изменено записей')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Пользователь')),
+            ],
+            options={
+                'verbose_name': 'Массовое изменение',
+                'verbose_name_plural': 'Массовые изменения',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
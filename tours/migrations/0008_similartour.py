@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tours', '0007_bulkchange'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimilarTour',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(verbose_name='Место')),
+                ('score', models.FloatField(verbose_name='Сходство')),
+                ('package', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='neighbours', to='tours.tourpackage', verbose_name='Путевка')),
+                ('similar', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='neighbour_of', to='tours.tourpackage', verbose_name='Похожая путевка')),
+            ],
+            options={
+                'verbose_name': 'Похожая путевка',
+                'verbose_name_plural': 'Похожие путевки',
+                'ordering': ['package', 'rank'],
+                'constraints': [models.UniqueConstraint(fields=('package', 'rank'), name='similar_tour_package_rank')],
+            },
+        ),
+    ]
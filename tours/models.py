@@ -9,15 +9,24 @@ from django.utils import timezone
 
 logger = logging.getLogger('tours')
 
+PHONE_RE = re.compile(r'^\+375 \(\d{2}\) \d{3}-\d{2}-\d{2}$')
+ADULT_AGE = 18
+
 def validate_phone(value):
-    pattern = r'^\+375 \(\d{2}\) \d{3}-\d{2}-\d{2}$'
-    if not re.match(pattern, value):
+    if not PHONE_RE.match(value):
         raise ValidationError('Формат телефона должен быть +375 (XX) XXX-XX-XX')
 
+def adult_birth_date_limit(today=None):
+    """Самая поздняя дата рождения совершеннолетнего на сегодня."""
+    today = today or timezone.now().date()
+    try:
+        return today.replace(year=today.year - ADULT_AGE)
+    except ValueError:
+        # 29 февраля: совершеннолетие наступает 1 марта
+        return today.replace(year=today.year - ADULT_AGE, month=3, day=1) - timedelta(days=1)
+
 def validate_adult(value):
-    today = timezone.now().date()
-    age = today.year - value.year - ((today.month, today.day) < (value.month, value.day))
-    if age < 18:
+    if value > adult_birth_date_limit():
         raise ValidationError('Пользователь должен быть старше 18 лет')
 
 class ClientProfile(models.Model):
@@ -119,6 +128,9 @@ class Hotel(models.Model):
         verbose_name = "Отель"
         verbose_name_plural = "Отели"
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['name'], name='hotel_name_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.country.name}, {self.get_stars_display()})"
@@ -152,11 +164,14 @@ class TourPackage(models.Model):
         verbose_name = "Путевка"
         verbose_name_plural = "Путевки"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['start_date', 'end_date'], name='tour_dates_idx'),
+            models.Index(fields=['name'], name='tour_name_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if self.start_date and not self.end_date and self.duration_weeks:
             self.end_date = self.start_date + timedelta(weeks=self.duration_weeks)
-        super().save(*args, **kwargs)
         try:
             super().save(*args, **kwargs)
             logger.info(f'Сохранен тур: {self.name} (ID: {self.id})')
@@ -167,6 +182,40 @@ class TourPackage(models.Model):
     def __str__(self):
         return f"{self.name} ({self.hotel.name}, {self.get_duration_weeks_display()})"
 
+class CatalogEntry(models.Model):
+    package = models.OneToOneField(TourPackage, on_delete=models.CASCADE, primary_key=True,
+                                   related_name='catalog_entry', verbose_name="Путевка")
+    name = models.CharField(max_length=255, verbose_name="Название путевки")
+    price = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Стоимость путевки")
+    duration_weeks = models.PositiveSmallIntegerField(verbose_name="Длительность (недели)")
+    is_hot_deal = models.BooleanField(default=False, verbose_name="Горящая путевка")
+    additional_services = models.TextField(blank=True, verbose_name="Дополнительные услуги")
+    start_date = models.DateField(null=True, blank=True, verbose_name="Дата начала тура")
+    end_date = models.DateField(null=True, blank=True, verbose_name="Дата окончания тура")
+    hotel_id = models.BigIntegerField(verbose_name="ID отеля")
+    hotel_name = models.CharField(max_length=200, verbose_name="Название отеля")
+    stars = models.PositiveSmallIntegerField(verbose_name="Количество звезд")
+    thumbnail_url = models.CharField(max_length=255, blank=True, verbose_name="Фото отеля")
+    country_id = models.BigIntegerField(verbose_name="ID страны")
+    country_name = models.CharField(max_length=100, verbose_name="Название страны")
+    created_at = models.DateTimeField(verbose_name="Дата создания")
+
+    class Meta:
+        verbose_name = "Запись каталога"
+        verbose_name_plural = "Записи каталога"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['country_id', 'stars', 'price'], name='catalog_country_stars_idx'),
+            models.Index(fields=['price'], name='catalog_price_idx'),
+            models.Index(fields=['is_hot_deal', 'price'], name='catalog_hot_idx'),
+            models.Index(fields=['start_date', 'end_date'], name='catalog_dates_idx'),
+            models.Index(fields=['hotel_id'], name='catalog_hotel_idx'),
+            models.Index(fields=['created_at'], name='catalog_created_idx'),
+        ]
+
+    def __str__(self):
+        return self.name
+
 class Order(models.Model):
     STATUS_CHOICES = [
         ('pending', 'В ожидании'),
@@ -191,6 +240,93 @@ class Order(models.Model):
         return f"Заказ №{self.id} от {self.client.username} ({self.order_date.strftime('%d/%m/%Y')})"
 
 
+class ArchivedTourPackage(models.Model):
+    """Путевка, вынесенная из рабочей таблицы после окончания тура."""
+    id = models.BigIntegerField(primary_key=True)
+    name = models.CharField(max_length=255, verbose_name="Название путевки")
+    hotel_id = models.BigIntegerField(verbose_name="ID отеля")
+    hotel_name = models.CharField(max_length=200, verbose_name="Название отеля")
+    country_name = models.CharField(max_length=100, verbose_name="Название страны")
+    duration_weeks = models.PositiveSmallIntegerField(verbose_name="Длительность (недели)")
+    price = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Стоимость путевки")
+    description = models.TextField(blank=True, verbose_name="Описание")
+    is_hot_deal = models.BooleanField(default=False, verbose_name="Горящая путевка")
+    additional_services = models.TextField(blank=True, verbose_name="Дополнительные услуги")
+    start_date = models.DateField(null=True, blank=True, verbose_name="Дата начала тура")
+    end_date = models.DateField(null=True, blank=True, verbose_name="Дата окончания тура")
+    client_id = models.BigIntegerField(verbose_name="ID клиента")
+    created_at = models.DateTimeField(verbose_name="Дата создания")
+    updated_at = models.DateTimeField(verbose_name="Дата обновления")
+    archived_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата архивации")
+
+    class Meta:
+        verbose_name = "Архивная путевка"
+        verbose_name_plural = "Архивные путевки"
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.name} ({self.hotel_name}, архив)"
+
+
+class ArchivedOrder(models.Model):
+    """Завершенный или отмененный заказ, вынесенный из рабочей таблицы."""
+    id = models.BigIntegerField(primary_key=True)
+    client_id = models.BigIntegerField(verbose_name="ID клиента")
+    employee_id = models.BigIntegerField(null=True, blank=True, verbose_name="ID сотрудника")
+    tour_package_ids = models.JSONField(default=list, verbose_name="ID путевок")
+    order_date = models.DateTimeField(verbose_name="Дата заказа")
+    departure_date = models.DateField(verbose_name="Дата отправления")
+    total_price = models.DecimalField(max_digits=12, decimal_places=2, verbose_name="Общая стоимость")
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES, verbose_name="Статус заказа")
+    archived_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата архивации")
+
+    class Meta:
+        verbose_name = "Архивный заказ"
+        verbose_name_plural = "Архивные заказы"
+        ordering = ['-order_date']
+
+    def __str__(self):
+        return f"Заказ №{self.id} (архив)"
+
+
+class TourPackageHistory(models.Model):
+    """Все путевки, рабочие и архивные: представление БД tours_tourpackage_history для отчетов."""
+    id = models.BigIntegerField(primary_key=True)
+    name = models.CharField(max_length=255)
+    hotel_id = models.BigIntegerField()
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    duration_weeks = models.PositiveSmallIntegerField()
+    start_date = models.DateField(null=True)
+    end_date = models.DateField(null=True)
+    client_id = models.BigIntegerField()
+    created_at = models.DateTimeField()
+    is_archived = models.BooleanField()
+
+    class Meta:
+        managed = False
+        db_table = 'tours_tourpackage_history'
+        verbose_name = "Путевка (с архивом)"
+        verbose_name_plural = "Путевки (с архивом)"
+
+
+class OrderHistory(models.Model):
+    """Все заказы, рабочие и архивные: представление БД tours_order_history для отчетов."""
+    id = models.BigIntegerField(primary_key=True)
+    client_id = models.BigIntegerField()
+    employee_id = models.BigIntegerField(null=True)
+    order_date = models.DateTimeField()
+    departure_date = models.DateField()
+    total_price = models.DecimalField(max_digits=12, decimal_places=2)
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    is_archived = models.BooleanField()
+
+    class Meta:
+        managed = False
+        db_table = 'tours_order_history'
+        verbose_name = "Заказ (с архивом)"
+        verbose_name_plural = "Заказы (с архивом)"
+
+
 class Article(models.Model):
     title = models.CharField(max_length=255, verbose_name="Заголовок")
     short_content = models.TextField(verbose_name="Краткое содержание (одно предложение)")
@@ -327,4 +463,84 @@ class CompanyRequisite(models.Model):
         verbose_name_plural = "Реквизиты компании"
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+class Job(models.Model):
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (QUEUED, 'В очереди'),
+        (RUNNING, 'Выполняется'),
+        (DONE, 'Выполнена'),
+        (FAILED, 'Ошибка'),
+    ]
+    name = models.CharField(max_length=100, verbose_name="Задача")
+    payload = models.JSONField(default=dict, blank=True, verbose_name="Аргументы")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED, verbose_name="Статус")
+    dedup_key = models.CharField(max_length=200, null=True, blank=True, verbose_name="Ключ дедупликации")
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="Попыток")
+    max_attempts = models.PositiveSmallIntegerField(default=5, verbose_name="Максимум попыток")
+    run_after = models.DateTimeField(default=timezone.now, verbose_name="Запустить не раньше")
+    locked_by = models.CharField(max_length=100, blank=True, verbose_name="Обработчик")
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name="Взята в работу")
+    last_error = models.TextField(blank=True, verbose_name="Последняя ошибка")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="Дата завершения")
+
+    class Meta:
+        verbose_name = "Фоновая задача"
+        verbose_name_plural = "Фоновые задачи"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='job_ready_idx'),
+        ]
+        constraints = [
+            # одинаковая задача стоит в очереди не больше одного раза
+            models.UniqueConstraint(fields=['dedup_key'], condition=models.Q(status='queued'),
+                                    name='job_queued_dedup_key'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.id} ({self.get_status_display()})"
+
+
+class BulkChange(models.Model):
+    """Журнал массовых изменений, выполненных одним UPDATE в обход save()."""
+    action = models.CharField(max_length=50, verbose_name="Действие")
+    model = models.CharField(max_length=100, verbose_name="Модель")
+    params = models.JSONField(default=dict, blank=True, verbose_name="Параметры")
+    criteria = models.TextField(blank=True, verbose_name="Условия отбора")
+    affected = models.PositiveIntegerField(default=0, verbose_name="Изменено записей")
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True,
+                             verbose_name="Пользователь")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата")
+
+    class Meta:
+        verbose_name = "Массовое изменение"
+        verbose_name_plural = "Массовые изменения"
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.action} ({self.model}): {self.affected}"
+
+class SimilarTour(models.Model):
+    """Заранее посчитанные похожие путевки (manage.py build_similar_tours)."""
+    package = models.ForeignKey(TourPackage, on_delete=models.CASCADE, related_name='neighbours',
+                                verbose_name="Путевка")
+    similar = models.ForeignKey(TourPackage, on_delete=models.CASCADE, related_name='neighbour_of',
+                                verbose_name="Похожая путевка")
+    rank = models.PositiveSmallIntegerField(verbose_name="Место")
+    score = models.FloatField(verbose_name="Сходство")
+
+    class Meta:
+        verbose_name = "Похожая путевка"
+        verbose_name_plural = "Похожие путевки"
+        ordering = ['package', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['package', 'rank'], name='similar_tour_package_rank'),
+        ]
+
+    def __str__(self):
+        return f"{self.package_id} → {self.similar_id} ({self.score:.3f})"
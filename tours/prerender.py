@@ -0,0 +1,187 @@
+import logging
+import os
+import tempfile
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, markcoroutinefunction
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpRequest
+from django.middleware.clickjacking import XFrameOptionsMiddleware
+from django.urls import NoReverseMatch, resolve, reverse
+from django.utils.cache import patch_vary_headers
+
+from .compression import STATIC_SUFFIXES, available_encodings, compress, precompressed_response
+from .jobs import enqueue, job
+
+logger = logging.getLogger('tours')
+
+CONTENT_TYPE = 'text/html; charset=utf-8'
+
+
+def page_models():
+    """Имя URL -> метки моделей, при изменении которых страница перестраивается."""
+    return getattr(settings, 'TOURS_PRERENDER_PAGES', {})
+
+
+def build_dir():
+    return str(getattr(settings, 'TOURS_PRERENDER_DIR', settings.BASE_DIR / 'var' / 'prerendered'))
+
+
+def page_path(name):
+    return os.path.join(build_dir(), f'{name}.html')
+
+
+def _write(path, data):
+    # читатель всегда видит либо старый файл, либо новый целиком
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(fd, 'wb') as out:
+        out.write(data)
+    os.replace(tmp, path)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def discard(name):
+    """Удаляет файлы страницы: до перестройки её снова отдает обычное представление."""
+    path = page_path(name)
+    _remove(path)
+    for suffix in STATIC_SUFFIXES.values():
+        _remove(path + suffix)
+
+
+async def _anonymous_user():
+    return AnonymousUser()
+
+
+def render_page(name):
+    """HTML страницы глазами анонимного посетителя, без middleware."""
+    path = reverse(name)
+    request = HttpRequest()
+    request.method = 'GET'
+    request.path = request.path_info = path
+    request.META = {'SERVER_NAME': 'localhost', 'SERVER_PORT': '80'}
+    request.user = AnonymousUser()
+    # асинхронные представления (TOURS_ASYNC_VIEWS) берут пользователя через auser()
+    request.auser = _anonymous_user
+    match = resolve(path)
+    view = async_to_sync(match.func) if iscoroutinefunction(match.func) else match.func
+    response = view(request, *match.args, **match.kwargs)
+    if hasattr(response, 'render'):
+        response.render()
+    if response.status_code != 200:
+        raise RuntimeError(f'Страница {name} вернула {response.status_code}')
+    return response.content
+
+
+def build_page(name):
+    data = render_page(name)
+    os.makedirs(build_dir(), exist_ok=True)
+    path = page_path(name)
+    min_size = getattr(settings, 'TOURS_COMPRESS_MIN_SIZE', 1024)
+    # сначала сжатые варианты, чтобы они не оказались старше страницы
+    for encoding in available_encodings():
+        compressed = compress(data, encoding)
+        if len(data) >= min_size and len(compressed) < len(data):
+            _write(path + STATIC_SUFFIXES[encoding], compressed)
+        else:
+            _remove(path + STATIC_SUFFIXES[encoding])
+    _write(path, data)
+    return path
+
+
+def build_all(names=None):
+    built = []
+    for name in names or page_models():
+        built.append(build_page(name))
+    logger.info(f'Перестроено статических страниц: {len(built)}')
+    return built
+
+
+@job('prerender_pages')
+def prerender_pages_job(names):
+    build_all(names)
+
+
+def _model_changed(sender, raw=False, **kwargs):
+    if raw:
+        return
+    label = sender._meta.label
+    names = [name for name, labels in page_models().items() if label in labels]
+
+    def publish():
+        for name in names:
+            discard(name)
+            enqueue(prerender_pages_job, {'names': [name]}, dedup_key=f'prerender:{name}')
+
+    transaction.on_commit(publish)
+
+
+def connect_signals():
+    labels = {label for labels in page_models().values() for label in labels}
+    for label in labels:
+        model = apps.get_model(label)
+        post_save.connect(_model_changed, sender=model, dispatch_uid=f'prerender_save_{label}')
+        post_delete.connect(_model_changed, sender=model, dispatch_uid=f'prerender_delete_{label}')
+
+
+class PrerenderedPageMiddleware:
+    """Отдает анонимным посетителям заранее построенные страницы из TOURS_PRERENDER_DIR.
+
+    Запрос не доходит до представления, ORM и шаблонов. Если файла нет
+    (страница еще не построена или ждет перестройки), запрос идет дальше
+    обычным путем. Middleware ниже по цепочке ответ не видят, поэтому
+    X-Frame-Options ставится здесь же.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self._paths = None
+        self._frame_options = XFrameOptionsMiddleware(get_response)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _page(self, request):
+        if request.method not in ('GET', 'HEAD') or request.META.get('QUERY_STRING') \
+                or settings.SESSION_COOKIE_NAME in request.COOKIES:
+            return None
+        if self._paths is None:
+            paths = {}
+            for name in page_models():
+                try:
+                    paths[reverse(name)] = name
+                except NoReverseMatch:
+                    logger.warning(f'Статическая страница {name} не найдена в URL')
+            self._paths = paths
+        return self._paths.get(request.path_info)
+
+    def _serve(self, request):
+        name = self._page(request)
+        if name is None:
+            return None
+        try:
+            response = precompressed_response(request, page_path(name), CONTENT_TYPE)
+        except FileNotFoundError:
+            return None
+        patch_vary_headers(response, ('Cookie', 'Accept-Encoding'))
+        return self._frame_options.process_response(request, response)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self._serve(request)
+        return self.get_response(request) if response is None else response
+
+    async def __acall__(self, request):
+        response = self._serve(request)
+        return await self.get_response(request) if response is None else response
@@ -0,0 +1,114 @@
+import logging
+from decimal import Decimal
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from .models import BulkChange, CatalogEntry, TourPackage
+from .response_cache import bump_tags
+
+logger = logging.getLogger('tours')
+
+FEATURE_FIELDS = ('id', 'start_date', 'duration_weeks', 'price', 'is_hot_deal',
+                  'hotel__stars', 'hotel__price_per_night', 'hotel__country_id', 'order_count')
+
+
+def _setting(name, default):
+    return getattr(settings, f'TOURS_PRICING_{name}', default)
+
+
+def load_features(queryset=None, today=None):
+    """Признаки путевок одним запросом, по столбцу NumPy на признак.
+
+    Нет даты начала — days равен NaN.
+    """
+    queryset = TourPackage.objects.all() if queryset is None else queryset
+    today = today or timezone.localdate()
+    rows = list(queryset.order_by().annotate(order_count=Count('orders')).values_list(*FEATURE_FIELDS))
+    columns = list(zip(*rows)) or [()] * len(FEATURE_FIELDS)
+    ids, start_dates, weeks, prices, hot, stars, per_night, countries, orders = columns
+    count = len(ids)
+    origin = today.toordinal()
+    weeks = np.fromiter(weeks, dtype=np.float64, count=count)
+    return {
+        'id': np.fromiter(ids, dtype=np.int64, count=count),
+        'days': np.fromiter((d.toordinal() - origin if d else np.nan for d in start_dates),
+                            dtype=np.float64, count=count),
+        'weeks': weeks,
+        'price': np.fromiter(prices, dtype=np.float64, count=count),
+        'is_hot_deal': np.fromiter(hot, dtype=bool, count=count),
+        'stars': np.fromiter(stars, dtype=np.float64, count=count),
+        'cost': np.fromiter(per_night, dtype=np.float64, count=count) * 7 * weeks,
+        'country': np.fromiter(countries, dtype=np.int64, count=count),
+        'orders': np.fromiter(orders, dtype=np.float64, count=count),
+    }
+
+
+def recommend(features):
+    """Рекомендуемые цены и флаги горящих путевок.
+
+    Цена — себестоимость проживания с наценкой, поправкой на звездность и
+    спрос (продажи путевки относительно среднего по стране). Путевка
+    становится горящей, если до начала осталось не больше HOT_DAYS дней, а
+    спрос на нее не выше среднего; на горящие дается скидка. Цены уже
+    начавшихся туров не меняются.
+    """
+    markup = _setting('MARKUP', 1.2)
+    star_step = _setting('STAR_STEP', 0.05)
+    weight = _setting('DEMAND_WEIGHT', 0.1)
+    low, high = _setting('DEMAND_LIMITS', (0.9, 1.2))
+    hot_days = _setting('HOT_DAYS', 14)
+    discount = _setting('HOT_DISCOUNT', 0.15)
+
+    orders = features['orders']
+    _, country = np.unique(features['country'], return_inverse=True)
+    country_mean = np.bincount(country, weights=orders) / np.maximum(np.bincount(country), 1)
+    mean = country_mean[country]
+    demand_ratio = np.divide(orders, mean, out=np.ones_like(orders), where=mean > 0)
+    demand = np.clip(1 + weight * (demand_ratio - 1), low, high)
+
+    price = features['cost'] * markup * (1 + (features['stars'] - 3) * star_step) * demand
+    days = features['days']
+    with np.errstate(invalid='ignore'):
+        started = days < 0
+        hot = (days >= 0) & (days <= hot_days) & (demand_ratio <= 1)
+    price = np.where(hot, price * (1 - discount), price)
+    price = np.round(np.where(started, features['price'], price), 2)
+    return price, hot & ~started
+
+
+def reprice(queryset=None, batch_size=None, dry_run=False, today=None):
+    """Пересчитывает цены и горящие путевки, записывает только изменившиеся.
+
+    Путевки и записи каталога обновляются bulk_update пачками по batch_size,
+    каждая пачка — в своей транзакции.
+    """
+    batch_size = batch_size or _setting('BATCH_SIZE', 2000)
+    today = today or timezone.localdate()
+    features = load_features(queryset, today)
+    price, hot = recommend(features)
+    changed = (np.abs(price - features['price']) >= 0.005) | (hot != features['is_hot_deal'])
+    result = {'total': len(features['id']), 'changed': int(changed.sum()), 'hot': int(hot.sum())}
+    ids, price, hot = features['id'][changed], price[changed], hot[changed]
+    if dry_run or not len(ids):
+        return result
+
+    now = timezone.now()
+    for start in range(0, len(ids), batch_size):
+        chunk = [(int(pk), Decimal(f'{value:.2f}'), bool(flag)) for pk, value, flag in
+                 zip(ids[start:start + batch_size], price[start:start + batch_size], hot[start:start + batch_size])]
+        with transaction.atomic():
+            TourPackage.objects.bulk_update(
+                [TourPackage(id=pk, price=value, is_hot_deal=flag, updated_at=now) for pk, value, flag in chunk],
+                ['price', 'is_hot_deal', 'updated_at'])
+            CatalogEntry.objects.bulk_update(
+                [CatalogEntry(package_id=pk, price=value, is_hot_deal=flag) for pk, value, flag in chunk],
+                ['price', 'is_hot_deal'])
+    BulkChange.objects.create(action='pricing', model=TourPackage._meta.label, affected=len(ids),
+                              params={'hot': result['hot'], 'date': today.isoformat()})
+    bump_tags('tours.CatalogEntry', 'tours.TourPackage')
+    logger.info(f"Пересчет цен: изменено {result['changed']} из {result['total']} путевок, горящих {result['hot']}")
+    return result
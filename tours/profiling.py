@@ -0,0 +1,342 @@
+import cProfile
+import json
+import logging
+import os
+import re
+import secrets
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .templating import render_log
+
+logger = logging.getLogger('tours')
+
+QUERY_FLAG = '_profile'
+HEADER = 'HTTP_X_TOURS_PROFILE'
+MODES = ('cprofile', 'sample')
+PROFILE_ID_RE = re.compile(r'^[\w-]+$')
+SUFFIXES = {'cprofile': '.prof', 'sample': '.speedscope.json'}
+SPEEDSCOPE_SCHEMA = 'https://www.speedscope.app/file-format-schema.json'
+
+
+def _setting(name, default):
+    return getattr(settings, f'TOURS_PROFILER_{name}', default)
+
+
+def profile_dir():
+    return str(_setting('DIR', settings.BASE_DIR / 'var' / 'profiles'))
+
+
+def requested_mode(request):
+    """Режим профилирования, запрошенный параметром ?_profile= или заголовком X-Tours-Profile.
+
+    '1' и пустое значение означают режим по умолчанию; None — профилирование не запрошено.
+    """
+    value = request.META.get(HEADER)
+    if value is None:
+        if QUERY_FLAG not in request.META.get('QUERY_STRING', ''):
+            return None
+        value = request.GET.get(QUERY_FLAG)
+        if value is None:
+            return None
+    value = value.strip().lower()
+    if value in ('', '1', 'true', 'yes'):
+        return _setting('MODE', 'cprofile')
+    return value if value in MODES else None
+
+
+def _project_frames(stack):
+    """Кадры из кода проекта, без библиотек и самого профилировщика."""
+    root = str(settings.BASE_DIR)
+    return [frame for frame in stack
+            if frame.filename.startswith(root) and 'site-packages' not in frame.filename
+            and frame.filename != __file__]
+
+
+class QueryLog:
+    """Обертка execute_wrapper: SQL, время и место в коде, откуда пришел запрос."""
+
+    def __init__(self, alias):
+        self.alias = alias
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            stack = _project_frames(traceback.extract_stack()[:-1])[-_setting('STACK_DEPTH', 5):]
+            self.queries.append({
+                'alias': self.alias,
+                'sql': sql,
+                'many': many,
+                'ms': round(elapsed * 1000, 3),
+                'stack': [f'{os.path.relpath(frame.filename, settings.BASE_DIR)}:{frame.lineno} in {frame.name}'
+                          for frame in reversed(stack)],
+            })
+
+
+class Sampler(threading.Thread):
+    """Сэмплирующий профилировщик одного потока: раз в interval снимает его стек.
+
+    Результат — профиль speedscope в формате sampled; вес сэмпла — время с
+    предыдущего снимка.
+    """
+
+    def __init__(self, thread_id, interval):
+        super().__init__(name='tours-profiler-sampler', daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.frames = {}
+        self.samples = []
+        self.weights = []
+        self._done = threading.Event()
+
+    def _stack(self, frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            key = (code.co_name, code.co_filename, code.co_firstlineno)
+            index = self.frames.get(key)
+            if index is None:
+                index = self.frames[key] = len(self.frames)
+            stack.append(index)
+            frame = frame.f_back
+        stack.reverse()
+        return stack
+
+    def run(self):
+        last = time.perf_counter()
+        while not self._done.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is not None:
+                self.samples.append(self._stack(frame))
+                self.weights.append(now - last)
+            last = now
+            del frame
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+    def speedscope(self, name):
+        frames = [{'name': func, 'file': filename, 'line': line} for func, filename, line in self.frames]
+        return {
+            '$schema': SPEEDSCOPE_SCHEMA,
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(self.weights),
+                'samples': self.samples,
+                'weights': self.weights,
+            }],
+            'name': name,
+            'exporter': 'tours.profiling',
+        }
+
+
+class ProfileSession:
+    """Профилирование одного запроса: профилировщик, SQL и время шаблонов."""
+
+    def __init__(self, request, mode, user):
+        self.request = request
+        self.mode = mode
+        self.user = user
+        self.profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(4)}"
+        self.templates = []
+        self.query_logs = [QueryLog(alias) for alias in connections]
+        self._stack = ExitStack()
+        self._token = None
+        self._profiler = None
+        self._started = None
+        self.elapsed = None
+
+    def start(self):
+        for log in self.query_logs:
+            self._stack.enter_context(connections[log.alias].execute_wrapper(log))
+        self._token = render_log.set(self.templates)
+        if self.mode == 'sample':
+            self._profiler = Sampler(threading.get_ident(), _setting('INTERVAL', 0.001))
+            self._profiler.start()
+        else:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._started = time.perf_counter()
+
+    def stop(self):
+        self.elapsed = time.perf_counter() - self._started
+        if self.mode == 'sample':
+            self._profiler.stop()
+        else:
+            self._profiler.disable()
+        render_log.reset(self._token)
+        self._stack.close()
+
+    def report(self, response):
+        queries = [query for log in self.query_logs for query in log.queries]
+        repeated = Counter(query['sql'] for query in queries)
+        templates = {}
+        for name, elapsed in self.templates:
+            entry = templates.setdefault(name, {'count': 0, 'total_ms': 0.0})
+            entry['count'] += 1
+            entry['total_ms'] = round(entry['total_ms'] + elapsed * 1000, 3)
+        return {
+            'id': self.profile_id,
+            'mode': self.mode,
+            'method': self.request.method,
+            'path': self.request.get_full_path(),
+            'user': self.user.get_username(),
+            'status': response.status_code,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'total_ms': round(self.elapsed * 1000, 3),
+            'sql_ms': round(sum(query['ms'] for query in queries), 3),
+            'query_count': len(queries),
+            # одинаковый SQL много раз подряд — обычно N+1
+            'repeated_queries': [{'sql': sql, 'count': count}
+                                 for sql, count in repeated.most_common() if count > 1],
+            'queries': queries,
+            'templates': templates,
+        }
+
+    def save(self, response):
+        directory = profile_dir()
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, self.profile_id)
+        if self.mode == 'sample':
+            with open(base + SUFFIXES['sample'], 'w', encoding='utf-8') as out:
+                json.dump(self._profiler.speedscope(self.request.path), out)
+        else:
+            self._profiler.dump_stats(base + SUFFIXES['cprofile'])
+        with open(base + '.json', 'w', encoding='utf-8') as out:
+            json.dump(self.report(response), out, ensure_ascii=False, indent=1)
+        prune()
+        return self.profile_id
+
+
+def profile_path(profile_id, kind):
+    """Путь к файлу профиля: kind — 'report' или 'profile'; None, если файла нет."""
+    if not PROFILE_ID_RE.match(profile_id):
+        return None
+    base = os.path.join(profile_dir(), profile_id)
+    candidates = [base + '.json'] if kind == 'report' else [base + suffix for suffix in SUFFIXES.values()]
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def list_profiles():
+    """Отчеты о сохраненных профилях, новые первыми."""
+    directory = profile_dir()
+    try:
+        names = sorted((name for name in os.listdir(directory) if name.endswith('.json')
+                        and not name.endswith(SUFFIXES['sample'])), reverse=True)
+    except FileNotFoundError:
+        return []
+    profiles = []
+    for name in names:
+        try:
+            with open(os.path.join(directory, name), encoding='utf-8') as source:
+                report = json.load(source)
+        except (OSError, ValueError):
+            continue
+        profiles.append({key: report.get(key) for key in
+                         ('id', 'mode', 'method', 'path', 'user', 'status', 'created', 'total_ms', 'sql_ms',
+                          'query_count')})
+    return profiles
+
+
+def prune(keep=None):
+    """Оставляет только keep последних профилей (TOURS_PROFILER_KEEP)."""
+    keep = _setting('KEEP', 50) if keep is None else keep
+    directory = profile_dir()
+    ids = sorted({name.split('.', 1)[0] for name in os.listdir(directory)}, reverse=True)
+    for profile_id in ids[keep:]:
+        for suffix in ('.json', *SUFFIXES.values()):
+            try:
+                os.remove(os.path.join(directory, profile_id + suffix))
+            except FileNotFoundError:
+                pass
+
+
+class ProfilerMiddleware:
+    """Профилирует запрос сотрудника по ?_profile=1 или заголовку X-Tours-Profile.
+
+    Режимы: cprofile (детерминированный, файл pstats) и sample (сэмплирующий,
+    файл speedscope). Вместе с профилем сохраняется отчет: все SQL-запросы с
+    местом в коде, откуда они пришли, и время рендера шаблонов. Идентификатор
+    профиля возвращается в заголовке X-Tours-Profile-Id, скачать файлы можно
+    на /internal/profiles/. Запросы без флага проходят без профилирования;
+    при TOURS_PROFILER_ENABLED = False middleware отключается целиком.
+
+    В асинхронном режиме профилируется поток цикла событий, поэтому в профиль
+    могут попасть и другие запросы, обработанные в это же время.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not _setting('ENABLED', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _session(self, request, mode, user):
+        if mode is None or user is None or not user.is_staff:
+            return None
+        return ProfileSession(request, mode, user)
+
+    def _finish(self, session, response):
+        try:
+            profile_id = session.save(response)
+        except OSError:
+            logger.exception('Не удалось сохранить профиль запроса')
+            return response
+        logger.info(f'Профиль {profile_id}: {session.request.path} за {session.elapsed * 1000:.0f} мс')
+        response['X-Tours-Profile-Id'] = profile_id
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        session = self._session(request, requested_mode(request), getattr(request, 'user', None))
+        if session is None:
+            return self.get_response(request)
+        session.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            session.stop()
+        return self._finish(session, response)
+
+    async def __acall__(self, request):
+        mode = requested_mode(request)
+        user = None
+        if mode is not None and hasattr(request, 'auser'):
+            # синхронный request.user в цикле событий падает с SynchronousOnlyOperation
+            user = await request.auser()
+        session = self._session(request, mode, user)
+        if session is None:
+            return await self.get_response(request)
+        session.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            session.stop()
+        return self._finish(session, response)
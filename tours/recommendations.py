@@ -0,0 +1,116 @@
+import logging
+import re
+from collections import Counter
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import CatalogEntry, SimilarTour
+
+logger = logging.getLogger('tours')
+
+WORD_RE = re.compile(r'\w{3,}')
+
+DEFAULT_WEIGHTS = {'price': 1.0, 'stars': 1.0, 'duration': 0.5, 'country': 1.0, 'services': 1.0}
+
+
+def _setting(name, default):
+    return getattr(settings, f'TOURS_SIMILAR_{name}', default)
+
+
+def _standardize(values):
+    std = values.std()
+    return (values - values.mean()) / std if std > 0 else np.zeros_like(values)
+
+
+def keywords(text):
+    return set(WORD_RE.findall(text.lower()))
+
+
+def encode(rows, vocabulary_size=None, weights=None):
+    """Векторы признаков путевок: строки — (цена, звезды, недели, страна, доп. услуги).
+
+    Числовые признаки стандартизуются, страна кодируется one-hot, услуги —
+    мешком из vocabulary_size самых частых слов, нормированным по строке.
+    Каждый блок умножается на свой вес, поэтому евклидово расстояние между
+    векторами складывается из различий по всем признакам.
+    """
+    vocabulary_size = vocabulary_size or _setting('VOCABULARY', 64)
+    weights = {**DEFAULT_WEIGHTS, **(weights or _setting('WEIGHTS', {}))}
+    count = len(rows)
+    prices, stars, weeks, countries, services = zip(*rows) if rows else ((),) * 5
+
+    price = _standardize(np.log1p(np.fromiter(prices, dtype=np.float32, count=count)))
+    star = _standardize(np.fromiter(stars, dtype=np.float32, count=count))
+    duration = _standardize(np.log2(np.fromiter(weeks, dtype=np.float32, count=count)))
+    country_ids, country = np.unique(np.fromiter(countries, dtype=np.int64, count=count), return_inverse=True)
+
+    words = [keywords(text) for text in services]
+    counter = Counter(word for row in words for word in row)
+    vocabulary = {word: i for i, (word, _) in enumerate(counter.most_common(vocabulary_size))}
+
+    columns = 3 + len(country_ids) + len(vocabulary)
+    features = np.zeros((count, columns), dtype=np.float32)
+    features[:, 0] = price * weights['price']
+    features[:, 1] = star * weights['stars']
+    features[:, 2] = duration * weights['duration']
+    features[np.arange(count), 3 + country] = weights['country']
+    offset = 3 + len(country_ids)
+    for i, row in enumerate(words):
+        hits = [offset + vocabulary[word] for word in row if word in vocabulary]
+        if hits:
+            features[i, hits] = weights['services'] / np.sqrt(len(hits))
+    return features
+
+
+def nearest(features, k, block_cells=None):
+    """Точный поиск k ближайших соседей перебором блоками строк.
+
+    Квадраты расстояний считаются как |a|² + |b|² − 2a·b, где a·b — одно
+    матричное произведение на блок. Размер блока подбирается так, чтобы
+    матрица расстояний занимала не больше block_cells чисел.
+    Возвращает тройки (номер первой строки блока, индексы соседей, расстояния).
+    """
+    count = len(features)
+    k = min(k, count - 1)
+    if k <= 0:
+        return
+    block = max(1, (block_cells or _setting('BLOCK_CELLS', 16_000_000)) // count)
+    norms = np.einsum('ij,ij->i', features, features)
+    for start in range(0, count, block):
+        stop = min(start + block, count)
+        distances = norms[start:stop, None] + norms[None, :] - 2 * (features[start:stop] @ features.T)
+        distances[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        index = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        nearest_distances = np.take_along_axis(distances, index, axis=1)
+        order = np.argsort(nearest_distances, axis=1, kind='stable')
+        yield (start, np.take_along_axis(index, order, axis=1),
+               np.sqrt(np.maximum(np.take_along_axis(nearest_distances, order, axis=1), 0)))
+
+
+def build_similar_tours(k=None, batch_size=2000, today=None):
+    """Пересчитывает похожие путевки для всех будущих туров и туров без даты."""
+    k = k or _setting('COUNT', 6)
+    today = today or timezone.localdate()
+    entries = CatalogEntry.objects.filter(Q(start_date__isnull=True) | Q(start_date__gte=today)).order_by('package_id')
+    rows = list(entries.values_list('package_id', 'price', 'stars', 'duration_weeks', 'country_id',
+                                    'additional_services'))
+    ids = [row[0] for row in rows]
+    features = encode([row[1:] for row in rows])
+
+    created = 0
+    with transaction.atomic():
+        SimilarTour.objects.all().delete()
+        for start, index, distances in nearest(features, k):
+            SimilarTour.objects.bulk_create([
+                SimilarTour(package_id=ids[start + row], similar_id=ids[column], rank=rank,
+                            score=float(1 / (1 + distance)))
+                for row in range(len(index))
+                for rank, (column, distance) in enumerate(zip(index[row], distances[row]), start=1)
+            ], batch_size=batch_size)
+            created += index.size
+    logger.info(f'Похожие путевки: {created} связей для {len(ids)} путевок')
+    return created
@@ -0,0 +1,148 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from decimal import Decimal
+from types import MappingProxyType
+from typing import NamedTuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Country, Hotel, SeasonClimate
+
+logger = logging.getLogger('tours')
+
+VERSION_KEY = 'tours.refdata.version'
+
+
+class ClimateRef(NamedTuple):
+    id: int
+    country_id: int
+    season: str
+    season_display: str
+    climate_description: str
+
+    def get_season_display(self):
+        return self.season_display
+
+
+class CountryRef(NamedTuple):
+    id: int
+    name: str
+    climates: tuple
+
+    def __str__(self):
+        return self.name
+
+
+class HotelRef(NamedTuple):
+    id: int
+    name: str
+    country: CountryRef
+    stars: int
+    price_per_night: Decimal
+    photo_url: str
+
+    @property
+    def country_id(self):
+        return self.country.id
+
+    def __str__(self):
+        return f"{self.name} ({self.country.name}, {self.stars}*)"
+
+
+class ReferenceData(NamedTuple):
+    version: object
+    countries: tuple
+    countries_by_id: MappingProxyType
+    hotels: tuple
+    hotels_by_id: MappingProxyType
+    hotels_by_country: MappingProxyType
+
+
+_lock = threading.Lock()
+_snapshot = None
+_checked_at = 0.0
+
+
+def _load(version):
+    seasons = dict(SeasonClimate.SEASON_CHOICES)
+    climates = defaultdict(list)
+    for climate in SeasonClimate.objects.order_by('country_id', 'season').values_list(
+            'id', 'country_id', 'season', 'climate_description'):
+        climates[climate[1]].append(ClimateRef(climate[0], climate[1], climate[2], seasons.get(climate[2], climate[2]),
+                                               climate[3]))
+
+    countries = tuple(
+        CountryRef(pk, name, tuple(climates[pk]))
+        for pk, name in Country.objects.order_by('name').values_list('id', 'name')
+    )
+    countries_by_id = {country.id: country for country in countries}
+
+    hotels = tuple(
+        HotelRef(hotel.id, hotel.name, countries_by_id[hotel.country_id], hotel.stars, hotel.price_per_night,
+                 hotel.photo.url if hotel.photo else '')
+        for hotel in Hotel.objects.order_by('name').only('id', 'name', 'country_id', 'stars', 'price_per_night',
+                                                         'photo')
+    )
+    by_country = defaultdict(list)
+    for hotel in hotels:
+        by_country[hotel.country.id].append(hotel)
+
+    logger.debug(f'Загружены справочники: {len(countries)} стран, {len(hotels)} отелей')
+    return ReferenceData(
+        version=version,
+        countries=countries,
+        countries_by_id=MappingProxyType(countries_by_id),
+        hotels=hotels,
+        hotels_by_id=MappingProxyType({hotel.id: hotel for hotel in hotels}),
+        hotels_by_country=MappingProxyType({pk: tuple(items) for pk, items in by_country.items()}),
+    )
+
+
+def get_reference_data():
+    """Справочники стран, отелей и климата из памяти процесса.
+
+    Актуальность сверяется с версией в общем кэше не чаще, чем раз в
+    TOURS_REFDATA_CHECK_INTERVAL секунд; версию поднимают сигналы моделей.
+    """
+    global _snapshot, _checked_at
+    snapshot = _snapshot
+    now = time.monotonic()
+    if snapshot is not None and now - _checked_at < getattr(settings, 'TOURS_REFDATA_CHECK_INTERVAL', 1.0):
+        return snapshot
+
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        cache.add(VERSION_KEY, version, None)
+        version = cache.get(VERSION_KEY, version)
+    if snapshot is None or snapshot.version != version:
+        with _lock:
+            if _snapshot is None or _snapshot.version != version:
+                _snapshot = _load(version)
+            snapshot = _snapshot
+    _checked_at = now
+    return snapshot
+
+
+async def aget_reference_data():
+    snapshot = _snapshot
+    if snapshot is not None and time.monotonic() - _checked_at < getattr(settings, 'TOURS_REFDATA_CHECK_INTERVAL', 1.0):
+        return snapshot
+    return await sync_to_async(get_reference_data)()
+
+
+def _bump_version():
+    cache.set(VERSION_KEY, time.time_ns(), None)
+
+
+def invalidate_reference_data():
+    global _snapshot
+    _snapshot = None
+    # другие процессы узнают об изменении только после фиксации транзакции,
+    # иначе они могут перечитать старые данные под новой версией
+    transaction.on_commit(_bump_version)
@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import logging
+import time
+from urllib.parse import urlencode
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpResponse
+from django.urls import Resolver404, resolve
+from django.utils.cache import patch_vary_headers
+
+from .compression import negotiate
+
+logger = logging.getLogger('tours')
+
+KEY_PREFIX = 'tours.rc'
+TAG_PREFIX = 'tours.rc.tag.'
+POLL_INTERVAL = 0.05
+
+
+def page_tags():
+    return getattr(settings, 'TOURS_RESPONSE_CACHE_PAGES', {})
+
+
+def _tag_key(label):
+    return TAG_PREFIX + label.lower()
+
+
+def bump_tags(*labels):
+    version = time.time_ns()
+    cache.set_many({_tag_key(label): version for label in labels}, None)
+
+
+def _model_changed(sender, raw=False, **kwargs):
+    if not raw:
+        label = sender._meta.label
+        transaction.on_commit(lambda: bump_tags(label))
+
+
+def connect_signals():
+    labels = {label for tags in page_tags().values() for label in tags}
+    for label in labels:
+        model = apps.get_model(label)
+        post_save.connect(_model_changed, sender=model, dispatch_uid=f'response_cache_save_{label}')
+        post_delete.connect(_model_changed, sender=model, dispatch_uid=f'response_cache_delete_{label}')
+
+
+def normalize_query(params):
+    # Порядок параметров и пустые фильтры (price_min=) не меняют страницу
+    return urlencode(sorted((key, value) for key, values in params.lists() for value in values if value != ''))
+
+
+def _vary_value(request, header):
+    value = request.headers.get(header, '')
+    if header.lower() == 'accept-encoding':
+        # у браузеров десятки вариантов заголовка, а страница бывает в нескольких кодировках
+        return negotiate(value) or 'identity'
+    return value
+
+
+def _cache_key(request, tags):
+    versions = cache.get_many([_tag_key(label) for label in tags])
+    parts = [request.path, normalize_query(request.GET)]
+    parts += [_vary_value(request, header) for header in getattr(settings, 'TOURS_RESPONSE_CACHE_VARY', ())]
+    parts += [f'{label}={versions.get(_tag_key(label), 0)}' for label in tags]
+    digest = hashlib.md5('\n'.join(parts).encode(), usedforsecurity=False).hexdigest()
+    return f'{KEY_PREFIX}.{digest}'
+
+
+def _to_response(entry, state):
+    status, headers, content = entry
+    response = HttpResponse(content, status=status)
+    for name, value in headers:
+        response[name] = value
+    response['X-Cache'] = state
+    return response
+
+
+def _cacheable_response(response):
+    if response.status_code != 200 or response.streaming or response.cookies:
+        return False
+    cache_control = response.get('Cache-Control', '')
+    return 'private' not in cache_control and 'no-store' not in cache_control
+
+
+class AnonymousResponseCacheMiddleware:
+    """Кэширует целиком ответы публичных страниц для анонимных посетителей.
+
+    Страницы и модели, от которых они зависят, задаются в
+    TOURS_RESPONSE_CACHE_PAGES (имя URL -> метки моделей). Изменение любой из
+    моделей поднимает версию её метки, и старые ключи перестают совпадать.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.timeout = getattr(settings, 'TOURS_RESPONSE_CACHE_TIMEOUT', 300)
+        self.lock_timeout = getattr(settings, 'TOURS_RESPONSE_CACHE_LOCK_TIMEOUT', 10)
+        self.wait = getattr(settings, 'TOURS_RESPONSE_CACHE_WAIT', 2.0)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _page_tags(self, request):
+        if request.method not in ('GET', 'HEAD') or settings.SESSION_COOKIE_NAME in request.COOKIES:
+            return None
+        try:
+            url_name = resolve(request.path_info).url_name
+        except Resolver404:
+            return None
+        return page_tags().get(url_name)
+
+    def _begin(self, request):
+        """(ключ, ответ из кэша, взята ли блокировка); ключ None — страница не кэшируется."""
+        tags = self._page_tags(request)
+        if tags is None:
+            return None, None, False
+        key = _cache_key(request, tags)
+        entry = cache.get(key)
+        if entry is not None:
+            return key, _to_response(entry, 'HIT'), False
+        return key, None, cache.add(f'{key}.lock', 1, self.lock_timeout)
+
+    def _lookup(self, request):
+        key, cached, locked = self._begin(request)
+        if key is None or cached is not None or locked:
+            return key, cached, locked
+        # Страницу уже строит другой запрос: ждём его результат, а не нагружаем БД повторно
+        deadline = time.monotonic() + self.wait
+        while time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL)
+            entry = cache.get(key)
+            if entry is not None:
+                return key, _to_response(entry, 'HIT'), False
+        return key, None, False
+
+    async def _alookup(self, request):
+        key, cached, locked = await sync_to_async(self._begin)(request)
+        if key is None or cached is not None or locked:
+            return key, cached, locked
+        # то же ожидание, но не занимая общий поток sync_to_async на время сна
+        deadline = time.monotonic() + self.wait
+        while time.monotonic() < deadline:
+            await asyncio.sleep(POLL_INTERVAL)
+            entry = await cache.aget(key)
+            if entry is not None:
+                return key, _to_response(entry, 'HIT'), False
+        return key, None, False
+
+    def _store(self, key, locked, response):
+        try:
+            if _cacheable_response(response):
+                # закэшированная страница предназначена только анонимным посетителям
+                patch_vary_headers(response, ('Cookie',))
+                cache.set(key, (response.status_code, list(response.items()), response.content), self.timeout)
+                response['X-Cache'] = 'MISS'
+        finally:
+            if locked:
+                cache.delete(f'{key}.lock')
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        key, cached, locked = self._lookup(request)
+        if cached is not None:
+            return cached
+        response = self.get_response(request)
+        if key is None:
+            return response
+        return self._store(key, locked, response)
+
+    async def __acall__(self, request):
+        key, cached, locked = await self._alookup(request)
+        if cached is not None:
+            return cached
+        response = await self.get_response(request)
+        if key is None:
+            return response
+        return await sync_to_async(self._store)(key, locked, response)
@@ -0,0 +1,105 @@
+import hashlib
+import logging
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.sessions.backends import cached_db
+from django.utils import timezone
+
+logger = logging.getLogger('tours')
+
+KEY_PREFIX = 'tours.sessions.'
+
+
+def prune_expired_sessions(batch_size=None, pause=0):
+    from django.contrib.sessions.models import Session
+
+    batch_size = batch_size or getattr(settings, 'TOURS_SESSION_PRUNE_BATCH', 1000)
+    now = timezone.now()
+    removed = 0
+    while True:
+        keys = list(
+            Session.objects.filter(expire_date__lt=now)
+            .values_list('session_key', flat=True)[:batch_size]
+        )
+        if not keys:
+            break
+        Session.objects.filter(session_key__in=keys).delete()
+        removed += len(keys)
+        if pause:
+            time.sleep(pause)
+    logger.info(f'Удалено просроченных сессий: {removed}')
+    return removed
+
+
+class SessionStore(cached_db.SessionStore):
+    cache_key_prefix = KEY_PREFIX
+
+    def __init__(self, session_key=None):
+        self._stored_digest = None
+        self._db_expiry = None
+        super().__init__(session_key)
+
+    def _digest(self, data):
+        return hashlib.blake2b(self.serializer().dumps(data), digest_size=16).hexdigest()
+
+    def _remember(self, data, db_expiry):
+        self._stored_digest = self._digest(data)
+        self._db_expiry = db_expiry.timestamp()
+        try:
+            self._cache.set(
+                self.cache_key,
+                (data, self._stored_digest, self._db_expiry),
+                self.get_expiry_age(),
+            )
+        except Exception:
+            logger.exception(f'Ошибка записи сессии в кэш ({self._cache})')
+
+    def load(self):
+        try:
+            entry = self._cache.get(self.cache_key)
+        except Exception:
+            entry = None
+
+        if entry is None:
+            s = self._get_session_from_db()
+            if not s:
+                return {}
+            data = self.decode(s.session_data)
+            entry = (data, self._digest(data), s.expire_date.timestamp())
+            self._cache.set(self.cache_key, entry, self.get_expiry_age(expiry=s.expire_date))
+
+        data, self._stored_digest, self._db_expiry = entry
+        return data
+
+    async def aload(self):
+        return await sync_to_async(self.load)()
+
+    def _needs_db_write(self, data, expiry):
+        if self._stored_digest is None or self._digest(data) != self._stored_digest:
+            return True
+        # Срок жизни в БД продлеваем не чаще, чем раз в TOURS_SESSION_TOUCH_INTERVAL
+        touch_interval = getattr(settings, 'TOURS_SESSION_TOUCH_INTERVAL', 60 * 60)
+        return expiry.timestamp() - self._db_expiry > touch_interval
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+        data = self._get_session(no_load=must_create)
+        expiry = self.get_expiry_date()
+        if must_create or self._needs_db_write(data, expiry):
+            super(cached_db.SessionStore, self).save(must_create=must_create)
+            self._remember(data, expiry)
+        else:
+            try:
+                self._cache.touch(self.cache_key, self.get_expiry_age())
+            except Exception:
+                logger.exception(f'Ошибка обновления сессии в кэше ({self._cache})')
+
+    async def asave(self, must_create=False):
+        await sync_to_async(self.save)(must_create=must_create)
+
+    @classmethod
+    def clear_expired(cls):
+        prune_expired_sessions()
@@ -0,0 +1,41 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .catalog_index import sync_country, sync_hotel, sync_package
+from .models import Country, Hotel, SeasonClimate, TourPackage
+from .prerender import connect_signals as connect_prerender_signals
+from .refdata import invalidate_reference_data
+from .response_cache import connect_signals as connect_response_cache_signals
+
+
+@receiver(post_save, sender=TourPackage)
+def tour_package_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        sync_package(instance)
+
+
+@receiver(post_save, sender=Hotel)
+def hotel_saved(sender, instance, created, raw=False, **kwargs):
+    if not raw and not created:
+        sync_hotel(instance)
+
+
+@receiver(post_save, sender=Country)
+def country_saved(sender, instance, created, raw=False, **kwargs):
+    if not raw and not created:
+        sync_country(instance)
+
+
+@receiver(post_save, sender=Country)
+@receiver(post_delete, sender=Country)
+@receiver(post_save, sender=Hotel)
+@receiver(post_delete, sender=Hotel)
+@receiver(post_save, sender=SeasonClimate)
+@receiver(post_delete, sender=SeasonClimate)
+def reference_data_changed(sender, raw=False, **kwargs):
+    if not raw:
+        invalidate_reference_data()
+
+
+connect_response_cache_signals()
+connect_prerender_signals()
@@ -0,0 +1,70 @@
+// Подсказки для полей AutocompleteSelect / AutocompleteSelectMultiple (tours/widgets.py)
+(function () {
+    'use strict';
+
+    function attach(input) {
+        var select = document.getElementById(input.dataset.for);
+        if (!select) {
+            return;
+        }
+        var list = document.createElement('ul');
+        list.className = 'autocomplete-results';
+        list.hidden = true;
+        input.insertAdjacentElement('afterend', list);
+        var timer = null;
+        var request = 0;
+
+        function choose(item) {
+            var option = Array.prototype.find.call(select.options, function (o) { return o.value === String(item.id); });
+            if (!option) {
+                option = new Option(item.text, item.id);
+                select.add(option);
+            }
+            if (!select.multiple) {
+                Array.prototype.forEach.call(select.options, function (o) { o.selected = false; });
+            }
+            option.selected = true;
+            select.dispatchEvent(new Event('change', {bubbles: true}));
+            input.value = '';
+            list.hidden = true;
+        }
+
+        function show(results) {
+            list.innerHTML = '';
+            results.forEach(function (item) {
+                var li = document.createElement('li');
+                li.textContent = item.text;
+                li.addEventListener('mousedown', function (event) {
+                    event.preventDefault();
+                    choose(item);
+                });
+                list.appendChild(li);
+            });
+            list.hidden = results.length === 0;
+        }
+
+        input.addEventListener('input', function () {
+            clearTimeout(timer);
+            var term = input.value.trim();
+            if (!term) {
+                show([]);
+                return;
+            }
+            timer = setTimeout(function () {
+                var current = ++request;
+                fetch(input.dataset.url + '?q=' + encodeURIComponent(term), {credentials: 'same-origin'})
+                    .then(function (response) { return response.json(); })
+                    .then(function (data) {
+                        if (current === request) {
+                            show(data.results);
+                        }
+                    });
+            }, 200);
+        });
+        input.addEventListener('blur', function () { list.hidden = true; });
+    }
+
+    document.addEventListener('DOMContentLoaded', function () {
+        document.querySelectorAll('.autocomplete-input').forEach(attach);
+    });
+})();
@@ -0,0 +1,132 @@
+import base64
+import io
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .jobs import enqueue, job
+from .lazy import lazy_import
+from .models import TourPackage
+
+requests = lazy_import('requests')
+
+logger = logging.getLogger('tours')
+
+CURRENCY_KEY = 'tours.jobs.currency'
+WEATHER_KEY = 'tours.jobs.weather'
+SALES_CHART_KEY = 'tours.jobs.sales_chart'
+WEATHER_CITIES = ['Moscow', 'Istanbul', 'Bangkok']
+
+
+def cached_result(key, task, max_age=None):
+    """Результат фоновой задачи из кэша; если его нет или он устарел, задача ставится в очередь."""
+    max_age = max_age or getattr(settings, 'TOURS_JOBS_RESULT_MAX_AGE', 600)
+    data = cache.get(key)
+    if data is None or time.time() - data['fetched_at'] > max_age:
+        # пока воркер не обновил результат, ставить задачу пытается один запрос за интервал,
+        # а не каждый просмотр страницы
+        if cache.add(f'{key}.queued', 1, getattr(settings, 'TOURS_JOBS_ENQUEUE_INTERVAL', 30)):
+            enqueue(task, dedup_key=key)
+    return data
+
+
+def _store(key, **data):
+    cache.set(key, dict(data, fetched_at=time.time()), None)
+
+
+def fetch_currency_rates():
+    url = 'https://open.er-api.com/v6/latest/RUB'
+    rates = {}
+    error = None
+    try:
+        resp = requests.get(url, timeout=5)
+        if resp.status_code != 200:
+            error = f"Ошибка соединения: {resp.status_code}"
+        else:
+            data = resp.json()
+            if data.get('result') == 'success':
+                rates = data.get('rates', {})
+            else:
+                error = data.get('error-type', 'Ошибка ответа от API')
+    except Exception as e:
+        error = str(e)
+    return rates, error
+
+
+def fetch_weather():
+    weather_data = []
+    for city in WEATHER_CITIES:
+        url = f'https://wttr.in/{city}?format=j1'
+        try:
+            resp = requests.get(url, timeout=5)
+            data = resp.json()
+            current = data['current_condition'][0]
+            weather_data.append({
+                'city': city,
+                'temp': current['temp_C'],
+                'desc': current['weatherDesc'][0]['value'],
+                'icon': None
+            })
+        except Exception as e:
+            weather_data.append({
+                'city': city,
+                'temp': None,
+                'desc': f"Ошибка: {e}",
+                'icon': None,
+            })
+    return weather_data
+
+
+def get_pyplot():
+    # matplotlib нужен только для графика, поэтому грузим его при первом вызове
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def build_sales_chart():
+    plt = get_pyplot()
+    tours = TourPackage.objects.values('name', 'price')
+    names = [tour['name'] for tour in tours]
+    prices = [tour['price'] for tour in tours]
+
+    plt.figure(figsize=(10, 6))
+    plt.bar(names, prices, color='skyblue')
+    plt.title('Распределение цен туров')
+    plt.xlabel('Название тура')
+    plt.ylabel('Цена')
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout()
+
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png')
+    buf.seek(0)
+    string = base64.b64encode(buf.read())
+    uri = 'data:image/png;base64,' + string.decode('utf-8')
+    buf.close()
+    plt.close()
+    return uri
+
+
+@job('refresh_currency_rates')
+def refresh_currency_rates():
+    rates, error = fetch_currency_rates()
+    if error and cache.get(CURRENCY_KEY) is not None:
+        # старые курсы лучше ошибки: оставляем их и пробуем ещё раз позже
+        raise RuntimeError(error)
+    _store(CURRENCY_KEY, rates=rates, error=error)
+
+
+@job('refresh_weather')
+def refresh_weather():
+    _store(WEATHER_KEY, weather_data=fetch_weather())
+
+
+@job('render_sales_chart')
+def render_sales_chart():
+    started = time.perf_counter()
+    _store(SALES_CHART_KEY, chart_uri=build_sales_chart())
+    logger.info(f'График продаж построен за {time.perf_counter() - started:.2f} с')
@@ -0,0 +1,77 @@
+import re
+
+from django.conf import settings
+from django.template import TemplateDoesNotExist
+from django.template.loaders import app_directories, base, cached, filesystem
+
+from .templating import TimedTemplate
+
+# Содержимое этих тегов выводится как есть, пробелы в нём значимы
+PRESERVE_RE = re.compile(r'(<(pre|textarea)\b.*?</\2\s*>)', re.S | re.I)
+LINE_BREAK_RE = re.compile(r'[ \t]*\n\s*')
+# Теги, которые сами ничего не выводят. После выводящих тегов ({% url %}, {% translate %},
+# {% include %}) перевод строки отделяет их результат от следующего слова и должен остаться
+SILENT_TAGS = (
+    'if', 'elif', 'else', 'endif', 'for', 'empty', 'endfor', 'block', 'endblock', 'extends', 'load',
+    'with', 'endwith', 'comment', 'endcomment', 'spaceless', 'endspaceless', 'autoescape', 'endautoescape',
+    'ifchanged', 'endifchanged', 'filter', 'endfilter', 'regroup', 'resetcycle',
+)
+# Строка, на которой только такие теги и комментарии: после рендера от неё остаётся пустая строка
+TAG_LINE_RE = re.compile(
+    r'^((?:\{%%\s*(?:%s)\b(?:(?!%%\}).)*%%\}|\{#(?:(?!#\}).)*#\})+)\n' % '|'.join(SILENT_TAGS), re.M)
+
+
+def minify_template(source):
+    """Убирает отступы, пустые строки и переводы строк после строк из одних тегов шаблона."""
+    parts = PRESERVE_RE.split(source)
+    result = []
+    # split с двумя группами: текст, сохраняемый блок, имя тега, текст, ...
+    for index in range(0, len(parts), 3):
+        text = LINE_BREAK_RE.sub('\n', parts[index])
+        result.append(TAG_LINE_RE.sub(r'\1', text))
+        if index + 1 < len(parts):
+            result.append(parts[index + 1])
+    return ''.join(result).strip() + '\n'
+
+
+class MinifyingLoaderMixin:
+    def get_contents(self, origin):
+        contents = super().get_contents(origin)
+        if getattr(settings, 'TOURS_MINIFY_TEMPLATES', True) and origin.name.endswith('.html'):
+            return minify_template(contents)
+        return contents
+
+
+class TimedLoaderMixin(base.Loader):
+    """Создает TimedTemplate: так считаются и шаблоны из {% include %} и {% extends %}."""
+
+    def get_template(self, template_name, skip=None):
+        # то же, что Loader.get_template, но с другим классом шаблона
+        tried = []
+        for origin in self.get_template_sources(template_name):
+            if skip is not None and origin in skip:
+                tried.append((origin, 'Skipped to avoid recursion'))
+                continue
+            try:
+                contents = self.get_contents(origin)
+            except TemplateDoesNotExist:
+                tried.append((origin, 'Source does not exist'))
+                continue
+            return TimedTemplate(contents, origin, origin.template_name, self.engine)
+        raise TemplateDoesNotExist(template_name, tried=tried)
+
+
+class FilesystemLoader(TimedLoaderMixin, MinifyingLoaderMixin, filesystem.Loader):
+    pass
+
+
+class AppDirectoriesLoader(TimedLoaderMixin, MinifyingLoaderMixin, app_directories.Loader):
+    pass
+
+
+class CachedLoader(cached.Loader, TimedLoaderMixin):
+    """Кэширующий загрузчик с TimedTemplate.
+
+    cached.Loader создает шаблоны сам, через get_template базового класса;
+    по MRO им оказывается TimedLoaderMixin.
+    """
@@ -0,0 +1,105 @@
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, base, engines
+from django.template.backends import django as django_backend
+
+logger = logging.getLogger('tours')
+
+_stats = defaultdict(lambda: [0, 0.0, 0.0])
+_stats_lock = threading.Lock()
+
+# список (шаблон, время) для профилируемого запроса, см. tours.profiling
+render_log = contextvars.ContextVar('tours_template_render_log', default=None)
+
+
+def _record(name, elapsed):
+    with _stats_lock:
+        entry = _stats[name]
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] = max(entry[2], elapsed)
+
+
+def render_stats():
+    """Счётчики рендера по шаблонам: число, суммарное и максимальное время в мс."""
+    with _stats_lock:
+        return {
+            name: {'count': count, 'total_ms': round(total * 1000, 3), 'max_ms': round(worst * 1000, 3)}
+            for name, (count, total, worst) in sorted(_stats.items(), key=lambda item: -item[1][1])
+        }
+
+
+def reset_render_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+class TimedTemplate(base.Template):
+    """Шаблон, который считает время своего рендера.
+
+    Считается и рендер через {% include %} и {% extends %}: оба вызывают
+    _render подключенного шаблона. Время включает вложенные шаблоны.
+    """
+
+    def _render(self, context):
+        log = render_log.get()
+        if log is None and not getattr(settings, 'TOURS_TEMPLATE_TIMING', True):
+            return super()._render(context)
+        started = time.perf_counter()
+        try:
+            return super()._render(context)
+        finally:
+            elapsed = time.perf_counter() - started
+            _record(self.origin.template_name, elapsed)
+            if log is not None:
+                log.append((self.origin.template_name, elapsed))
+
+
+class DjangoTemplates(django_backend.DjangoTemplates):
+    """Бэкенд Django-шаблонов, который считает время рендера каждого шаблона.
+
+    Шаблоны из файлов создают загрузчики tours.template_loaders.
+    """
+
+    def from_string(self, template_code):
+        return django_backend.Template(TimedTemplate(template_code, engine=self.engine), self)
+
+
+def iter_template_names(engine):
+    for directory in engine.dirs:
+        for root, _, files in os.walk(directory):
+            for filename in sorted(files):
+                if filename.endswith('.html'):
+                    yield os.path.relpath(os.path.join(root, filename), directory).replace(os.sep, '/')
+
+
+def compile_templates():
+    """Компилирует все шаблоны из DIRS; с cached-загрузчиком они остаются в памяти.
+
+    Возвращает число шаблонов и список (имя, ошибка) для шаблонов с ошибками.
+    """
+    count = 0
+    errors = []
+    for backend in engines.all():
+        if not isinstance(backend, django_backend.DjangoTemplates):
+            continue
+        for name in iter_template_names(backend.engine):
+            try:
+                backend.engine.get_template(name)
+            except (TemplateSyntaxError, TemplateDoesNotExist) as exc:
+                errors.append((name, exc))
+            count += 1
+    return count, errors
+
+
+def warm_up_templates():
+    started = time.perf_counter()
+    count, errors = compile_templates()
+    logger.info(f'Скомпилировано шаблонов: {count} за {(time.perf_counter() - started) * 1000:.0f} мс')
+    return count, errors
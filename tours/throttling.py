@@ -0,0 +1,148 @@
+import functools
+import logging
+import math
+import time
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from django.http import HttpResponse
+
+logger = logging.getLogger('tours')
+
+KEY_PREFIX = 'tours.throttle'
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+# То же, что Bucket.consume, но атомарно и за один запрос к Redis
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local full_at = tonumber(redis.call('GET', KEYS[1]))
+if not full_at or full_at < now then full_at = now end
+local wait = full_at - tonumber(ARGV[3]) - now
+if wait > 0 then return tostring(wait) end
+full_at = full_at + tonumber(ARGV[2])
+redis.call('SET', KEYS[1], tostring(full_at), 'PX', math.ceil((full_at - now) * 1000) + 1000)
+return '0'
+"""
+
+
+def parse_rate(rate):
+    """'10/m' -> (10, 60): не больше 10 запросов в минуту; '100/5m' — за 5 минут."""
+    count, _, period = rate.partition('/')
+    try:
+        return int(count), int(period[:-1] or 1) * PERIODS[period[-1:]]
+    except (KeyError, ValueError):
+        raise ValueError(f'Неверный лимит {rate!r}, ожидается вида 10/m')
+
+
+def client_ip(request):
+    # за N доверенными прокси адрес клиента — N-й справа в X-Forwarded-For
+    proxies = getattr(settings, 'TOURS_THROTTLE_PROXY_COUNT', 0)
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR') if proxies else None
+    if forwarded:
+        chain = [part.strip() for part in forwarded.split(',')]
+        if len(chain) >= proxies:
+            return chain[-proxies]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+class Bucket:
+    """Маркерная корзина: count запросов за period секунд, не больше burst подряд.
+
+    Хранится одно число — время, когда корзина снова станет полной (GCRA).
+    В Redis проверка выполняется скриптом за один запрос; в других кэшах —
+    чтением и записью, и одновременные запросы могут изредка проскочить лимит.
+    """
+    __slots__ = ('interval', 'tolerance')
+
+    def __init__(self, rate, burst=None):
+        count, period = parse_rate(rate)
+        self.interval = period / count
+        self.tolerance = ((burst or count) - 1) * self.interval
+
+    def consume(self, cache, key, now):
+        """Берет маркер; возвращает 0 или через сколько секунд маркер появится."""
+        if isinstance(cache, RedisCache):
+            return self._consume_redis(cache, key, now)
+        full_at = cache.get(key)
+        if full_at is None or full_at < now:
+            full_at = now
+        wait = full_at - self.tolerance - now
+        if wait > 0:
+            return wait
+        full_at += self.interval
+        cache.set(key, full_at, math.ceil(full_at - now) + 1)
+        return 0
+
+    def _consume_redis(self, cache, key, now):
+        key = cache.make_and_validate_key(key)
+        client = cache._cache.get_client(key, write=True)
+        script = getattr(cache, '_tours_gcra_script', None)
+        if script is None:
+            script = cache._tours_gcra_script = client.register_script(GCRA_SCRIPT)
+        return float(script(keys=[key], args=[now, self.interval, self.tolerance], client=client))
+
+
+def _too_many_requests(wait):
+    retry_after = max(1, math.ceil(wait))
+    response = HttpResponse(f'Слишком много запросов, повторите через {retry_after} с',
+                            status=429, content_type='text/plain; charset=utf-8')
+    response['Retry-After'] = str(retry_after)
+    return response
+
+
+def throttle(rate, user_rate=None, burst=None):
+    """Ограничивает частоту запросов к представлению.
+
+    Анонимные посетители считаются по IP (rate), вошедшие — по пользователю
+    (user_rate, по умолчанию тот же rate). Корзины лежат в общем кэше
+    TOURS_THROTTLE_CACHE и отдельны для каждого имени URL; лимит для имени
+    можно переопределить в TOURS_THROTTLE_RATES. Сверх лимита — 429 с
+    Retry-After.
+    """
+    buckets = {'ip': Bucket(rate, burst), 'user': Bucket(user_rate or rate, burst)}
+    overrides = {}
+
+    def bucket_for(url_name, kind):
+        rates = getattr(settings, 'TOURS_THROTTLE_RATES', {})
+        if url_name not in rates:
+            return buckets[kind]
+        rate = rates[url_name]
+        if rate not in overrides:
+            overrides[rate] = Bucket(rate, burst)
+        return overrides[rate]
+
+    def check(request, user):
+        if not getattr(settings, 'TOURS_THROTTLE_ENABLED', True):
+            return None
+        url_name = request.resolver_match.url_name if request.resolver_match else ''
+        if user is not None and user.is_authenticated:
+            kind, ident = 'user', user.pk
+        else:
+            kind, ident = 'ip', client_ip(request)
+        cache = caches[getattr(settings, 'TOURS_THROTTLE_CACHE', 'default')]
+        wait = bucket_for(url_name, kind).consume(cache, f'{KEY_PREFIX}.{url_name}.{kind}.{ident}', time.time())
+        if wait:
+            logger.debug(f'Лимит запросов к {url_name} для {kind} {ident}, повтор через {wait:.1f} с')
+            return _too_many_requests(wait)
+        return None
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @functools.wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                # request.user загружается из сессии синхронно и в цикле событий падает
+                user = await request.auser() if hasattr(request, 'auser') else None
+                # одна операция с кэшем короче переключения в поток через sync_to_async
+                rejected = check(request, user)
+                return rejected if rejected is not None else await view(request, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            rejected = check(request, getattr(request, 'user', None))
+            return rejected if rejected is not None else view(request, *args, **kwargs)
+        return wrapper
+
+    return decorator
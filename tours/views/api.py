@@ -0,0 +1,132 @@
+import base64
+import json
+import logging
+
+from django.conf import settings
+from django.core.exceptions import FieldError, ValidationError
+from django.db.models import F, Q
+from django.http import JsonResponse, StreamingHttpResponse
+
+from ..encoding import dumps
+from ..filters import SORT_FIELDS, catalog_filters, filter_tours, invalid_filters
+from ..models import CatalogEntry
+
+logger = logging.getLogger('tours')
+
+API_FIELDS = {
+    'id': F('package_id'),
+    'name': 'name',
+    'price': 'price',
+    'duration_weeks': 'duration_weeks',
+    'start_date': 'start_date',
+    'end_date': 'end_date',
+    'is_hot_deal': 'is_hot_deal',
+    'additional_services': 'additional_services',
+    'created_at': 'created_at',
+    'hotel_id': 'hotel_id',
+    'hotel_name': 'hotel_name',
+    'stars': 'stars',
+    'country_id': 'country_id',
+    'country': F('country_name'),
+    'thumbnail_url': 'thumbnail_url',
+}
+DEFAULT_FIELDS = ('id', 'name', 'price', 'hotel_name', 'country', 'stars', 'start_date', 'end_date', 'is_hot_deal')
+STREAM_CHUNK_SIZE = 500
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def encode_cursor(value, pk):
+    raw = json.dumps([str(value) if value is not None else None, pk]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        value, pk = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        return value, int(pk)
+    except (ValueError, TypeError):
+        raise BadRequest('Некорректный курсор')
+
+
+def _parse_fields(raw):
+    if not raw:
+        return list(DEFAULT_FIELDS)
+    fields = [name.strip() for name in raw.split(',') if name.strip()]
+    unknown = [name for name in fields if name not in API_FIELDS]
+    if unknown:
+        raise BadRequest(f"Неизвестные поля: {', '.join(unknown)}")
+    return fields
+
+
+def _parse_limit(raw):
+    max_limit = getattr(settings, 'TOURS_API_MAX_LIMIT', 5000)
+    try:
+        limit = int(raw) if raw else 100
+    except ValueError:
+        raise BadRequest('limit должен быть числом')
+    return max(1, min(limit, max_limit))
+
+
+def _build_rows(params):
+    fields = _parse_fields(params.get('fields'))
+    limit = _parse_limit(params.get('limit'))
+    sort_by = params.get('sort_by') if params.get('sort_by') in SORT_FIELDS else 'package_id'
+    sort_field = sort_by.lstrip('-')
+
+    filters = catalog_filters(params)
+    invalid = invalid_filters(filters)
+    if invalid:
+        raise BadRequest(f"Некорректные значения фильтров: {', '.join(invalid)}")
+    tours = filter_tours(CatalogEntry.objects.all(), filters)
+    if params.get('cursor'):
+        value, pk = decode_cursor(params['cursor'])
+        op = 'lt' if sort_by.startswith('-') else 'gt'
+        if sort_field == 'package_id':
+            tours = tours.filter(package_id__gt=pk)
+        else:
+            tours = tours.filter(Q(**{f'{sort_field}__{op}': value}) | Q(**{sort_field: value, 'package_id__gt': pk}))
+
+    # id и поле сортировки нужны для курсора, даже если клиент их не запросил
+    cursor_key = 'id' if sort_field == 'package_id' else sort_field
+    extra = [name for name in dict.fromkeys(['id', cursor_key]) if name not in fields]
+    plain = [name for name in fields + extra if isinstance(API_FIELDS[name], str)]
+    expressions = {name: API_FIELDS[name] for name in fields + extra if not isinstance(API_FIELDS[name], str)}
+    rows = tours.order_by(sort_by, 'package_id').values(*plain, **expressions)[:limit + 1]
+    return rows, limit, cursor_key, extra
+
+
+def _stream(rows, limit, cursor_key, extra):
+    yield b'{"results":['
+    batch = []
+    sent = 0
+    last = None
+    next_cursor = None
+    for row in rows.iterator(chunk_size=STREAM_CHUNK_SIZE):
+        if sent + len(batch) == limit:
+            next_cursor = encode_cursor(last[cursor_key], last['id'])
+            break
+        last = row.copy() if extra else row
+        for name in extra:
+            del row[name]
+        batch.append(row)
+        if len(batch) == STREAM_CHUNK_SIZE:
+            yield (b',' if sent else b'') + dumps(batch)[1:-1]
+            sent += len(batch)
+            batch = []
+    if batch:
+        yield (b',' if sent else b'') + dumps(batch)[1:-1]
+        sent += len(batch)
+    yield b'],"count":' + dumps(sent) + b',"next_cursor":' + dumps(next_cursor) + b'}'
+
+
+def tours_api(request):
+    logger.info('Запрос к API каталога туров')
+    try:
+        rows, limit, cursor_key, extra = _build_rows(request.GET)
+    except (BadRequest, ValidationError, ValueError, FieldError) as e:
+        message = '; '.join(e.messages) if isinstance(e, ValidationError) else str(e)
+        return JsonResponse({'error': message}, status=400)
+    return StreamingHttpResponse(_stream(rows, limit, cursor_key, extra), content_type='application/json')
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+
+from django.http import HttpResponse
+from django.shortcuts import render
+
+from ..lazy import lazy_import
+from ..facets import build_facets, facet_queryset
+from ..filters import catalog_filters, filter_tours, sort_tours
+from ..models import CatalogEntry, Article, FAQ, PromoCode
+from ..refdata import aget_reference_data
+
+httpx = lazy_import('httpx')
+
+logger = logging.getLogger('tours')
+
+WEATHER_CITIES = ['Moscow', 'Istanbul', 'Bangkok']
+
+
+async def _render(request, template_name, context=None):
+    # Шаблоны (nav.html) обращаются к request.user, поэтому пользователя
+    # загружаем заранее, иначе ленивый объект пойдёт в БД из event loop.
+    request.user = await request.auser()
+    return render(request, template_name, context)
+
+
+async def currency_page(request):
+    url = 'https://open.er-api.com/v6/latest/RUB'
+    rates = {}
+    error = None
+    try:
+        async with httpx.AsyncClient(timeout=5) as client:
+            resp = await client.get(url)
+        if resp.status_code != 200:
+            error = f"Ошибка соединения: {resp.status_code}"
+        else:
+            data = resp.json()
+            if data.get('result') == 'success':
+                rates = data.get('rates', {})
+            else:
+                error = data.get('error-type', 'Ошибка ответа от API')
+    except Exception as e:
+        error = str(e)
+    return await _render(request, 'currency_external.html', {'rates': rates, 'error': error})
+
+
+async def _city_weather(client, city):
+    try:
+        resp = await client.get(f'https://wttr.in/{city}?format=j1')
+        current = resp.json()['current_condition'][0]
+        return {
+            'city': city,
+            'temp': current['temp_C'],
+            'desc': current['weatherDesc'][0]['value'],
+            'icon': None
+        }
+    except Exception as e:
+        return {
+            'city': city,
+            'temp': None,
+            'desc': f"Ошибка: {e}",
+            'icon': None,
+        }
+
+
+async def weather_page(request):
+    async with httpx.AsyncClient(timeout=5) as client:
+        weather_data = await asyncio.gather(*(_city_weather(client, city) for city in WEATHER_CITIES))
+    return await _render(request, 'weather_external.html', {'weather_data': weather_data, 'global_error': None})
+
+
+async def tours_catalog(request):
+    try:
+        logger.info('Запрос к каталогу туров')
+        filters = catalog_filters(request.GET)
+        tours = filter_tours(CatalogEntry.objects.all(), filters)
+        tours = sort_tours(tours, filters['sort_by'])
+
+        tours = [tour async for tour in tours.aiterator()]
+        logger.debug(f'Найдено {len(tours)} туров после фильтрации')
+        refdata = await aget_reference_data()
+        hotels = refdata.hotels
+        countries = refdata.countries
+        facet_rows = [row async for row in facet_queryset(filters).aiterator()]
+        facets = build_facets(facet_rows, filters, countries, request.GET)
+        promo_codes = [p async for p in PromoCode.objects.aiterator() if p.is_currently_active]
+
+        return await _render(request, 'tours_catalog.html', {
+            'tours': tours,
+            'hotels': hotels,
+            'countries': countries,
+            'facets': facets,
+            'promo_codes': promo_codes,
+            'filters': filters,
+        })
+    except Exception as e:
+        logger.error(f'Ошибка при загрузке каталога туров: {e}', exc_info=True)
+        return HttpResponse('Произошла ошибка при загрузке каталога', status=500)
+
+
+async def home(request):
+    last_article = await Article.objects.order_by('-publication_date').afirst()
+    return await _render(request, 'tours/home.html', {'last_article': last_article})
+
+
+async def news_list(request):
+    articles = [a async for a in Article.objects.order_by('-publication_date').aiterator()]
+    return await _render(request, 'tours/news_list.html', {'articles': articles})
+
+
+async def faq_list(request):
+    faqs = [f async for f in FAQ.objects.order_by('-added_at').aiterator()]
+    return await _render(request, 'tours/faq_list.html', {'faqs': faqs})
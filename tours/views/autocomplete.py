@@ -0,0 +1,13 @@
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.http import Http404, JsonResponse
+
+from ..autocomplete import SOURCES, search
+
+
+@login_required
+@user_passes_test(lambda u: u.is_staff)
+def autocomplete(request, source):
+    if source not in SOURCES:
+        raise Http404(f'Нет подсказок для {source}')
+    term = request.GET.get('q', '').strip()
+    return JsonResponse({'results': search(source, term) if term else []})
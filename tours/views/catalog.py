@@ -0,0 +1,82 @@
+import calendar
+import logging
+from datetime import MAXYEAR, MINYEAR, date, timedelta
+
+from django.db.models import Count
+from django.http import HttpResponse
+from django.shortcuts import render
+from django.utils import timezone
+
+from ..facets import catalog_facets
+from ..filters import catalog_filters, filter_tours, sort_tours
+from ..models import CatalogEntry, PromoCode
+from ..refdata import get_reference_data
+
+logger = logging.getLogger('tours')
+
+def tours_catalog(request):
+    try:
+        logger.info('Запрос к каталогу туров')
+        filters = catalog_filters(request.GET)
+        tours = filter_tours(CatalogEntry.objects.all(), filters)
+
+        logger.debug(f'Найдено {tours.count()} туров после фильтрации')
+        tours = sort_tours(tours, filters['sort_by'])
+
+        refdata = get_reference_data()
+        hotels = refdata.hotels
+        countries = refdata.countries
+        facets = catalog_facets(filters, countries, request.GET)
+        promo_codes = [p for p in PromoCode.objects.all() if p.is_currently_active]
+
+        return render(request, 'tours_catalog.html', {
+            'tours': tours,
+            'hotels': hotels,
+            'countries': countries,
+            'facets': facets,
+            'promo_codes': promo_codes,
+            'filters': filters,
+        })
+    except Exception as e:
+        logger.error(f'Ошибка при загрузке каталога туров: {e}', exc_info=True)
+        return HttpResponse('Произошла ошибка при загрузке каталога', status=500)
+
+
+def tour_availability(request):
+    today = timezone.now().date()
+    try:
+        year = int(request.GET.get('year') or today.year)
+        month = int(request.GET.get('month') or today.month)
+        # соседние месяцы в ссылках тоже должны быть представимы
+        if not MINYEAR < year < MAXYEAR:
+            raise ValueError(year)
+        first_day = date(year, month, 1)
+    except ValueError:
+        return HttpResponse('Некорректный месяц', status=400)
+    last_day = first_day.replace(day=calendar.monthrange(year, month)[1])
+
+    filters = catalog_filters(request.GET)
+    filters.update(date_from=None, date_to=None)
+    try:
+        tours = filter_tours(CatalogEntry.objects.filter(start_date__range=(first_day, last_day)), filters)
+        counts = dict(
+            tours.order_by().values('start_date').annotate(total=Count('pk')).values_list('start_date', 'total')
+        )
+    except Exception as e:
+        logger.error(f'Ошибка при расчете занятости туров: {e}', exc_info=True)
+        return HttpResponse('Произошла ошибка при загрузке календаря', status=500)
+
+    weeks = [
+        [{'date': day, 'count': counts.get(day, 0), 'in_month': day.month == month} for day in week]
+        for week in calendar.Calendar().monthdatescalendar(year, month)
+    ]
+    prev_month = first_day - timedelta(days=1)
+    next_month = last_day + timedelta(days=1)
+    return render(request, 'tours/availability.html', {
+        'weeks': weeks,
+        'month_start': first_day,
+        'total': sum(counts.values()),
+        'prev_month': prev_month,
+        'next_month': next_month,
+        'filters': filters,
+    })
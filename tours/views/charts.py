@@ -0,0 +1,11 @@
+from django.shortcuts import render
+
+from ..tasks import SALES_CHART_KEY, cached_result, render_sales_chart
+
+
+def sales_distribution_chart(request):
+    # график строит фоновый обработчик, страница показывает последний построенный
+    data = cached_result(SALES_CHART_KEY, render_sales_chart)
+    if data is None:
+        return render(request, 'sales_chart.html', {'chart_uri': None, 'loading': True})
+    return render(request, 'sales_chart.html', {'chart_uri': data['chart_uri']})
@@ -0,0 +1,497 @@
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.urls import reverse_lazy
+from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
+
+from ..forms import ClientProfileEditForm, OrderForm, TourPackageForm
+from ..models import Country, ClientProfile, EmployeeProfile, SeasonClimate, Hotel, TourPackage, Order, Article, FAQ, \
+    Vacancy, Review, PromoCode, AboutPageContent, CompanyVideo, CompanyLogo, CompanyHistoryItem, CompanyRequisite
+
+class StaffRequiredMixin(LoginRequiredMixin, UserPassesTestMixin):
+    # формы с подсказками показывают клиентов и сотрудников, как и сам /autocomplete/
+    def test_func(self):
+        return self.request.user.is_staff
+
+class CountryListView(ListView):
+    model = Country
+    template_name = 'tours/country_list.html'
+    context_object_name = 'countries'
+
+class CountryDetailView(DetailView):
+    model = Country
+    template_name = 'tours/country_detail.html'
+    context_object_name = 'country'
+
+class CountryCreateView(CreateView):
+    model = Country
+    fields = ['name', 'description']
+    template_name = 'tours/country_form.html'
+    success_url = reverse_lazy('country-list')
+
+class CountryUpdateView(UpdateView):
+    model = Country
+    fields = ['name', 'description']
+    template_name = 'tours/country_form.html'
+    success_url = reverse_lazy('country-list')
+
+class CountryDeleteView(DeleteView):
+    model = Country
+    template_name = 'tours/country_confirm_delete.html'
+    success_url = reverse_lazy('country-list')
+
+class ClientProfileListView(ListView):
+    model = ClientProfile
+    template_name = 'tours/client_list.html'
+    context_object_name = 'clients'
+
+class ClientProfileDetailView(DetailView):
+    model = ClientProfile
+    template_name = 'tours/client_detail.html'
+    context_object_name = 'client'
+
+class ClientProfileCreateView(StaffRequiredMixin, CreateView):
+    model = ClientProfile
+    form_class = ClientProfileEditForm
+    template_name = 'tours/client_form.html'
+    success_url = reverse_lazy('client-list')
+
+class ClientProfileUpdateView(StaffRequiredMixin, UpdateView):
+    model = ClientProfile
+    form_class = ClientProfileEditForm
+    template_name = 'tours/client_form.html'
+    success_url = reverse_lazy('client-list')
+
+class ClientProfileDeleteView(DeleteView):
+    model = ClientProfile
+    template_name = 'tours/client_confirm_delete.html'
+    success_url = reverse_lazy('client-list')
+
+class EmployeeProfileListView(ListView):
+    model = EmployeeProfile
+    template_name = 'tours/employee_list.html'
+    context_object_name = 'employees'
+
+class EmployeeProfileDetailView(DetailView):
+    model = EmployeeProfile
+    template_name = 'tours/employee_detail.html'
+    context_object_name = 'employee'
+
+class EmployeeProfileCreateView(CreateView):
+    model = EmployeeProfile
+    fields = ['user', 'patronymic', 'position', 'photo', 'work_description', 'birth_date']
+    template_name = 'tours/employee_form.html'
+    success_url = reverse_lazy('employee-list')
+
+class EmployeeProfileUpdateView(UpdateView):
+    model = EmployeeProfile
+    fields = ['user', 'patronymic', 'position', 'photo', 'work_description', 'birth_date']
+    template_name = 'tours/employee_form.html'
+    success_url = reverse_lazy('employee-list')
+
+class EmployeeProfileDeleteView(DeleteView):
+    model = EmployeeProfile
+    template_name = 'tours/employee_confirm_delete.html'
+    success_url = reverse_lazy('employee-list')
+
+class SeasonClimateListView(ListView):
+    model = SeasonClimate
+    template_name = 'tours/seasonclimate_list.html'
+    context_object_name = 'climates'
+
+class SeasonClimateDetailView(DetailView):
+    model = SeasonClimate
+    template_name = 'tours/seasonclimate_detail.html'
+    context_object_name = 'climate'
+
+class SeasonClimateCreateView(CreateView):
+    model = SeasonClimate
+    fields = ['country', 'season', 'climate_description']
+    template_name = 'tours/seasonclimate_form.html'
+    success_url = reverse_lazy('seasonclimate-list')
+
+class SeasonClimateUpdateView(UpdateView):
+    model = SeasonClimate
+    fields = ['country', 'season', 'climate_description']
+    template_name = 'tours/seasonclimate_form.html'
+    success_url = reverse_lazy('seasonclimate-list')
+
+class SeasonClimateDeleteView(DeleteView):
+    model = SeasonClimate
+    template_name = 'tours/seasonclimate_confirm_delete.html'
+    success_url = reverse_lazy('seasonclimate-list')
+
+class HotelListView(ListView):
+    model = Hotel
+    template_name = 'tours/hotel_list.html'
+    context_object_name = 'hotels'
+
+class HotelDetailView(DetailView):
+    model = Hotel
+    template_name = 'tours/hotel_detail.html'
+    context_object_name = 'hotel'
+
+class HotelCreateView(CreateView):
+    model = Hotel
+    fields = ['name', 'country', 'stars', 'description', 'price_per_night', 'photo']
+    template_name = 'tours/hotel_form.html'
+    success_url = reverse_lazy('hotel-list')
+
+class HotelUpdateView(UpdateView):
+    model = Hotel
+    fields = ['name', 'country', 'stars', 'description', 'price_per_night', 'photo']
+    template_name = 'tours/hotel_form.html'
+    success_url = reverse_lazy('hotel-list')
+
+class HotelDeleteView(DeleteView):
+    model = Hotel
+    template_name = 'tours/hotel_confirm_delete.html'
+    success_url = reverse_lazy('hotel-list')
+
+class TourPackageListView(ListView):
+    model = TourPackage
+    template_name = 'tours/tourpackage_list.html'
+    context_object_name = 'tourpackages'
+
+class TourPackageDetailView(DetailView):
+    queryset = TourPackage.objects.select_related('hotel__country')
+    template_name = 'tours/tourpackage_detail.html'
+    context_object_name = 'tourpackage'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        # соседи посчитаны заранее (manage.py build_similar_tours), здесь один запрос по индексу
+        context['similar_tours'] = TourPackage.objects.filter(neighbour_of__package=self.object) \
+            .select_related('hotel').order_by('neighbour_of__rank')
+        return context
+
+class TourPackageCreateView(StaffRequiredMixin, CreateView):
+    model = TourPackage
+    form_class = TourPackageForm
+    template_name = 'tours/tourpackage_form.html'
+    success_url = reverse_lazy('tourpackage-list')
+
+class TourPackageUpdateView(StaffRequiredMixin, UpdateView):
+    model = TourPackage
+    form_class = TourPackageForm
+    template_name = 'tours/tourpackage_form.html'
+    success_url = reverse_lazy('tourpackage-list')
+
+class TourPackageDeleteView(DeleteView):
+    model = TourPackage
+    template_name = 'tours/tourpackage_confirm_delete.html'
+    success_url = reverse_lazy('tourpackage-list')
+
+class OrderListView(ListView):
+    model = Order
+    template_name = 'tours/order_list.html'
+    context_object_name = 'orders'
+
+class OrderDetailView(DetailView):
+    model = Order
+    template_name = 'tours/order_detail.html'
+    context_object_name = 'order'
+
+class OrderCreateView(StaffRequiredMixin, CreateView):
+    model = Order
+    form_class = OrderForm
+    template_name = 'tours/order_form.html'
+    success_url = reverse_lazy('order-list')
+
+class OrderUpdateView(StaffRequiredMixin, UpdateView):
+    model = Order
+    form_class = OrderForm
+    template_name = 'tours/order_form.html'
+    success_url = reverse_lazy('order-list')
+
+class OrderDeleteView(DeleteView):
+    model = Order
+    template_name = 'tours/order_confirm_delete.html'
+    success_url = reverse_lazy('order-list')
+
+class ArticleListView(ListView):
+    model = Article
+    template_name = 'tours/article_list.html'
+    context_object_name = 'articles'
+
+class ArticleDetailView(DetailView):
+    model = Article
+    template_name = 'tours/article_detail.html'
+    context_object_name = 'article'
+
+class ArticleCreateView(CreateView):
+    model = Article
+    fields = ['title', 'content', 'author', 'created_at', 'updated_at']
+    template_name = 'tours/article_form.html'
+    success_url = reverse_lazy('article-list')
+
+class ArticleUpdateView(UpdateView):
+    model = Article
+    fields = ['title', 'content', 'author', 'created_at', 'updated_at']
+    template_name = 'tours/article_form.html'
+    success_url = reverse_lazy('article-list')
+
+class ArticleDeleteView(DeleteView):
+    model = Article
+    template_name = 'tours/article_confirm_delete.html'
+    success_url = reverse_lazy('article-list')
+
+class FAQListView(ListView):
+    model = FAQ
+    template_name = 'tours/faq_list.html'
+    context_object_name = 'faqs'
+
+class FAQDetailView(DetailView):
+    model = FAQ
+    template_name = 'tours/faq_detail.html'
+    context_object_name = 'faq'
+
+class FAQCreateView(CreateView):
+    model = FAQ
+    fields = ['question', 'answer']
+    template_name = 'tours/faq_form.html'
+    success_url = reverse_lazy('faq-crud-list')
+
+class FAQUpdateView(UpdateView):
+    model = FAQ
+    fields = ['question', 'answer']
+    template_name = 'tours/faq_form.html'
+    success_url = reverse_lazy('faq-crud-list')
+
+class FAQDeleteView(DeleteView):
+    model = FAQ
+    template_name = 'tours/faq_confirm_delete.html'
+    success_url = reverse_lazy('faq-crud-list')
+
+class VacancyListView(ListView):
+    model = Vacancy
+    template_name = 'tours/vacancy_list.html'
+    context_object_name = 'vacancies'
+
+class VacancyDetailView(DetailView):
+    model = Vacancy
+    template_name = 'tours/vacancy_detail.html'
+    context_object_name = 'vacancy'
+
+class VacancyCreateView(CreateView):
+    model = Vacancy
+    fields = ['title', 'description', 'requirements', 'salary', 'is_active']
+    template_name = 'tours/vacancy_form.html'
+    success_url = reverse_lazy('vacancy-crud-list')
+
+class VacancyUpdateView(UpdateView):
+    model = Vacancy
+    fields = ['title', 'description', 'requirements', 'salary', 'is_active']
+    template_name = 'tours/vacancy_form.html'
+    success_url = reverse_lazy('vacancy-crud-list')
+
+class VacancyDeleteView(DeleteView):
+    model = Vacancy
+    template_name = 'tours/vacancy_confirm_delete.html'
+    success_url = reverse_lazy('vacancy-crud-list')
+
+class ReviewListView(ListView):
+    model = Review
+    template_name = 'tours/review_list.html'
+    context_object_name = 'reviews'
+
+class ReviewDetailView(DetailView):
+    model = Review
+    template_name = 'tours/review_detail.html'
+    context_object_name = 'review'
+
+class ReviewCreateView(LoginRequiredMixin, CreateView):
+    model = Review
+    fields = ['rating', 'text']
+    template_name = 'tours/review_form.html'
+    success_url = reverse_lazy('review-crud-list')
+
+    def form_valid(self, form):
+        form.instance.client = self.request.user
+        return super().form_valid(form)
+
+class ReviewUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+    model = Review
+    fields = ['rating', 'text']
+    template_name = 'tours/review_form.html'
+    success_url = reverse_lazy('review-crud-list')
+
+    def test_func(self):
+        review = self.get_object()
+        return self.request.user == review.client
+
+class ReviewDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+    model = Review
+    template_name = 'tours/review_confirm_delete.html'
+    success_url = reverse_lazy('review-crud-list')
+
+    def test_func(self):
+        review = self.get_object()
+        return self.request.user == review.client
+
+
+class PromoCodeListView(ListView):
+    model = PromoCode
+    template_name = 'tours/promocode_list.html'
+    context_object_name = 'promocodes'
+
+class PromoCodeDetailView(DetailView):
+    model = PromoCode
+    template_name = 'tours/promocode_detail.html'
+    context_object_name = 'promocode'
+
+class PromoCodeCreateView(CreateView):
+    model = PromoCode
+    fields = ['code', 'discount_percent', 'valid_from', 'valid_to', 'is_active']
+    template_name = 'tours/promocode_form.html'
+    success_url = reverse_lazy('promocode-crud-list')
+
+class PromoCodeUpdateView(UpdateView):
+    model = PromoCode
+    fields = ['code', 'discount_percent', 'valid_from', 'valid_to', 'is_active']
+    template_name = 'tours/promocode_form.html'
+    success_url = reverse_lazy('promocode-crud-list')
+
+class PromoCodeDeleteView(DeleteView):
+    model = PromoCode
+    template_name = 'tours/promocode_confirm_delete.html'
+    success_url = reverse_lazy('promocode-crud-list')
+
+class AboutPageContentListView(ListView):
+    model = AboutPageContent
+    template_name = 'tours/aboutpagecontent_list.html'
+    context_object_name = 'about_contents'
+
+class AboutPageContentDetailView(DetailView):
+    model = AboutPageContent
+    template_name = 'tours/aboutpagecontent_detail.html'
+    context_object_name = 'about_content'
+
+class AboutPageContentCreateView(CreateView):
+    model = AboutPageContent
+    fields = ['title', 'body', 'image', 'order']
+    template_name = 'tours/aboutpagecontent_form.html'
+    success_url = reverse_lazy('aboutpagecontent-list')
+
+class AboutPageContentUpdateView(UpdateView):
+    model = AboutPageContent
+    fields = ['title', 'body', 'image', 'order']
+    template_name = 'tours/aboutpagecontent_form.html'
+    success_url = reverse_lazy('aboutpagecontent-list')
+
+class AboutPageContentDeleteView(DeleteView):
+    model = AboutPageContent
+    template_name = 'tours/aboutpagecontent_confirm_delete.html'
+    success_url = reverse_lazy('aboutpagecontent-list')
+
+class CompanyVideoListView(ListView):
+    model = CompanyVideo
+    template_name = 'tours/companyvideo_list.html'
+    context_object_name = 'companyvideos'
+
+class CompanyVideoDetailView(DetailView):
+    model = CompanyVideo
+    template_name = 'tours/companyvideo_detail.html'
+    context_object_name = 'companyvideo'
+
+class CompanyVideoCreateView(CreateView):
+    model = CompanyVideo
+    fields = ['title', 'video_url', 'order', 'is_active']
+    template_name = 'tours/companyvideo_form.html'
+    success_url = reverse_lazy('companyvideo-list')
+
+class CompanyVideoUpdateView(UpdateView):
+    model = CompanyVideo
+    fields = ['title', 'video_url', 'order', 'is_active']
+    template_name = 'tours/companyvideo_form.html'
+    success_url = reverse_lazy('companyvideo-list')
+
+class CompanyVideoDeleteView(DeleteView):
+    model = CompanyVideo
+    template_name = 'tours/companyvideo_confirm_delete.html'
+    success_url = reverse_lazy('companyvideo-list')
+
+class CompanyLogoListView(ListView):
+    model = CompanyLogo
+    template_name = 'tours/companylogo_list.html'
+    context_object_name = 'companylogos'
+
+class CompanyLogoDetailView(DetailView):
+    model = CompanyLogo
+    template_name = 'tours/companylogo_detail.html'
+    context_object_name = 'companylogo'
+
+class CompanyLogoCreateView(CreateView):
+    model = CompanyLogo
+    fields = ['image', 'alt_text', 'is_active', 'order']
+    template_name = 'tours/companylogo_form.html'
+    success_url = reverse_lazy('companylogo-list')
+
+class CompanyLogoUpdateView(UpdateView):
+    model = CompanyLogo
+    fields = ['image', 'alt_text', 'is_active', 'order']
+    template_name = 'tours/companylogo_form.html'
+    success_url = reverse_lazy('companylogo-list')
+
+class CompanyLogoDeleteView(DeleteView):
+    model = CompanyLogo
+    template_name = 'tours/companylogo_confirm_delete.html'
+    success_url = reverse_lazy('companylogo-list')
+
+class CompanyHistoryItemListView(ListView):
+    model = CompanyHistoryItem
+    template_name = 'tours/companyhistoryitem_list.html'
+    context_object_name = 'history_items'
+
+
+class CompanyHistoryItemDetailView(DetailView):
+    model = CompanyHistoryItem
+    template_name = 'tours/companyhistoryitem_detail.html'
+    context_object_name = 'object'
+
+
+class CompanyHistoryItemCreateView(CreateView):
+    model = CompanyHistoryItem
+    fields = ['year', 'event_description']
+    template_name = 'tours/companyhistoryitem_form.html'
+    success_url = reverse_lazy('companyhistoryitem-list')
+
+
+class CompanyHistoryItemUpdateView(UpdateView):
+    model = CompanyHistoryItem
+    fields = ['year', 'event_description']
+    template_name = 'tours/companyhistoryitem_form.html'
+
+
+    def get_success_url(self):
+        return reverse_lazy('companyhistoryitem-detail', kwargs={'pk': self.object.pk})
+
+class CompanyHistoryItemDeleteView(DeleteView):
+    model = CompanyHistoryItem
+    template_name = 'tours/companyhistoryitem_confirm_delete.html'
+    success_url = reverse_lazy('companyhistoryitem-list')
+
+class CompanyRequisiteListView(ListView):
+    model = CompanyRequisite
+    template_name = 'tours/companyrequisite_list.html'
+    context_object_name = 'companyrequisite_list'
+
+class CompanyRequisiteDetailView(DetailView):
+    model = CompanyRequisite
+    template_name = 'tours/companyrequisite_detail.html'
+    context_object_name = 'companyrequisite_detail'
+
+class CompanyRequisiteCreateView(CreateView):
+    model = CompanyRequisite
+    fields = ['name', 'value']
+    template_name = 'tours/companyrequisite_form.html'
+    success_url = reverse_lazy('companyrequisite-list')
+
+class CompanyRequisiteUpdateView(UpdateView):
+    model = CompanyRequisite
+    fields = ['name', 'value']
+    template_name = 'tours/companyrequisite_form.html'
+    success_url = reverse_lazy('companyrequisite-list')
+
+class CompanyRequisiteDeleteView(DeleteView):
+    model = CompanyRequisite
+    template_name = 'tours/companyrequisite_confirm_delete.html'
+    success_url = reverse_lazy('companyrequisite-list')
@@ -0,0 +1,151 @@
+import calendar
+from datetime import datetime
+from statistics import median, mode
+
+from django.contrib.auth.decorators import user_passes_test, login_required
+from django.db.models import Avg, Count, Sum
+from django.shortcuts import render, get_object_or_404
+from django.utils import timezone
+
+from ..lazy import lazy_import
+from ..models import ClientProfile, EmployeeProfile, TourPackage, TourPackageHistory, PromoCode
+from ..refdata import get_reference_data
+
+pytz = lazy_import('pytz')
+
+@login_required
+def user_dashboard(request):
+    user = request.user
+    now_utc = datetime.utcnow().replace(tzinfo=pytz.UTC)
+    user_timezone = getattr(user, 'timezone', 'Europe/Moscow')
+    local_now = now_utc.astimezone(pytz.timezone(user_timezone))
+
+    current_month_calendar = calendar.TextCalendar().formatmonth(local_now.year, local_now.month)
+
+    client_profile = getattr(user, 'clientprofile', None)
+    employee_profile = getattr(user, 'employeeprofile', None)
+
+    if client_profile:
+        recent_tours = TourPackage.objects.filter(client=client_profile).order_by('-created_at')[:5]
+    elif employee_profile:
+        recent_tours = TourPackage.objects.filter(client__user=user).order_by('-created_at')[:5]
+    else:
+        recent_tours = []
+
+    # статистика продаж считается по всей истории, включая архив
+    sales_data = TourPackageHistory.objects.aggregate(
+        avg_sale=Avg('price'),
+        total_sales=Sum('price')
+    )
+    all_sales_prices = list(TourPackageHistory.objects.values_list('price', flat=True))
+    sales_median = median(all_sales_prices) if all_sales_prices else None
+    sales_mode = mode(all_sales_prices) if all_sales_prices else None
+
+    current_year = timezone.now().year
+    client_ages = [
+        current_year - client.birth_date.year
+        for client in ClientProfile.objects.exclude(birth_date__isnull=True)
+    ]
+    age_median = median(client_ages) if client_ages else None
+    age_avg = sum(client_ages) / len(client_ages) if client_ages else None
+
+    popular_packages = (
+        TourPackageHistory.objects.values('name')
+        .annotate(count=Count('id'))
+        .order_by('-count')
+        .first()
+    )
+    profitable_packages = (
+        TourPackageHistory.objects.values('name')
+        .annotate(total_profit=Sum('price'))
+        .order_by('-total_profit')
+        .first()
+    )
+
+    context = {
+        'user': user,
+        'current_time_utc': now_utc.strftime('%d/%m/%Y %H:%M:%S'),
+        'current_time_local': local_now.strftime('%d/%m/%Y %H:%M:%S'),
+        'user_timezone': user_timezone,
+        'calendar': current_month_calendar,
+        'recent_tours': recent_tours,
+        'stats': {
+            'avg_sale': sales_data['avg_sale'],
+            'total_sales': sales_data['total_sales'],
+            'sales_median': sales_median,
+            'sales_mode': sales_mode,
+            'age_median': age_median,
+            'age_avg': age_avg,
+            'popular_package': popular_packages,
+            'profitable_package': profitable_packages,
+        },
+    }
+
+    if client_profile:
+        tours = client_profile.tour_packages.select_related('hotel')
+        promo_codes = PromoCode.objects.filter(is_active=True, valid_from__lte=now_utc, valid_until__gte=now_utc)
+        context.update({
+            'profile_type': 'client',
+            'profile': client_profile,
+            'tours': tours,
+            'promo_codes': promo_codes,
+        })
+    elif employee_profile:
+        clients = ClientProfile.objects.prefetch_related('tour_packages').filter(user=user)
+        sales = TourPackage.objects.filter(client__user=user).select_related('hotel')
+        context.update({
+            'profile_type': 'employee',
+            'profile': employee_profile,
+            'clients': clients,
+            'sales': sales,
+        })
+    else:
+        context['profile_type'] = 'unknown'
+
+    return render(request, 'user_dashboard.html', context)
+
+@login_required
+def client_dashboard(request):
+    client = get_object_or_404(ClientProfile, user=request.user)
+    tours = TourPackage.objects.filter(client=client)
+    now = timezone.now().date()
+    promo_codes = PromoCode.objects.filter(is_active=True, valid_from__lte=now, valid_until__gte=now)
+    return render(request, 'client_dashboard.html', {
+        'client': client,
+        'tours': tours,
+        'promo_codes': promo_codes,
+    })
+
+@login_required
+def employee_dashboard(request):
+    employee = get_object_or_404(EmployeeProfile, user=request.user)
+    clients = ClientProfile.objects.prefetch_related('tour_packages')
+    sales = TourPackage.objects.select_related('client', 'hotel')
+    return render(request, 'employee_dashboard.html', {
+        'employee': employee,
+        'clients': clients,
+        'sales': sales,
+    })
+
+@login_required
+@user_passes_test(lambda u: u.is_superuser)
+def admin_clients_with_tours(request):
+    from django.db.models import Sum, Count, Prefetch
+
+    clients = ClientProfile.objects.prefetch_related('tour_packages__hotel__country')
+    client_tour_stats = ClientProfile.objects.annotate(
+        tour_count=Count('tour_packages'),
+        total_cost=Sum('tour_packages__price')
+    )
+    hotels = get_reference_data().hotels
+
+    client_tour_stats = ClientProfile.objects.annotate(
+        tour_count=Count('tour_packages'),
+        total_cost=Sum('tour_packages__price')
+    )
+
+    return render(request, 'admin_clients_with_tours.html', {
+        'clients': clients,
+        'hotels': hotels,
+        'client_tour_stats': client_tour_stats,
+    })
@@ -0,0 +1,24 @@
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+
+from ..exports import FORMATS, ExportError, export_stream
+
+
+@login_required
+@user_passes_test(lambda u: u.is_staff)
+def sales_export(request):
+    fmt = request.GET.get('format', 'csv')
+    kind = request.GET.get('kind', 'orders')
+    try:
+        if fmt not in FORMATS:
+            raise ExportError(f'Неизвестный формат: {fmt}')
+        chunks = export_stream(fmt, kind=kind, date_from=request.GET.get('date_from'),
+                               date_to=request.GET.get('date_to'), after=request.GET.get('after'))
+    except ExportError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    content_type, extension = FORMATS[fmt]
+    response = StreamingHttpResponse(chunks, content_type=content_type)
+    filename = f'{kind}-{timezone.localdate():%Y%m%d}.{extension}'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
@@ -0,0 +1,17 @@
+from django.shortcuts import render
+
+from ..tasks import CURRENCY_KEY, WEATHER_KEY, cached_result, refresh_currency_rates, refresh_weather
+
+
+def currency_page(request):
+    # запрос к внешнему API выполняет фоновый обработчик (manage.py run_workers)
+    data = cached_result(CURRENCY_KEY, refresh_currency_rates)
+    if data is None:
+        return render(request, 'currency_external.html', {'rates': {}, 'error': None, 'loading': True})
+    return render(request, 'currency_external.html', {'rates': data['rates'], 'error': data['error']})
+
+def weather_page(request):
+    data = cached_result(WEATHER_KEY, refresh_weather)
+    if data is None:
+        return render(request, 'weather_external.html', {'weather_data': [], 'global_error': None, 'loading': True})
+    return render(request, 'weather_external.html', {'weather_data': data['weather_data'], 'global_error': None})
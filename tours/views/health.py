@@ -0,0 +1,12 @@
+from django.http import JsonResponse
+from django.views.decorators.cache import never_cache
+
+from ..warmup import is_ready, warmup_timings
+
+
+@never_cache
+def readiness(request):
+    """Проверка готовности для балансировщика: 200 только после прогрева процесса (tours.warmup)."""
+    if not is_ready():
+        return JsonResponse({'ready': False}, status=503)
+    return JsonResponse({'ready': True, 'warmup_ms': warmup_timings()})
@@ -0,0 +1,41 @@
+from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
+
+from ..forms import CompanyHistoryItemForm
+from ..models import CompanyHistoryItem
+
+def company_history_item_list(request):
+    history_items = CompanyHistoryItem.objects.all()
+    return render(request, 'tours/companyhistoryitem_list.html', {'object_list': history_items})
+
+def company_history_item_detail(request, pk):
+    history_item = get_object_or_404(CompanyHistoryItem, pk=pk)
+    return render(request, 'tours/companyhistoryitem_detail.html', {'object': history_item})
+
+def company_history_item_create(request):
+    if request.method == 'POST':
+        form = CompanyHistoryItemForm(request.POST)
+        if form.is_valid():
+            form.save()
+            return redirect(reverse('companyhistoryitem-list'))
+    else:
+        form = CompanyHistoryItemForm()
+    return render(request, 'tours/companyhistoryitem_form.html', {'form': form, 'object': None})
+
+def company_history_item_update(request, pk):
+    history_item = get_object_or_404(CompanyHistoryItem, pk=pk)
+    if request.method == 'POST':
+        form = CompanyHistoryItemForm(request.POST, instance=history_item)
+        if form.is_valid():
+            form.save()
+            return redirect(reverse('companyhistoryitem-detail', kwargs={'pk': history_item.pk}))
+    else:
+        form = CompanyHistoryItemForm(instance=history_item)
+    return render(request, 'tours/companyhistoryitem_form.html', {'form': form, 'object': history_item})
+
+def company_history_item_delete(request, pk):
+    history_item = get_object_or_404(CompanyHistoryItem, pk=pk)
+    if request.method == 'POST':
+        history_item.delete()
+        return redirect(reverse('companyhistoryitem-list'))
+    return render(request, 'tours/companyhistoryitem_confirm_delete.html', {'object': history_item})
@@ -0,0 +1,15 @@
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.core.cache import cache
+from django.http import JsonResponse
+
+from ..templating import render_stats
+
+
+@login_required
+@user_passes_test(lambda u: u.is_staff)
+def runtime_metrics(request):
+    """Счётчики текущего процесса: время рендера шаблонов и попадания в кэш."""
+    data = {'templates': render_stats()}
+    if hasattr(cache, 'stats'):
+        data['cache'] = cache.stats()
+    return JsonResponse(data, json_dumps_params={'ensure_ascii': False})
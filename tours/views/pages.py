@@ -0,0 +1,59 @@
+from django.shortcuts import render
+from django.utils import timezone
+
+from ..models import EmployeeProfile, Article, FAQ, Vacancy, Review, PromoCode, AboutPageContent, CompanyVideo, \
+    CompanyLogo, CompanyHistoryItem, CompanyRequisite
+
+def home(request):
+    last_article = Article.objects.order_by('-publication_date').first()
+    return render(request, 'tours/home.html', {'last_article': last_article})
+
+def about(request):
+    about_content = AboutPageContent.objects.first()
+    videos = CompanyVideo.objects.all()
+    logos = CompanyLogo.objects.all()
+    history = CompanyHistoryItem.objects.order_by('-year')
+    requisites = CompanyRequisite.objects.all()
+    return render(request, 'tours/about.html', {
+        'about_content': about_content,
+        'videos': videos,
+        'logos': logos,
+        'history': history,
+        'requisites': requisites,
+    })
+
+def news_list(request):
+    articles = Article.objects.order_by('-publication_date')
+    return render(request, 'tours/news_list.html', {'articles': articles})
+
+def faq_list(request):
+    faqs = FAQ.objects.order_by('-added_at')
+    return render(request, 'tours/faq_list.html', {'faqs': faqs})
+
+def contacts(request):
+    employees = EmployeeProfile.objects.select_related('user').all()
+    return render(request, 'tours/contacts.html', {'employees': employees})
+
+def privacy_policy(request):
+    return render(request, 'tours/privacy_policy.html')
+
+
+def vacancy_list(request):
+    vacancies = Vacancy.objects.order_by('-publication_date')
+    return render(request, 'tours/vacancy_list.html', {'vacancies': vacancies})
+
+def review_list(request):
+    reviews = Review.objects.select_related('client').order_by('-created_at')
+    return render(request, 'tours/review_list.html', {'reviews': reviews})
+
+
+def promocode_list(request):
+    today = timezone.now().date()
+    active_promocodes = PromoCode.objects.filter(is_active=True, valid_until__gte=today).order_by('-valid_until')
+    archived_promocodes = PromoCode.objects.filter(is_active=False) | PromoCode.objects.filter(valid_until__lt=today)
+    archived_promocodes = archived_promocodes.distinct().order_by('-valid_until') # distinct() на случай пересечения
+
+    return render(request, 'tours/promocode_list.html', {
+        'active_promocodes': active_promocodes,
+        'archived_promocodes': archived_promocodes,
+    })
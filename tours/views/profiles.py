@@ -0,0 +1,23 @@
+import os
+
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.http import FileResponse, Http404, JsonResponse
+
+from ..profiling import list_profiles, profile_path
+
+
+@login_required
+@user_passes_test(lambda u: u.is_staff)
+def profile_list(request):
+    """Сохраненные профили запросов (см. tours.profiling), новые первыми."""
+    return JsonResponse({'profiles': list_profiles()}, json_dumps_params={'ensure_ascii': False})
+
+
+@login_required
+@user_passes_test(lambda u: u.is_staff)
+def profile_download(request, profile_id, kind):
+    """Файл профиля: report — отчет о SQL и шаблонах, profile — pstats или speedscope."""
+    path = profile_path(profile_id, kind) if kind in ('report', 'profile') else None
+    if path is None:
+        raise Http404('Профиль не найден')
+    return FileResponse(open(path, 'rb'), as_attachment=True, filename=os.path.basename(path))
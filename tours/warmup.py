@@ -0,0 +1,135 @@
+import importlib
+import logging
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.urls import URLResolver, get_resolver
+
+from .refdata import get_reference_data
+from .templating import warm_up_templates
+
+logger = logging.getLogger('tours')
+
+_ready = threading.Event()
+_timings = {}
+
+
+def _compile_patterns(resolver):
+    # регулярные выражения шаблонов URL компилируются лениво, при первом resolve()
+    for pattern in resolver.url_patterns:
+        pattern.pattern.regex
+        if isinstance(pattern, URLResolver):
+            _compile_patterns(pattern)
+
+
+def warm_urls():
+    resolver = get_resolver()
+    resolver.reverse_dict
+    _compile_patterns(resolver)
+
+
+def warm_orm():
+    # кэши _meta и компиляция SQL без обращения к базе
+    for model in apps.get_models():
+        model._meta.get_fields()
+        str(model._default_manager.all().query)
+
+
+def warm_templates():
+    _, errors = warm_up_templates()
+    if errors:
+        raise ImproperlyConfigured('Ошибки в шаблонах: ' + '; '.join(f'{name}: {exc}' for name, exc in errors))
+
+
+def warm_modules():
+    for name in getattr(settings, 'TOURS_WARMUP_MODULES', []):
+        # модули из lazy_import загружаются при первом обращении к атрибуту
+        importlib.import_module(name).__dict__
+
+
+def warm_connections():
+    for connection in connections.all():
+        connection.ensure_connection()
+
+
+STEPS = (
+    ('urls', warm_urls),
+    ('orm', warm_orm),
+    ('templates', warm_templates),
+    ('modules', warm_modules),
+    ('connections', warm_connections),
+    ('refdata', get_reference_data),
+)
+
+
+def warm_up():
+    """Прогревает процесс до первого запроса и отмечает его готовым.
+
+    Шаблоны URL, метаданные моделей, шаблоны, лениво импортируемые модули,
+    соединения с базой и справочники. Возвращает время шагов в мс; ошибка
+    любого шага пробрасывается, и процесс остается неготовым.
+    """
+    timings = {}
+    for name, step in STEPS:
+        started = time.perf_counter()
+        step()
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+    _timings.clear()
+    _timings.update(timings)
+    _ready.set()
+    logger.info('Прогрев завершен: ' + ', '.join(f'{name} {ms:.0f} мс' for name, ms in timings.items()))
+    return timings
+
+
+def lifespan(application):
+    """ASGI-приложение, которое прогревает процесс по событию lifespan.startup.
+
+    uvicorn импортирует приложение уже внутри цикла событий, где синхронные
+    обращения к базе запрещены, поэтому прогрев идет в потоке sync_to_async —
+    том же, в котором потом выполняется синхронный код запросов. Ошибка
+    прогрева отменяет запуск сервера.
+    """
+    async def app(scope, receive, send):
+        if scope['type'] != 'lifespan':
+            return await application(scope, receive, send)
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    await sync_to_async(warm_up)()
+                except Exception as e:
+                    logger.exception('Прогрев не удался')
+                    await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                    return
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    return app
+
+
+def before_fork():
+    """Соединения прогревающего процесса не должны достаться дочерним процессам."""
+    connections.close_all()
+
+
+def after_fork():
+    warm_connections()
+
+
+def is_ready():
+    return _ready.is_set()
+
+
+def warmup_timings():
+    return dict(_timings)
+
+
+def reset():
+    _ready.clear()
+    _timings.clear()
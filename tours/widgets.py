@@ -0,0 +1,44 @@
+from django import forms
+from django.urls import reverse
+from django.utils.html import format_html
+
+from .autocomplete import labels
+
+
+class AutocompleteMixin:
+    """Выпадающий список, который загружает варианты с сервера по мере ввода.
+
+    В HTML попадают только выбранные значения, поэтому форма открывается
+    одинаково быстро при любом размере таблицы.
+    """
+
+    class Media:
+        js = ('tours/autocomplete.js',)
+
+    def __init__(self, source, attrs=None):
+        super().__init__(attrs)
+        self.source = source
+
+    def optgroups(self, name, value, attrs=None):
+        selected = [item for item in value if item not in ('', None)]
+        groups = []
+        if not self.allow_multiple_selected and not self.is_required:
+            groups.append((None, [self.create_option(name, '', '---------', not selected, 0)], 0))
+        for index, (pk, label) in enumerate(labels(self.source, selected) if selected else [], start=len(groups)):
+            groups.append((None, [self.create_option(name, pk, label, True, index)], index))
+        return groups
+
+    def render(self, name, value, attrs=None, renderer=None):
+        select = super().render(name, value, attrs, renderer)
+        return select + format_html(
+            '<input type="search" class="autocomplete-input" data-url="{}" data-for="{}" '
+            'placeholder="Начните вводить..." autocomplete="off">',
+            reverse('autocomplete', args=[self.source]), (attrs or {}).get('id', ''))
+
+
+class AutocompleteSelect(AutocompleteMixin, forms.Select):
+    pass
+
+
+class AutocompleteSelectMultiple(AutocompleteMixin, forms.SelectMultiple):
+    pass
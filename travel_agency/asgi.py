@@ -2,6 +2,8 @@
 ASGI config for travel_agency project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+The process is warmed up on the lifespan startup event, before the server
+accepts connections; ``/health/ready/`` answers 200 only after that.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -12,5 +14,10 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travel_agency.settings')
+os.environ.setdefault('TOURS_ASYNC_VIEWS', '1')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from tours.warmup import lifespan  # noqa: E402
+
+application = lifespan(django_application)
@@ -0,0 +1,32 @@
+"""
+Gunicorn configuration for production:
+
+    gunicorn -c travel_agency/gunicorn.conf.py
+
+The application is loaded and warmed up once in the master before forking.
+Database connections opened during the warm-up are closed before each fork
+and every worker opens its own before accepting requests.
+"""
+
+import multiprocessing
+import os
+
+# постоянные соединения, иначе прогретое соединение закроется после первого запроса
+os.environ.setdefault('TOURS_DB_CONN_MAX_AGE', '600')
+
+wsgi_app = 'travel_agency.wsgi_preload:application'
+preload_app = True
+bind = os.environ.get('TOURS_BIND', '127.0.0.1:8000')
+workers = int(os.environ.get('TOURS_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+
+
+def pre_fork(server, worker):
+    from tours.warmup import before_fork
+
+    before_fork()
+
+
+def post_fork(server, worker):
+    from tours.warmup import after_fork
+
+    after_fork()
@@ -42,10 +42,14 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'tours.prerender.PrerenderedPageMiddleware',
+    'tours.response_cache.AnonymousResponseCacheMiddleware',
+    'tours.compression.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'tours.profiling.ProfilerMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -54,30 +58,88 @@ ROOT_URLCONF = 'travel_agency.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'tours.templating.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates']
         ,
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Пробелы вырезаются при загрузке шаблона, а не в каждом ответе
+            'loaders': [
+                ('tours.template_loaders.CachedLoader', [
+                    'tours.template_loaders.FilesystemLoader',
+                    'tours.template_loaders.AppDirectoriesLoader',
+                ]),
+            ],
         },
     },
 ]
 
 WSGI_APPLICATION = 'travel_agency.wsgi.application'
 
+# Асинхронные версии публичных страниц; включаются в asgi.py
+TOURS_ASYNC_VIEWS = os.environ.get('TOURS_ASYNC_VIEWS') == '1'
+
+TOURS_API_MAX_LIMIT = 5000
+
+# Как часто процесс сверяет версию справочников (страны, отели, климат) с кэшем
+TOURS_REFDATA_CHECK_INTERVAL = 1.0
+
+# Кэш целых страниц для анонимных посетителей: имя URL -> модели, от которых зависит страница
+TOURS_RESPONSE_CACHE_TIMEOUT = 300
+# сжатые и несжатые варианты страницы хранятся отдельно
+TOURS_RESPONSE_CACHE_VARY = ('Accept-Encoding',)
+TOURS_RESPONSE_CACHE_PAGES = {
+    'tours_catalog': ['tours.CatalogEntry', 'tours.Country', 'tours.Hotel', 'tours.PromoCode'],
+    'tours-catalog': ['tours.CatalogEntry', 'tours.Country', 'tours.Hotel', 'tours.PromoCode'],
+    'home': ['tours.Article'],
+    'about': ['tours.AboutPageContent', 'tours.CompanyVideo', 'tours.CompanyLogo', 'tours.CompanyHistoryItem',
+              'tours.CompanyRequisite'],
+    'news-list': ['tours.Article'],
+    'faq-list': ['tours.FAQ'],
+    'vacancy-list': ['tours.Vacancy'],
+    'review-list': ['tours.Review', 'auth.User'],
+    'promocode-list': ['tours.PromoCode'],
+}
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Кэш: L1 в памяти процесса перед общим L2. L2 — Redis, если задан TOURS_CACHE_URL,
+# иначе файловый кэш, общий для всех процессов на машине.
+TOURS_CACHE_URL = os.environ.get('TOURS_CACHE_URL', '')
+CACHES = {
+    'default': {
+        'BACKEND': 'tours.cache_backend.TwoTierCache',
+        'OPTIONS': {
+            'L2': 'shared',
+            'L1_MAX_ENTRIES': 2000,
+            'L1_TIMEOUT': 5,
+            # сессии и версии тегов/справочников должны меняться сразу во всех процессах
+            'L1_BYPASS_PREFIXES': ('tours.sessions.', 'tours.rc.tag.', 'tours.refdata.version'),
+        },
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': TOURS_CACHE_URL,
+    } if TOURS_CACHE_URL else {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('TOURS_CACHE_DIR', BASE_DIR / 'var' / 'cache'),
+        'OPTIONS': {'MAX_ENTRIES': 20000},
+    },
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # для travel_agency/gunicorn.conf.py соединения держатся между запросами
+        'CONN_MAX_AGE': int(os.environ.get('TOURS_DB_CONN_MAX_AGE', '0')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -117,6 +179,7 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
 STATIC_URL = 'static/'
+STATIC_ROOT = BASE_DIR / 'staticfiles'
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -128,6 +191,13 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 LOGIN_REDIRECT_URL = '/'
 
+# Sessions
+SESSION_ENGINE = 'tours.sessions'
+# общий кэш без локального L1: выход и изменения сессии сразу видны всем процессам
+SESSION_CACHE_ALIAS = 'shared'
+TOURS_SESSION_TOUCH_INTERVAL = 60 * 60
+TOURS_SESSION_PRUNE_BATCH = 1000
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -156,4 +226,109 @@ LOGGING = {
             'propagate': True,
         },
     },
-}
\ No newline at end of file
+}
+
+# Сжатие ответов (br и zstd — если установлены пакеты brotli и zstandard)
+TOURS_MINIFY_TEMPLATES = True
+TOURS_COMPRESS_MIN_SIZE = 1024
+# Отдавать статику из STATIC_ROOT через Django, предпочитая файлы .br/.zst/.gz от compress_static
+TOURS_PRECOMPRESSED_STATIC = os.environ.get('TOURS_PRECOMPRESSED_STATIC') == '1'
+
+# Профиль шаблонов для продакшена: все шаблоны компилируются при старте процесса,
+# ошибка синтаксиса в любом из них не даёт процессу запуститься
+TOURS_TEMPLATE_WARMUP = os.environ.get('TOURS_TEMPLATE_WARMUP', '0' if DEBUG else '1') == '1'
+TOURS_TEMPLATE_TIMING = True
+
+# Архивация: отмененные заказы — через 30 дней, прочие — через год после отправления,
+# путевки — через 90 дней после окончания тура
+TOURS_ARCHIVE_CANCELLED_DAYS = 30
+TOURS_ARCHIVE_ORDERS_DAYS = 365
+TOURS_ARCHIVE_TOURS_DAYS = 90
+TOURS_ARCHIVE_BATCH = 500
+
+# Очередь фоновых задач в БД (manage.py run_workers)
+TOURS_JOBS_MAX_ATTEMPTS = 5
+TOURS_JOBS_RETRY_BASE = 5
+TOURS_JOBS_RETRY_MAX = 3600
+TOURS_JOBS_LOCK_TIMEOUT = 15 * 60
+TOURS_JOBS_KEEP_DAYS = 7
+TOURS_JOBS_RESULT_MAX_AGE = 600
+TOURS_JOBS_ENQUEUE_INTERVAL = 30
+
+# Динамическое ценообразование (manage.py reprice_tours): цена = проживание × наценка
+# с поправкой на звездность и спрос; горящими становятся путевки с невысоким спросом,
+# до начала которых осталось не больше TOURS_PRICING_HOT_DAYS дней
+TOURS_PRICING_MARKUP = 1.2
+TOURS_PRICING_STAR_STEP = 0.05
+TOURS_PRICING_DEMAND_WEIGHT = 0.1
+TOURS_PRICING_DEMAND_LIMITS = (0.9, 1.2)
+TOURS_PRICING_HOT_DAYS = 14
+TOURS_PRICING_HOT_DISCOUNT = 0.15
+TOURS_PRICING_BATCH_SIZE = 2000
+
+# Похожие путевки (manage.py build_similar_tours): k ближайших по цене, звездности,
+# длительности, стране и словам из доп. услуг; веса признаков задаются в TOURS_SIMILAR_WEIGHTS
+TOURS_SIMILAR_COUNT = 6
+TOURS_SIMILAR_VOCABULARY = 64
+TOURS_SIMILAR_WEIGHTS = {'price': 1.0, 'stars': 1.0, 'duration': 0.5, 'country': 1.0, 'services': 1.0}
+TOURS_SIMILAR_BLOCK_CELLS = 16_000_000
+
+# Импорт клиентов (manage.py import_clients). Пароли из файла хешируются быстрым
+# ImportPasswordHasher и перехешируются основным хешером при первом входе;
+# клиенты без пароля получают неиспользуемый пароль
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'tours.hashers.ImportPasswordHasher',
+]
+TOURS_IMPORT_CHUNK_SIZE = 1000
+TOURS_IMPORT_PASSWORD_HASHER = 'pbkdf2_sha256_import'
+
+# Подсказки для полей выбора в CRUD-формах (/autocomplete/<источник>/?q=...)
+TOURS_AUTOCOMPLETE_LIMIT = 10
+
+# Статические страницы, которые строятся заранее (manage.py prerender) и перестраиваются
+# фоновой задачей при изменении моделей: имя URL -> метки моделей
+TOURS_PRERENDER_DIR = BASE_DIR / 'var' / 'prerendered'
+TOURS_PRERENDER_PAGES = {
+    'about': ['tours.AboutPageContent', 'tours.CompanyVideo', 'tours.CompanyLogo', 'tours.CompanyHistoryItem',
+              'tours.CompanyRequisite'],
+    'privacy-policy': [],
+    'faq-list': ['tours.FAQ'],
+    'vacancy-list': ['tours.Vacancy'],
+    'news-list': ['tours.Article'],
+}
+
+# Ограничение частоты запросов к тяжелым страницам (лимиты — в tours/urls.py).
+# Корзины хранятся в Redis, общем для всех процессов; без TOURS_CACHE_URL — в памяти
+# процесса (файловый кэш слишком медленный для проверки на каждом запросе), и тогда
+# лимит действует на каждый процесс отдельно. TOURS_THROTTLE_RATES переопределяет
+# лимит по имени URL, например {'sales-chart': '2/m'}.
+# За обратным прокси задайте TOURS_THROTTLE_PROXY_COUNT
+CACHES['throttle'] = {
+    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    'LOCATION': 'tours-throttle',
+    'OPTIONS': {'MAX_ENTRIES': 100000},
+}
+TOURS_THROTTLE_ENABLED = True
+TOURS_THROTTLE_CACHE = 'shared' if TOURS_CACHE_URL else 'throttle'
+TOURS_THROTTLE_RATES = {}
+TOURS_THROTTLE_PROXY_COUNT = 0
+
+# Профилирование запросов сотрудников по ?_profile=1 (или cprofile / sample) либо заголовку
+# X-Tours-Profile. Профиль (pstats или speedscope) и отчет о SQL и шаблонах сохраняются
+# в TOURS_PROFILER_DIR, хранятся последние TOURS_PROFILER_KEEP; список — /internal/profiles/
+TOURS_PROFILER_ENABLED = True
+TOURS_PROFILER_MODE = 'cprofile'
+TOURS_PROFILER_DIR = BASE_DIR / 'var' / 'profiles'
+TOURS_PROFILER_KEEP = 50
+TOURS_PROFILER_INTERVAL = 0.001
+TOURS_PROFILER_STACK_DEPTH = 5
+
+# Прогрев процесса перед первым запросом (tours.warmup; travel_agency/wsgi_preload.py и
+# событие lifespan в travel_agency/asgi.py): кроме URL, шаблонов, справочников и соединений
+# с БД загружаются все модули из lazy_import. Готовность — /health/ready/
+TOURS_WARMUP_MODULES = ['pytz', 'httpx', 'requests']
@@ -0,0 +1,20 @@
+"""
+WSGI entry point for production: the application is fully warmed up at import.
+
+With ``preload_app`` (see gunicorn.conf.py) the import happens once in the
+master process, so workers are forked already warm and share the compiled
+URL patterns, templates and reference data. ``/health/ready/`` answers 200
+only after the warm-up has finished.
+"""
+
+import os
+
+from django.core.wsgi import get_wsgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travel_agency.settings')
+
+application = get_wsgi_application()
+
+from tours.warmup import warm_up  # noqa: E402
+
+warm_up()